@@ -18,103 +18,36 @@ Usage:
 
 import argparse
 import sys
-from typing import List
-
-from .commands.init import InitCommand
-from .commands.add import AddCommand
-from .commands.commit import CommitCommand
-from .commands.status import StatusCommand
-from .commands.log import LogCommand
-from .commands.branch import BranchCommand
-from .commands.checkout import CheckoutCommand
-from .commands.merge import MergeCommand
-from .commands.diff import DiffCommand
-from .commands.show import ShowCommand
-from .commands.reset import ResetCommand
-from .commands.tag import TagCommand
-from .commands.tree import TreeCommand
-from .commands.stash import StashCommand
-from .commands.clean import CleanCommand
-from .commands.blame import BlameCommand
-from .commands.reflog import ReflogCommand
-from .commands.mcp import McpCommand
-from .commands.search import SearchCommand
-from .commands.clone import CloneCommand
-from .commands.push import PushCommand
-from .commands.pull import PullCommand
-from .commands.remote import RemoteCommand
-from .commands.serve import ServeCommand
-from .commands.test import TestCommand
-from .commands.fsck import FsckCommand
-from .commands.graph import GraphCommand
-from .commands.daemon import DaemonCommand
-from .commands.garden import GardenCommand
-from .commands.recall import RecallCommand
-from .commands.when import WhenCommand
-from .commands.timeline import TimelineCommand
-from .commands.pack import PackCommand
-from .commands.distill import DistillCommand
-from .commands.decay import DecayCommand
-from .commands.resurrect import ResurrectCommand
-from .commands.verify import VerifyCommand
-from .commands.repair import RepairCommand
-from .commands.audit import AuditCommand
-from .commands.federated import FederatedCommand
-from .commands.resolve import ResolveCommand
-from .commands.prove import ProveCommand
-from .commands.gc import GcCommand
-
-
-# List of available commands
-COMMANDS = [
-    InitCommand,
-    AddCommand,
-    CommitCommand,
-    StatusCommand,
-    LogCommand,
-    BranchCommand,
-    CheckoutCommand,
-    MergeCommand,
-    DiffCommand,
-    ShowCommand,
-    ResetCommand,
-    TagCommand,
-    TreeCommand,
-    StashCommand,
-    CleanCommand,
-    BlameCommand,
-    ReflogCommand,
-    McpCommand,
-    SearchCommand,
-    CloneCommand,
-    PushCommand,
-    PullCommand,
-    RemoteCommand,
-    ServeCommand,
-    TestCommand,
-    FsckCommand,
-    GraphCommand,
-    DaemonCommand,
-    GardenCommand,
-    RecallCommand,
-    WhenCommand,
-    TimelineCommand,
-    PackCommand,
-    DistillCommand,
-    DecayCommand,
-    ResurrectCommand,
-    VerifyCommand,
-    RepairCommand,
-    AuditCommand,
-    FederatedCommand,
-    ResolveCommand,
-    ProveCommand,
-    GcCommand,
-]
-
-
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser."""
+from typing import List, Optional
+
+from .commands import COMMANDS, load_command
+
+
+def _find_command(argv: List[str]) -> Optional[str]:
+    """
+    Return the first registered command name in argv, skipping global options.
+
+    A -h/--help before the command prints the top-level help, which must list
+    every command, so it yields None.
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if arg in COMMANDS:
+            return arg
+        if not arg.startswith("-"):
+            return None
+    return None
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create the main argument parser.
+
+    When command is given, only that command's subparser is built (and only its
+    module imported). Otherwise every command is registered by name and help
+    for the top-level listing, without importing any command module.
+    """
     parser = argparse.ArgumentParser(
         prog="agmem",
         description="agmem - Agentic Memory Version Control System",
@@ -148,18 +81,23 @@ For more information: https://github.com/vivek-tiwari-vt/agmem
     # Create subparsers for commands
     subparsers = parser.add_subparsers(dest="command", help="Available commands", metavar="COMMAND")
 
+    if command in COMMANDS:
+        cmd_parser = subparsers.add_parser(command, help=COMMANDS[command][1])
+        load_command(command).add_arguments(cmd_parser)
+        return parser
+
     # Add each command
-    for cmd_class in COMMANDS:
-        cmd_parser = subparsers.add_parser(cmd_class.name, help=cmd_class.help)
-        cmd_class.add_arguments(cmd_parser)
+    for name, (_, cmd_help) in COMMANDS.items():
+        subparsers.add_parser(name, help=cmd_help)
 
     return parser
 
 
 def main(args: List[str] = None) -> int:
     """Main entry point."""
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
+    argv = sys.argv[1:] if args is None else args
+    parser = create_parser(_find_command(argv))
+    parsed_args = parser.parse_args(argv)
 
     # No command specified
     if not parsed_args.command:
@@ -167,25 +105,24 @@ def main(args: List[str] = None) -> int:
         return 0
 
     # Find and execute the command
-    for cmd_class in COMMANDS:
-        if cmd_class.name == parsed_args.command:
-            try:
-                return cmd_class.execute(parsed_args)
-            except KeyboardInterrupt:
-                print("\nOperation cancelled.")
-                return 130
-            except Exception as e:
-                if parsed_args.verbose:
-                    import traceback
-
-                    traceback.print_exc()
-                else:
-                    print(f"Error: {e}")
-                return 1
-
-    # Unknown command
-    print(f"Unknown command: {parsed_args.command}")
-    return 1
+    if parsed_args.command not in COMMANDS:
+        print(f"Unknown command: {parsed_args.command}")
+        return 1
+
+    cmd_class = load_command(parsed_args.command)
+    try:
+        return cmd_class.execute(parsed_args)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled.")
+        return 130
+    except Exception as e:
+        if parsed_args.verbose:
+            import traceback
+
+            traceback.print_exc()
+        else:
+            print(f"Error: {e}")
+        return 1
 
 
 if __name__ == "__main__":
@@ -1,23 +1,93 @@
-"""agmem CLI commands."""
-
-from .init import InitCommand
-from .add import AddCommand
-from .commit import CommitCommand
-from .status import StatusCommand
-from .log import LogCommand
-from .branch import BranchCommand
-from .checkout import CheckoutCommand
-from .merge import MergeCommand
-from .diff import DiffCommand
-
-__all__ = [
-    "InitCommand",
-    "AddCommand",
-    "CommitCommand",
-    "StatusCommand",
-    "LogCommand",
-    "BranchCommand",
-    "CheckoutCommand",
-    "MergeCommand",
-    "DiffCommand",
-]
+"""agmem CLI commands.
+
+Command classes are imported lazily: the CLI imports only the invoked
+command, and attribute access such as ``from memvcs.commands import
+AddCommand`` loads the submodule on demand (PEP 562).
+"""
+
+import importlib
+
+# Registry of available commands: name -> (class name, help).
+# Each command lives in memvcs/commands/<name>.py and is imported only when invoked.
+COMMANDS = {
+    "init": ("InitCommand", "Initialize a new memory repository"),
+    "add": ("AddCommand", "Add memory files to staging area"),
+    "commit": ("CommitCommand", "Save staged changes as a memory snapshot"),
+    "status": ("StatusCommand", "Show the working tree status"),
+    "log": ("LogCommand", "Show commit history"),
+    "branch": ("BranchCommand", "List, create, or delete branches"),
+    "checkout": ("CheckoutCommand", "Switch branches or restore working tree files"),
+    "merge": ("MergeCommand", "Join two or more development histories together"),
+    "diff": ("DiffCommand", "Show changes between commits, commit and working tree, etc."),
+    "show": ("ShowCommand", "Show various types of objects"),
+    "reset": ("ResetCommand", "Reset current HEAD to the specified state"),
+    "tag": ("TagCommand", "Create, list, delete or verify a tag"),
+    "tree": ("TreeCommand", "Show working directory or commit tree visually"),
+    "stash": ("StashCommand", "Stash changes for later (save work in progress)"),
+    "clean": ("CleanCommand", "Remove untracked files from working directory"),
+    "blame": (
+        "BlameCommand",
+        "Show who changed each line of a memory file, or trace semantic facts",
+    ),
+    "reflog": ("ReflogCommand", "Show reference log (history of HEAD changes)"),
+    "mcp": ("McpCommand", "Run MCP server for Cursor/Claude memory integration"),
+    "search": ("SearchCommand", "Search memory (semantic with agmem[vector], else plain text)"),
+    "clone": ("CloneCommand", "Clone a memory repository from a remote (file:// URL)"),
+    "push": ("PushCommand", "Push memory to remote repository"),
+    "pull": ("PullCommand", "Pull memory from remote repository"),
+    "remote": ("RemoteCommand", "Manage remote URLs (add, set-url, show)"),
+    "serve": ("ServeCommand", "Start web UI for browsing memory history"),
+    "test": ("TestCommand", "Run memory regression tests to validate knowledge consistency"),
+    "fsck": ("FsckCommand", "Check and repair repository consistency (remove dangling vectors)"),
+    "graph": ("GraphCommand", "Visualize the knowledge graph of memory files"),
+    "daemon": ("DaemonCommand", "Start/stop the auto-sync daemon for automatic commits"),
+    "garden": ("GardenCommand", "Synthesize episodic memories into semantic insights"),
+    "recall": (
+        "RecallCommand",
+        "Recall curated memories for the current task (context-aware retrieval)",
+    ),
+    "when": ("WhenCommand", "Find when a specific fact was learned"),
+    "timeline": ("TimelineCommand", "Show evolution of a specific memory file over time"),
+    "pack": ("PackCommand", "Pack recalled memories into token budget for LLM context"),
+    "distill": (
+        "DistillCommand",
+        "Convert episodic logs into semantic facts (memory consolidation)",
+    ),
+    "decay": ("DecayCommand", "Archive low-importance, old episodic memories (decay/forgetting)"),
+    "resurrect": ("ResurrectCommand", "Restore archived (decayed) memories from forgetting/"),
+    "verify": (
+        "VerifyCommand",
+        "Scan semantic memories for contradictions; optionally verify commit signatures",
+    ),
+    "repair": ("RepairCommand", "Auto-fix contradictions using confidence scores"),
+    "audit": ("AuditCommand", "Show and verify the tamper-evident audit log"),
+    "federated": (
+        "FederatedCommand",
+        "Push/pull federated summaries (coordinator must be configured)",
+    ),
+    "resolve": ("ResolveCommand", "Resolve merge conflicts (ours / theirs / both)"),
+    "prove": ("ProveCommand", "Prove a property of memory without revealing content (zk stub)"),
+    "gc": ("GcCommand", "Remove unreachable objects (garbage collection)"),
+}
+
+
+def load_command(name: str):
+    """Import and return the command class registered under name."""
+    class_name, _ = COMMANDS[name]
+    module = importlib.import_module(f".{name}", __name__)
+    return getattr(module, class_name)
+
+
+_MODULE_BY_CLASS = {class_name: name for name, (class_name, _) in COMMANDS.items()}
+
+__all__ = list(_MODULE_BY_CLASS)
+
+
+def __getattr__(attr: str):
+    if attr in _MODULE_BY_CLASS:
+        return load_command(_MODULE_BY_CLASS[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,10 +3,17 @@ agmem add - Add files to the staging area with file type validation.
 """
 
 import argparse
+import os
+import shutil
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import FrozenSet, List, Optional, Union
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
+from ..core.workers import io_workers
 
 
 # Default allowed file extensions for memory files
@@ -25,6 +32,36 @@ BINARY_SIGNATURES = [
     b"RIFF",  # WAV, AVI, etc.
 ]
 
+# Checked with a single bytes.startswith(tuple) call, which scans all prefixes in C
+BINARY_SIGNATURES_TUPLE = tuple(BINARY_SIGNATURES)
+
+# Number of bytes read from each file for binary detection; a wider window catches
+# NUL bytes past the magic-number prefix
+BINARY_HEADER_SIZE = 4096
+
+HEADER_READ_WORKERS = io_workers()
+
+
+def _walk_files(root: str):
+    """
+    Yield (path, name) for regular files under root using os.scandir.
+
+    Hidden entries are pruned at scan time, so hidden subtrees are never descended.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.path, entry.name
+        except OSError:
+            continue
+
 
 class AddCommand:
     """Add files to the staging area."""
@@ -54,43 +91,78 @@ class AddCommand:
         )
 
     @staticmethod
-    def _is_binary_file(filepath: Path) -> bool:
-        """Check if a file is binary by looking at magic bytes."""
+    def _read_header(filepath) -> Optional[bytes]:
+        """Read the leading bytes used for binary detection. Returns None if unreadable."""
         try:
             with open(filepath, "rb") as f:
-                header = f.read(16)
+                return f.read(BINARY_HEADER_SIZE)
+        except Exception:
+            return None
 
-            for signature in BINARY_SIGNATURES:
-                if header.startswith(signature):
-                    return True
+    @staticmethod
+    def _is_binary_header(header: Optional[bytes]) -> bool:
+        """Check if a file header matches a known binary signature or contains NUL bytes."""
+        if not header:
+            return False
+        if header.startswith(BINARY_SIGNATURES_TUPLE):
+            return True
+        # Also check for null bytes (common in binary files); translate scans in C
+        return len(header.translate(None, b"\x00")) != len(header)
 
-            # Also check for null bytes (common in binary files)
-            if b"\x00" in header:
-                return True
+    @staticmethod
+    def _is_binary_file(filepath: Path) -> bool:
+        """Check if a file is binary by looking at magic bytes."""
+        return AddCommand._is_binary_header(AddCommand._read_header(filepath))
 
-            return False
-        except Exception:
-            return False
+    @staticmethod
+    def _allowed_extensions(config: dict) -> FrozenSet[str]:
+        """Build the allowed-extension set from config once per invocation."""
+        allowed = config.get("allowed_extensions", DEFAULT_ALLOWED_EXTENSIONS)
+        return frozenset(ext.lower() for ext in allowed)
 
     @staticmethod
-    def _is_allowed_extension(filepath: Path, config: dict) -> bool:
-        """Check if file extension is in allowed list."""
-        allowed = config.get("allowed_extensions", list(DEFAULT_ALLOWED_EXTENSIONS))
-        allowed_set = set(allowed)
+    @lru_cache(maxsize=8)
+    def _recommended_extensions(allowed: FrozenSet[str]) -> str:
+        """Format the allowed extensions for rejection messages."""
+        return ", ".join(sorted(allowed))
 
-        ext = filepath.suffix.lower()
-        return ext in allowed_set or not ext  # Allow files without extension
+    @staticmethod
+    def _is_allowed_extension(filepath: Union[str, Path], allowed: FrozenSet[str]) -> bool:
+        """Check if file extension is in allowed list."""
+        ext = os.path.splitext(filepath)[1].lower()
+        return ext in allowed or not ext  # Allow files without extension
 
     @staticmethod
-    def _validate_file(filepath: Path, config: dict, force: bool, allow_binary: bool) -> tuple:
+    def _validate_file(
+        filepath: Union[str, Path],
+        allowed: FrozenSet[str],
+        force: bool,
+        allow_binary: bool,
+        header: Optional[bytes] = None,
+    ) -> tuple:
         """
         Validate a file for staging.
 
+        Args:
+            header: Pre-read file header; read from disk when None
+
         Returns:
             Tuple of (is_valid, warning_message)
         """
-        # Check for binary files
-        if AddCommand._is_binary_file(filepath):
+        # Check extension first: a pure string test that avoids opening rejected files
+        ext_allowed = AddCommand._is_allowed_extension(filepath, allowed)
+        if not ext_allowed and not force:
+            ext = os.path.splitext(filepath)[1] or "(no extension)"
+            return False, (
+                f"Rejected: {filepath} has extension '{ext}'.\n"
+                f"  Recommended: {AddCommand._recommended_extensions(allowed)}\n"
+                f"  Use --force to override."
+            )
+
+        # Check for binary files (still applies when --force overrides the extension)
+        if header is None:
+            header = AddCommand._read_header(filepath)
+        if AddCommand._is_binary_header(header):
             if allow_binary:
                 return True, f"Warning: {filepath} appears to be binary"
             else:
@@ -99,19 +171,9 @@ class AddCommand:
                     f"Rejected: {filepath} is a binary file. Use --allow-binary to override.",
                 )
 
-        # Check extension
-        if not AddCommand._is_allowed_extension(filepath, config):
-            ext = filepath.suffix or "(no extension)"
-            allowed = config.get("allowed_extensions", list(DEFAULT_ALLOWED_EXTENSIONS))
-
-            if force:
-                return True, f"Warning: {filepath} has extension '{ext}' which may not be optimal"
-            else:
-                return False, (
-                    f"Rejected: {filepath} has extension '{ext}'.\n"
-                    f"  Recommended: {', '.join(sorted(allowed))}\n"
-                    f"  Use --force to override."
-                )
+        if not ext_allowed:
+            ext = os.path.splitext(filepath)[1] or "(no extension)"
+            return True, f"Warning: {filepath} has extension '{ext}' which may not be optimal"
 
         return True, None
 
@@ -121,9 +183,22 @@ class AddCommand:
         if code != 0:
             return code
 
+        # Progress lines are buffered and written once; per-line prints are
+        # a write(2) each on line-buffered terminals
+        out: List[str] = []
+        try:
+            return AddCommand._add_paths(repo, args, out)
+        finally:
+            if out:
+                sys.stdout.write("\n".join(out) + "\n")
+
+    @staticmethod
+    def _add_paths(repo, args, out: List[str]) -> int:
+        """Validate and stage args.paths, appending progress lines to out."""
         staged_count = 0
         rejected_count = 0
-        config = repo.get_config()
+        allowed = AddCommand._allowed_extensions(repo.get_config())
+        file_batch = []
 
         for path_str in args.paths:
             path = Path(path_str)
@@ -131,7 +206,7 @@ class AddCommand:
             # Handle '.' to stage all
             if path_str == ".":
                 staged, rejected = AddCommand._stage_directory_with_validation(
-                    repo, None, config, args.force, args.allow_binary
+                    repo, None, allowed, args.force, args.allow_binary, out
                 )
                 staged_count += staged
                 rejected_count += rejected
@@ -142,7 +217,7 @@ class AddCommand:
                 try:
                     rel_path = path.relative_to(repo.current_dir)
                 except ValueError:
-                    print(f"Error: Path {path} is outside repository")
+                    out.append(f"Error: Path {path} is outside repository")
                     continue
             else:
                 # Check if it's in current/ or needs to be resolved
@@ -152,52 +227,49 @@ class AddCommand:
                     # Path exists outside current/, copy it in
                     target = repo.current_dir / path.name
                     if path.is_file():
-                        target.write_bytes(path.read_bytes())
+                        shutil.copyfile(path, target)
                     rel_path = Path(path.name)
                 else:
-                    print(f"Error: Path not found: {path}")
+                    out.append(f"Error: Path not found: {path}")
                     continue
 
             full_path = repo.current_dir / rel_path
 
             if not full_path.exists():
-                print(f"Error: Path not found: {path}")
+                out.append(f"Error: Path not found: {path}")
                 continue
 
             if full_path.is_file():
                 # Validate file
                 is_valid, message = AddCommand._validate_file(
-                    full_path, config, args.force, args.allow_binary
+                    full_path, allowed, args.force, args.allow_binary
                 )
 
                 if not is_valid:
-                    print(message)
+                    out.append(message)
                     rejected_count += 1
                     continue
 
                 if message:  # Warning
-                    print(message)
+                    out.append(message)
 
-                try:
-                    blob_hash = repo.stage_file(str(rel_path))
-                    print(f"  staged: {rel_path}")
-                    staged_count += 1
-                except Exception as e:
-                    print(f"Error staging {rel_path}: {e}")
+                file_batch.append(str(rel_path))
 
             elif full_path.is_dir():
                 staged, rejected = AddCommand._stage_directory_with_validation(
-                    repo, str(rel_path), config, args.force, args.allow_binary
+                    repo, str(rel_path), allowed, args.force, args.allow_binary, out
                 )
                 staged_count += staged
                 rejected_count += rejected
 
+        staged_count += AddCommand._stage_batch(repo, file_batch, out)
+
         if staged_count > 0 or rejected_count > 0:
-            print(f"\nStaged {staged_count} file(s)")
+            out.append(f"\nStaged {staged_count} file(s)")
             if rejected_count > 0:
-                print(f"Rejected {rejected_count} file(s) - use --force to override")
+                out.append(f"Rejected {rejected_count} file(s) - use --force to override")
             if staged_count > 0:
-                print("Run 'agmem commit -m \"message\"' to save snapshot")
+                out.append("Run 'agmem commit -m \"message\"' to save snapshot")
                 try:
                     from ..core.audit import append_audit
 
@@ -205,13 +277,18 @@ class AddCommand:
                 except Exception:
                     pass
         else:
-            print("No files staged")
+            out.append("No files staged")
 
         return 0
 
     @staticmethod
     def _stage_directory_with_validation(
-        repo, subdir: str, config: dict, force: bool, allow_binary: bool
+        repo,
+        subdir: str,
+        allowed: FrozenSet[str],
+        force: bool,
+        allow_binary: bool,
+        out: List[str],
     ) -> tuple:
         """
         Stage a directory with file validation.
@@ -219,8 +296,8 @@ class AddCommand:
         Returns:
             Tuple of (staged_count, rejected_count)
         """
-        staged_count = 0
         rejected_count = 0
+        batch = []
 
         if subdir:
             dir_path = repo.current_dir / subdir
@@ -230,36 +307,70 @@ class AddCommand:
         if not dir_path.exists():
             return 0, 0
 
-        for file_path in dir_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Skip hidden files and .mem directory
-            rel_to_current = file_path.relative_to(repo.current_dir)
-            if any(part.startswith(".") for part in rel_to_current.parts):
-                continue
+        # Skip hidden directories and .mem; hidden entries below are pruned by the walk
+        if any(part.startswith(".") for part in dir_path.relative_to(repo.current_dir).parts):
+            return 0, 0
 
+        # The walk stays under current/, so relative paths are plain string slices
+        prefix_len = len(os.fspath(repo.current_dir)) + 1
+        candidates = [
+            (path_str, path_str[prefix_len:]) for path_str, _ in _walk_files(os.fspath(dir_path))
+        ]
+
+        def sniff(file_path: str) -> Optional[bytes]:
+            # Files rejected on extension alone are never opened
+            if force or AddCommand._is_allowed_extension(file_path, allowed):
+                return AddCommand._read_header(file_path)
+            return None
+
+        def with_headers():
+            # Overlap the header reads (open/read release the GIL), keeping only a
+            # window in flight so each header is dropped once it has been validated
+            window = HEADER_READ_WORKERS * 2
+            with ThreadPoolExecutor(max_workers=HEADER_READ_WORKERS) as pool:
+                pending = deque()
+                for file_path, rel_to_current in candidates:
+                    pending.append((file_path, rel_to_current, pool.submit(sniff, file_path)))
+                    if len(pending) >= window:
+                        done_path, done_rel, future = pending.popleft()
+                        yield done_path, done_rel, future.result()
+                while pending:
+                    done_path, done_rel, future = pending.popleft()
+                    yield done_path, done_rel, future.result()
+
+        for file_path, rel_to_current, header in with_headers():
             # Validate file
-            is_valid, message = AddCommand._validate_file(file_path, config, force, allow_binary)
+            is_valid, message = AddCommand._validate_file(
+                file_path, allowed, force, allow_binary, header
+            )
 
             if not is_valid:
                 if not force:
                     # Only print first few rejections to avoid spam
                     if rejected_count < 5:
-                        print(f"  {message}")
+                        out.append(f"  {message}")
                     elif rejected_count == 5:
-                        print("  ... (more files rejected)")
+                        out.append("  ... (more files rejected)")
                 rejected_count += 1
                 continue
 
             if message:  # Warning
-                print(message)
+                out.append(message)
+
+            batch.append(rel_to_current)
 
-            try:
-                repo.stage_file(str(rel_to_current))
-                print(f"  staged: {rel_to_current}")
-                staged_count += 1
-            except Exception as e:
-                print(f"Error staging {rel_to_current}: {e}")
+        return AddCommand._stage_batch(repo, batch, out), rejected_count
 
-        return staged_count, rejected_count
+    @staticmethod
+    def _stage_batch(repo, paths: List[str], out: List[str]) -> int:
+        """Stage validated paths with one index write. Returns the number staged."""
+        if not paths:
+            return 0
+        errors = {}
+        staged = repo.stage_files(paths, errors=errors)
+        for path in paths:
+            if path in staged:
+                out.append(f"  staged: {path}")
+            else:
+                out.append(f"Error staging {path}: {errors[path]}")
+        return len(staged)
@@ -3,10 +3,10 @@ agmem blame - Show who changed each line (Git-like) or trace semantic facts.
 """
 
 import argparse
+import sys
 from pathlib import Path
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
 from ..core.objects import Commit, Tree, Blob
 
 
@@ -67,12 +67,7 @@ class BlameCommand:
             return 1
 
         # Find file in tree (support path like semantic/user-prefs.md)
-        blob_hash = None
-        for entry in tree.entries:
-            path = entry.path + "/" + entry.name if entry.path else entry.name
-            if path == filepath:
-                blob_hash = entry.hash
-                break
+        blob_hash = tree.index().get(filepath)
 
         if not blob_hash:
             print(f"Error: File not found in {ref}: {filepath}")
@@ -83,13 +78,18 @@ class BlameCommand:
             print("Error: Could not load file content.")
             return 1
 
-        lines = blob.content.decode("utf-8", errors="replace").splitlines()
+        # Split on bytes and decode line by line; avoids a full decoded copy of the file
+        lines = blob.content.splitlines()
         commit = Commit.load(repo.object_store, commit_hash)
         author_short = commit.author.split("<")[0].strip()[:20] if commit else "unknown"
         hash_short = commit_hash[:8]
 
+        out = []
+        append = out.append
+        prefix = f"{hash_short} ({author_short:20} "
         for i, line in enumerate(lines, 1):
-            print(f"{hash_short} ({author_short:20} {i:4}) {line}")
+            append(f"{prefix}{i:4}) {line.decode('utf-8', errors='replace')}\n")
+        sys.stdout.write("".join(out))
 
         return 0
 
@@ -120,8 +120,15 @@ class BlameCommand:
             print("Try rebuilding the index with 'agmem search --rebuild'")
             return 0
 
-        print(f'Semantic blame for: "{query}"')
-        print("=" * 60)
+        # Load each distinct commit once, and only those present in the store;
+        # many chunks usually share a commit
+        present = repo.object_store.exists_many(
+            (r["commit_hash"] for r in results if r["commit_hash"]), "commit"
+        )
+        commits = {h: Commit.load(repo.object_store, h) for h in present}
+
+        out = [f'Semantic blame for: "{query}"\n', "=" * 60 + "\n"]
+        append = out.append
 
         for i, result in enumerate(results, 1):
             path = result["path"]
@@ -131,32 +138,34 @@ class BlameCommand:
             author = result["author"]
             indexed_at = result["indexed_at"]
 
-            print(f"\n[{i}] {path}")
-            print(f"    Similarity: {similarity:.2%}")
+            append(f"\n[{i}] {path}\n")
+            append(f"    Similarity: {similarity:.2%}\n")
 
             if commit_hash:
                 # Try to get commit details
-                commit = Commit.load(repo.object_store, commit_hash)
+                commit = commits.get(commit_hash)
                 if commit:
-                    print(f"    Commit: {commit_hash[:8]}")
-                    print(f"    Author: {commit.author}")
-                    print(f"    Date: {commit.timestamp}")
-                    print(f"    Message: {commit.message}")
+                    append(f"    Commit: {commit_hash[:8]}\n")
+                    append(f"    Author: {commit.author}\n")
+                    append(f"    Date: {commit.timestamp}\n")
+                    append(f"    Message: {commit.message}\n")
                 else:
-                    print(f"    Commit: {commit_hash[:8]} (details unavailable)")
+                    append(f"    Commit: {commit_hash[:8]} (details unavailable)\n")
                     if author:
-                        print(f"    Author: {author}")
+                        append(f"    Author: {author}\n")
             else:
-                print("    Commit: (not tracked)")
+                append("    Commit: (not tracked)\n")
                 if indexed_at:
-                    print(f"    Indexed: {indexed_at}")
+                    append(f"    Indexed: {indexed_at}\n")
 
             # Show content preview
-            print(f"\n    Content preview:")
-            for line in content.split("\n")[:5]:
-                print(f"      {line[:70]}")
-            if len(content.split("\n")) > 5:
-                print("      ...")
-
-        print()
+            append("\n    Content preview:\n")
+            content_lines = content.split("\n")
+            for line in content_lines[:5]:
+                append(f"      {line[:70]}\n")
+            if len(content_lines) > 5:
+                append("      ...\n")
+
+        append("\n")
+        sys.stdout.write("".join(out))
         return 0
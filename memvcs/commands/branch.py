@@ -3,9 +3,9 @@ agmem branch - List, create, or delete branches.
 """
 
 import argparse
+import sys
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
 
 
 class BranchCommand:
@@ -84,7 +84,6 @@ class BranchCommand:
         if not branches:
             print("No branches yet.")
             return 0
-        for branch in branches:
-            prefix = "* " if branch == current else "  "
-            print(f"{prefix}{branch}")
+        lines = [f"* {b}" if b == current else f"  {b}" for b in branches]
+        sys.stdout.write("\n".join(lines) + "\n")
         return 0
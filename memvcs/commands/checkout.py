@@ -5,7 +5,6 @@ agmem checkout - Switch branches or restore files.
 import argparse
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
 
 
 class CheckoutCommand:
@@ -61,17 +60,16 @@ class CheckoutCommand:
         # Regular checkout
         ref = args.ref
 
-        # Check if it's a branch
-        is_branch = repo.refs.branch_exists(ref)
+        # Resolve once; the kind decides both HEAD handling and the message
+        kind, resolved = repo.classify_ref(ref)
 
         try:
-            commit_hash = repo.checkout(ref, force=args.force)
+            commit_hash = repo.checkout(ref, force=args.force, resolved=(kind, resolved))
 
-            if is_branch:
+            if kind == "branch":
                 print(f"Switched to branch '{ref}'")
             else:
-                # Check if it's a tag
-                if repo.refs.tag_exists(ref):
+                if kind == "tag":
                     print(f"Note: checking out '{ref}'.")
                     print()
                     print(
@@ -4,10 +4,31 @@ agmem clean - Remove untracked files (Git-like).
 
 import argparse
 import os
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
+from ..core.workers import io_workers
+
+
+REMOVE_WORKERS = io_workers()
+
+
+def _remove(job) -> Optional[OSError]:
+    """Remove one (path, is_dir) entry; returns the error if it was not removed."""
+    path, is_dir = job
+    try:
+        if is_dir:
+            shutil.rmtree(path)
+        else:
+            os.unlink(path)
+    except OSError as e:
+        return e
+    return None
 
 
 class CleanCommand:
@@ -35,7 +56,7 @@ class CleanCommand:
         if code != 0:
             return code
 
-        status = repo.get_status()
+        status = repo.get_status(include_modified=False)
         untracked = status.get("untracked", [])
 
         if not untracked:
@@ -43,29 +64,46 @@ class CleanCommand:
             return 0
 
         if args.dry_run:
-            print("Would remove:")
-            for p in untracked:
-                print(f"  {p}")
+            out = ["Would remove:"] + [f"  {p}" for p in untracked]
+            sys.stdout.write("\n".join(out) + "\n")
             return 0
 
         if not args.force:
             print("Use -f to force removal of untracked files.")
             return 1
 
-        removed = 0
+        # One lstat per path decides what to remove; missing paths are skipped
+        jobs = []
+        base = os.fspath(repo.current_dir)
         for rel_path in untracked:
-            full_path = repo.current_dir / rel_path
-            if full_path.exists():
-                if full_path.is_file():
-                    full_path.unlink()
-                    removed += 1
-                    print(f"Removed {rel_path}")
-                elif args.d and full_path.is_dir():
-                    import shutil
-
-                    shutil.rmtree(full_path)
-                    removed += 1
-                    print(f"Removed {rel_path}/")
-
-        print(f"Removed {removed} file(s)")
-        return 0
+            full_path = os.path.join(base, rel_path)
+            try:
+                st = os.lstat(full_path)
+            except FileNotFoundError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                if args.d:
+                    jobs.append((rel_path, full_path, True))
+            else:
+                jobs.append((rel_path, full_path, False))
+
+        with ThreadPoolExecutor(max_workers=REMOVE_WORKERS) as pool:
+            errors = list(pool.map(_remove, [(path, is_dir) for _, path, is_dir in jobs]))
+
+        # Report in the original order once all removals finished, in one write.
+        # Paths that vanished meanwhile are skipped; other failures are listed
+        out = []
+        removed = failed = 0
+        for (rel_path, _, is_dir), error in zip(jobs, errors):
+            shown = f"{rel_path}/" if is_dir else rel_path
+            if error is None:
+                removed += 1
+                out.append(f"Removed {shown}")
+            elif not isinstance(error, FileNotFoundError):
+                failed += 1
+                out.append(f"Failed to remove {shown}: {error.strerror or error}")
+        out.append(f"Removed {removed} file(s)")
+        if failed:
+            out.append(f"Failed to remove {failed} file(s)")
+        sys.stdout.write("\n".join(out) + "\n")
+        return 1 if failed else 0
@@ -3,10 +3,55 @@ agmem clone - Clone a remote memory repository.
 """
 
 import argparse
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+from memvcs.core import fast_json
 from memvcs.core.constants import MEMORY_TYPES
+from memvcs.core.workers import io_workers
+
+CLONE_WORKERS = io_workers()
+
+
+def _clone_file(src: str, dst: str, link: bool) -> None:
+    """Copy one file; hardlink instead when link is set and the filesystem allows it."""
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # cross-device or unsupported; fall back to a copy
+    shutil.copy2(src, dst)
+
+
+def _clone_tree(src: Path, dst: Path, link_dir: Optional[str] = "objects") -> None:
+    """
+    Copy src to dst with one scandir walk and parallel file copies.
+
+    Files under src/link_dir are hardlinked: objects are content-addressed and
+    never rewritten in place, so the clone can share them with its source.
+    """
+    src_root = os.fspath(src)
+    jobs = []
+    stack = [(src_root, os.fspath(dst), False)]
+    while stack:
+        src_dir, dst_dir, link = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    link_sub = link or (src_dir == src_root and entry.name == link_dir)
+                    stack.append((entry.path, target, link_sub))
+                else:
+                    jobs.append((entry.path, target, link))
+
+    with ThreadPoolExecutor(max_workers=CLONE_WORKERS) as pool:
+        # list() re-raises the first copy error
+        list(pool.map(lambda job: _clone_file(*job), jobs))
 
 
 class CloneCommand:
@@ -69,26 +114,24 @@ class CloneCommand:
         target.mkdir(parents=True, exist_ok=True)
 
         # Copy .mem and current from remote
-        shutil.copytree(remote_mem, target / ".mem")
+        _clone_tree(remote_mem, target / ".mem")
         remote_current = remote_path / "current"
         if remote_current.exists():
-            shutil.copytree(remote_current, target / "current")
+            _clone_tree(remote_current, target / "current", link_dir=None)
         else:
             (target / "current").mkdir(parents=True)
             for mem_type in MEMORY_TYPES:
                 (target / "current" / mem_type).mkdir(exist_ok=True)
 
         # Set remote origin to source
-        import json
-
         config_file = target / ".mem" / "config.json"
-        config = json.loads(config_file.read_text()) if config_file.exists() else {}
+        config = fast_json.loads(config_file.read_bytes()) if config_file.exists() else {}
         if "remotes" not in config:
             config["remotes"] = {}
         config["remotes"]["origin"] = {
             "url": url if url.startswith("file://") else f"file://{remote_path}"
         }
-        config_file.write_text(json.dumps(config, indent=2))
+        config_file.write_bytes(fast_json.dumps(config, indent=True))
 
         # Copy remote's public key to .mem/keys/remotes/origin.pub for trust store
         remote_keys = remote_mem / "keys" / "public.pem"
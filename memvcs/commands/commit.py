@@ -3,11 +3,53 @@ agmem commit - Save staged changes as a snapshot.
 """
 
 import argparse
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
 
 from ..commands.base import require_repo
-from ..core.schema import SchemaValidator
+from ..core.objects import Blob
+from ..core.schema import (
+    FrontmatterParser,
+    SchemaValidator,
+    ValidationCache,
+    ValidationResult,
+)
 from ..core.hooks import run_pre_commit_hooks, compute_suggested_importance
+from ..core.workers import cpu_workers
+
+# Frontmatter is at the head of the file; read this much of a staged copy first
+VALIDATION_READ_BYTES = 64 * 1024
+# Below this many files, starting worker processes costs more than validating serially
+VALIDATION_POOL_MIN_FILES = 64
+VALIDATION_WORKERS = cpu_workers()
+
+
+def _validate_content(job):
+    """Validate one (filepath, raw content, strict) job; module-level so it pickles."""
+    filepath, data, strict = job
+    return SchemaValidator.validate_bytes(data, filepath, strict=strict)
+
+
+def _content_for_validation(repo, filepath: str, blob_hash: str) -> Optional[bytes]:
+    """
+    Bytes to validate for a staged file.
+
+    Reads the uncompressed staging copy, and only its head when the frontmatter
+    closes within it; the blob is decompressed only if no staging copy exists.
+    """
+    head = repo.staging.read_staged(filepath, VALIDATION_READ_BYTES)
+    if head is not None:
+        if len(head) < VALIDATION_READ_BYTES:
+            return head
+        if FrontmatterParser.FRONTMATTER_BYTES_PATTERN.match(head):
+            return head
+        full = repo.staging.read_staged(filepath)
+        if full is not None:
+            return full
+    blob = Blob.load(repo.object_store, blob_hash)
+    return blob.content if blob else None
 
 
 class CommitCommand:
@@ -53,34 +95,53 @@ class CommitCommand:
         Returns:
             Tuple of (success, validation_results)
         """
-        validation_results = {}
-        has_errors = False
-
+        cache = ValidationCache(repo.mem_dir)
+        entries = []  # (filepath, cache key, job or None when known clean)
         for filepath, file_info in staged.items():
             blob_hash = CommitCommand._get_blob_hash(file_info)
             if not blob_hash:
                 continue
 
-            # Read content from object store
-            from ..core.objects import Blob
+            # Unchanged blobs that already passed need neither loading nor validating
+            key = ValidationCache.key(blob_hash, filepath, strict)
+            if cache.is_clean(key):
+                entries.append((filepath, key, None))
+                continue
 
-            blob = Blob.load(repo.object_store, blob_hash)
-            if not blob:
+            content = _content_for_validation(repo, filepath, blob_hash)
+            if content is None:
                 continue
 
+            entries.append((filepath, key, (filepath, content, strict)))
+
+        jobs = [job for _, _, job in entries if job is not None]
+        # Validation is CPU-bound and independent per file
+        results = None
+        workers = min(len(jobs), VALIDATION_WORKERS)
+        if len(jobs) >= VALIDATION_POOL_MIN_FILES and workers > 1:
             try:
-                content = blob.content.decode("utf-8")
-            except UnicodeDecodeError:
-                # Skip binary files
-                continue
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    chunksize = max(1, len(jobs) // (workers * 4))
+                    results = list(pool.map(_validate_content, jobs, chunksize=chunksize))
+            except (OSError, BrokenProcessPool):
+                results = None  # no usable process pool here; validate serially
+        if results is None:
+            results = [_validate_content(job) for job in jobs]
 
-            # Validate the file
-            result = SchemaValidator.validate(content, filepath, strict=strict)
+        validation_results = {}
+        pending = iter(results)
+        for filepath, key, job in entries:
+            if job is None:
+                validation_results[filepath] = ValidationResult(valid=True)
+                continue
+            result = next(pending)
+            if result is None:
+                continue  # binary content is skipped
             validation_results[filepath] = result
+            cache.record(key, result)
+        cache.save()
 
-            if not result.valid:
-                has_errors = True
-
+        has_errors = any(not result.valid for result in validation_results.values())
         return not has_errors, validation_results
 
     @staticmethod
@@ -151,7 +212,10 @@ class CommitCommand:
         if args.run_tests:
             if CommitCommand._run_memory_tests(repo) != 0:
                 return 1
-        metadata = {"files_changed": len(staged), "timestamp": datetime.utcnow().isoformat() + "Z"}
+        metadata = {
+            "files_changed": len(staged),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
         # Importance scoring: explicit --importance or auto from heuristics
         if args.importance is not None:
             if not (0.0 <= args.importance <= 1.0):
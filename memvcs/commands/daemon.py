@@ -4,13 +4,48 @@ agmem daemon - Auto-sync daemon for automatic commits.
 
 import argparse
 import os
+import re
 import sys
+import threading
 import time
 import signal
 from pathlib import Path
+from typing import Optional
 
 from ..commands.base import require_repo
 
+# Any hidden path component (.mem, .git, editor swap files, ...)
+_HIDDEN_COMPONENT = re.compile(r"(?:^|[\\/])\.")
+
+
+def _is_ignored_event_path(src_path: str, watch_prefix: str) -> bool:
+    """Return True for paths the daemon should not react to, relative to the watched dir."""
+    # Search from the prefix's trailing separator instead of slicing a copy of the path
+    start = len(watch_prefix) - 1 if src_path.startswith(watch_prefix) else 0
+    return _HIDDEN_COMPONENT.search(src_path, start) is not None
+
+
+def _read_pid(pid_file: Path) -> Optional[int]:
+    """Return the PID recorded in pid_file, or None if it is missing or unreadable."""
+    try:
+        return int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Return True if a process with this PID exists."""
+    if sys.platform.startswith("linux") and os.path.isdir("/proc/self"):
+        # One stat; needs no permission to signal the process
+        return os.path.exists(f"/proc/{pid}")
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True  # exists, owned by another user
+    except OSError:
+        return False
+    return True
+
 
 class DaemonCommand:
     """Control the auto-sync daemon."""
@@ -67,14 +102,11 @@ class DaemonCommand:
     def _start(repo, pid_file: Path, debounce: int, distill: bool = False) -> int:
         """Start daemon in background."""
         # Check if already running
-        if pid_file.exists():
-            pid = int(pid_file.read_text().strip())
-            try:
-                os.kill(pid, 0)
-                print(f"Daemon already running (PID: {pid})")
-                return 1
-            except OSError:
-                pid_file.unlink()
+        pid = _read_pid(pid_file)
+        if pid is not None and _pid_alive(pid):
+            print(f"Daemon already running (PID: {pid})")
+            return 1
+        pid_file.unlink(missing_ok=True)
 
         # Fork to background (Unix only)
         if os.name != "posix":
@@ -118,12 +150,13 @@ class DaemonCommand:
     @staticmethod
     def _stop(pid_file: Path) -> int:
         """Stop running daemon."""
-        if not pid_file.exists():
+        pid = _read_pid(pid_file)
+        if pid is None:
+            if pid_file.exists():
+                pid_file.unlink()
             print("No daemon running")
             return 0
 
-        pid = int(pid_file.read_text().strip())
-
         try:
             os.kill(pid, signal.SIGTERM)
             print(f"Stopped daemon (PID: {pid})")
@@ -137,20 +170,17 @@ class DaemonCommand:
     @staticmethod
     def _status(pid_file: Path) -> int:
         """Show daemon status."""
-        if not pid_file.exists():
+        pid = _read_pid(pid_file)
+        if pid is None:
             print("Daemon is not running")
             return 0
 
-        pid = int(pid_file.read_text().strip())
-
-        try:
-            os.kill(pid, 0)
+        if _pid_alive(pid):
             print(f"Daemon is running (PID: {pid})")
             return 0
-        except OSError:
-            print("Daemon is not running (stale PID file)")
-            pid_file.unlink()
-            return 0
+        print("Daemon is not running (stale PID file)")
+        pid_file.unlink(missing_ok=True)
+        return 0
 
     @staticmethod
     def _run(repo, debounce: int, pid_file: Path = None, distill: bool = False) -> int:
@@ -168,22 +198,31 @@ class DaemonCommand:
             print("No current/ directory to watch")
             return 1
 
+        watch_prefix = str(current_dir) + os.sep
+
         class MemoryFileHandler(FileSystemEventHandler):
             def __init__(self):
-                self.last_change = 0
-                self.pending = False
+                # Monotonic time of the latest event; immune to wall-clock jumps
+                self.last_change = 0.0
+                # Set by the watcher thread, cleared by the main loop before committing
+                self.pending = threading.Event()
+                # Wakes the main loop; it sleeps until an event or a deadline
+                self.change_event = threading.Event()
 
             def on_any_event(self, event):
-                # Ignore .mem and hidden files
-                if ".mem" in event.src_path or "/." in event.src_path:
-                    return
-
                 # Ignore directories
                 if event.is_directory:
                     return
 
-                self.last_change = time.time()
-                self.pending = True
+                # Ignore .mem and hidden files
+                if _is_ignored_event_path(event.src_path, watch_prefix):
+                    return
+
+                # last_change is written before pending is set, so a reader that
+                # sees pending also sees the matching timestamp
+                self.last_change = time.monotonic()
+                self.pending.set()
+                self.change_event.set()
 
         handler = MemoryFileHandler()
         observer = Observer()
@@ -199,12 +238,13 @@ class DaemonCommand:
         def signal_handler(signum, frame):
             nonlocal running
             running = False
+            handler.change_event.set()
 
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
 
         # Health monitoring: periodic integrity check (configurable interval)
-        last_health_check = 0
+        last_health_check = float("-inf")  # first check runs immediately
         health_check_interval = 3600  # default 1 hour
         try:
             from ..core.config_loader import load_agmem_config
@@ -225,12 +265,22 @@ class DaemonCommand:
 
         try:
             while running:
-                time.sleep(1)
+                # Sleep until a file event, the debounce deadline or the next health check
+                deadlines = []
+                if handler.pending.is_set():
+                    deadlines.append(handler.last_change + debounce)
+                if health_check_interval:
+                    deadlines.append(last_health_check + health_check_interval)
+                timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                handler.change_event.wait(timeout)
+                handler.change_event.clear()
+                if not running:
+                    break
 
                 # Periodic health check (Merkle/signature + operational metrics). Alert only; no destructive action.
                 if (
                     health_check_interval
-                    and (time.time() - last_health_check) >= health_check_interval
+                    and (time.monotonic() - last_health_check) >= health_check_interval
                 ):
                     # Cryptographic integrity check
                     try:
@@ -287,11 +337,13 @@ class DaemonCommand:
                     except Exception:
                         pass
 
-                    last_health_check = time.time()
+                    last_health_check = time.monotonic()
 
-                if handler.pending:
-                    elapsed = time.time() - handler.last_change
+                if handler.pending.is_set():
+                    elapsed = time.monotonic() - handler.last_change
                     if elapsed >= debounce:
+                        # Clear first so edits made during the commit schedule another one
+                        handler.pending.clear()
                         # Auto-commit
                         DaemonCommand._auto_commit(repo)
                         if distill:
@@ -302,7 +354,6 @@ class DaemonCommand:
                                 d.run()
                             except Exception:
                                 pass
-                        handler.pending = False
         finally:
             observer.stop()
             observer.join()
@@ -316,33 +367,19 @@ class DaemonCommand:
     @staticmethod
     def _auto_commit(repo):
         """Perform automatic commit."""
-        from datetime import datetime
-
         try:
-            # Check for changes
+            # One status walk both decides whether anything changed and lists what to stage
             status = repo.get_status()
+            changed = status.get("modified", []) + status.get("untracked", [])
 
-            if not status.get("modified") and not status.get("untracked"):
+            if not changed:
                 return
 
-            # Stage all changes in current/ (validate path stays under current/)
-            current_dir = repo.root / "current"
-            for memory_file in current_dir.glob("**/*"):
-                if memory_file.is_file() and ".mem" not in str(memory_file):
-                    try:
-                        rel_path = memory_file.relative_to(current_dir)
-                    except ValueError:
-                        continue
-                    rel_str = str(rel_path)
-                    if repo._path_under_current_dir(rel_str) is None:
-                        continue
-                    try:
-                        repo.stage_file(rel_str)
-                    except Exception:
-                        pass
+            # stage_files rejects paths outside current/; skip those like before
+            repo.stage_files(changed, errors={})
 
             # Commit
-            timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
             repo.commit(f"auto: update memory state ({timestamp})", {"auto_commit": True})
 
             print(f"[{timestamp}] Auto-committed changes")
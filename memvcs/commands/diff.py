@@ -4,11 +4,114 @@ agmem diff - Show changes between commits, commit and working tree, etc.
 
 import argparse
 import os
-from pathlib import Path
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 from ..commands.base import require_repo
-from ..core.diff import DiffEngine
+from ..core.diff import DiffEngine, WorkingBlob
+from ..core.objects import Commit, hash_object
 from ..core.repository import Repository
+from ..core.staging import StatCache
+from ..core.workers import io_workers
+
+
+READ_WORKERS = io_workers()
+# Files up to this size are read into a reused per-thread buffer
+REUSED_BUFFER_SIZE = 256 * 1024
+
+_thread_buffers = threading.local()
+
+
+def _read_sized(path: str, size: int) -> bytes:
+    """
+    Read a whole file whose size is already known from stat.
+
+    One unbuffered read of size + 1 bytes normally returns everything and
+    proves EOF, skipping the fstat, isatty probe and trailing read that a
+    buffered open(...).read() adds per file. Files that grew are read on.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _read_into_thread_buffer(path: str, size: int) -> Optional[memoryview]:
+    """
+    Read a small file into this thread's reusable buffer; None if it outgrew size.
+
+    The returned view is only valid until the thread's next read.
+    """
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None:
+        buf = _thread_buffers.buf = bytearray(REUSED_BUFFER_SIZE + 1)
+    view = memoryview(buf)
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        n = os.readv(fd, [view[: size + 1]])
+    finally:
+        os.close(fd)
+    return view[:n] if n <= size else None
+
+
+def _iter_working_files(
+    repo: Repository, base_files: Optional[Dict[str, str]] = None
+) -> Iterator[Tuple[str, Callable[[], WorkingBlob]]]:
+    """
+    Yield (relative path, loader) for files under current/ in sorted path order.
+
+    Hidden directories are pruned. Files whose stat data matches the stat cache
+    are not read; they load as a content-less WorkingBlob of the blob recorded
+    when they were last staged. Other files are read and hashed on a thread pool
+    (hashlib releases the GIL), at most READ_WORKERS * 2 files ahead of the
+    consumer, so memory stays bounded by that window.
+
+    Small files are read into a reused per-thread buffer and hashed in place;
+    their content is copied out only when the hash differs from base_files
+    (path -> blob hash of the commit being diffed against).
+    """
+    # The walker's DirEntry objects carry the full path, so no per-file joins
+    entries = sorted(Repository._scan_working_files(repo.current_dir), key=lambda e: e[0])
+    stat_cache = StatCache(repo.mem_dir)
+    base_files = base_files or {}
+
+    def read(entry: os.DirEntry, rel_path: str) -> WorkingBlob:
+        st = entry.stat()
+        blob_hash = stat_cache.lookup(rel_path, st)
+        if blob_hash and repo.object_store.exists(blob_hash, "blob"):
+            return WorkingBlob(blob_hash)
+        if st.st_size <= REUSED_BUFFER_SIZE and hasattr(os, "readv"):
+            view = _read_into_thread_buffer(entry.path, st.st_size)
+            if view is not None:
+                blob_hash = hash_object(view, "blob")
+                if base_files.get(rel_path) == blob_hash:
+                    return WorkingBlob(blob_hash)
+                return WorkingBlob(blob_hash, bytes(view))
+        content = _read_sized(entry.path, st.st_size)
+        return WorkingBlob(hash_object(content, "blob"), content)
+
+    window = READ_WORKERS * 2
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        pending = deque()
+        for rel_path, entry in entries:
+            pending.append((rel_path, pool.submit(read, entry, rel_path)))
+            if len(pending) >= window:
+                done_path, future = pending.popleft()
+                yield done_path, future.result
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result
 
 
 class DiffCommand:
@@ -52,28 +155,29 @@ class DiffCommand:
 
         # Determine what to diff
         if args.cached:
-            # Diff staged changes against HEAD
-            head_commit = repo.get_head_commit()
-            if not head_commit:
-                print("No commits yet. Nothing to diff.")
-                return 0
-
+            # Diff staged changes against HEAD; the index is already in memory, so
+            # check it before loading the HEAD commit
             staged_files = repo.staging.get_staged_files()
             if not staged_files:
                 print("No staged changes.")
                 return 0
 
-            # Get staged content
-            working_files = {}
-            for path, sf in staged_files.items():
-                from ..core.objects import Blob
-
-                blob = Blob.load(repo.object_store, sf.blob_hash)
-                if blob:
-                    working_files[path] = blob.content
-
-            tree_diff = engine.diff_working_dir(head_commit.store(repo.object_store), working_files)
+            head_commit = repo.get_head_commit()
+            if not head_commit:
+                print("No commits yet. Nothing to diff.")
+                return 0
 
+            # Staged blobs are already stored; the engine loads one only if it differs from HEAD
+            staged_blobs = (
+                (path, lambda h=staged_files[path].blob_hash: WorkingBlob(h))
+                for path in sorted(staged_files)
+            )
+            tree_diff = engine.diff_working_dir_streaming(
+                head_commit.store(repo.object_store), staged_blobs
+            )
+
+            for path in tree_diff.missing:
+                print(f"Warning: Staged object for {path} is missing from the object store")
             print(engine.format_diff(tree_diff, "HEAD", "staged"))
             return 0
 
@@ -91,66 +195,42 @@ class DiffCommand:
                 print(f"Error: Unknown revision: {ref2}")
                 return 1
 
-            tree_diff = engine.diff_commits(commit1, commit2)
-
-            if args.stat:
-                print(f" {tree_diff.added_count} file(s) added")
-                print(f" {tree_diff.deleted_count} file(s) deleted")
-                print(f" {tree_diff.modified_count} file(s) modified")
-            else:
-                print(engine.format_diff(tree_diff, ref1, ref2))
-
+            # --stat needs only counts: skip blob loads and line diffs
+            tree_diff = engine.diff_commits(commit1, commit2, with_content=not args.stat)
+            DiffCommand._print_diff(engine, tree_diff, ref1, ref2, args.stat)
             return 0
 
-        # Diff working tree against a ref
+        # Diff working tree against a ref, or HEAD by default
         if args.ref1:
             commit_hash = repo.resolve_ref(args.ref1)
             if not commit_hash:
                 print(f"Error: Unknown revision: {args.ref1}")
                 return 1
-
-            # Get working directory files
-            working_files = {}
-            for root, dirs, files in os.walk(repo.current_dir):
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
-                for filename in files:
-                    full_path = Path(root) / filename
-                    rel_path = str(full_path.relative_to(repo.current_dir))
-                    working_files[rel_path] = full_path.read_bytes()
-
-            tree_diff = engine.diff_working_dir(commit_hash, working_files)
-
-            if args.stat:
-                print(f" {tree_diff.added_count} file(s) added")
-                print(f" {tree_diff.deleted_count} file(s) deleted")
-                print(f" {tree_diff.modified_count} file(s) modified")
-            else:
-                print(engine.format_diff(tree_diff, args.ref1, "working"))
-
-            return 0
-
-        # Default: diff working tree against HEAD
-        head_commit = repo.get_head_commit()
-        if not head_commit:
-            print("No commits yet. Nothing to diff.")
-            return 0
-
-        # Get working directory files
-        working_files = {}
-        for root, dirs, files in os.walk(repo.current_dir):
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-            for filename in files:
-                full_path = Path(root) / filename
-                rel_path = str(full_path.relative_to(repo.current_dir))
-                working_files[rel_path] = full_path.read_bytes()
-
-        tree_diff = engine.diff_working_dir(head_commit.store(repo.object_store), working_files)
-
-        if args.stat:
-            print(f" {tree_diff.added_count} file(s) added")
-            print(f" {tree_diff.deleted_count} file(s) deleted")
-            print(f" {tree_diff.modified_count} file(s) modified")
+            old_ref = args.ref1
         else:
-            print(engine.format_diff(tree_diff, "HEAD", "working"))
+            head_commit = repo.get_head_commit()
+            if not head_commit:
+                print("No commits yet. Nothing to diff.")
+                return 0
+            commit_hash = head_commit.store(repo.object_store)
+            old_ref = "HEAD"
 
+        commit = Commit.load(repo.object_store, commit_hash)
+        base_files = engine.get_tree_files(commit.tree) if commit else {}
+        tree_diff = engine.diff_working_dir_streaming(
+            commit_hash, _iter_working_files(repo, base_files), with_content=not args.stat
+        )
+        DiffCommand._print_diff(engine, tree_diff, old_ref, "working", args.stat)
         return 0
+
+    @staticmethod
+    def _print_diff(engine: DiffEngine, tree_diff, old_ref: str, new_ref: str, stat: bool):
+        """Print a diffstat (counts only) or the full diff, in one write."""
+        if stat:
+            print(
+                f" {tree_diff.added_count} file(s) added\n"
+                f" {tree_diff.deleted_count} file(s) deleted\n"
+                f" {tree_diff.modified_count} file(s) modified"
+            )
+        else:
+            print(engine.format_diff(tree_diff, old_ref, new_ref))
@@ -9,6 +9,7 @@ from pathlib import Path
 
 from ..commands.base import require_repo
 from ..core.distiller import Distiller, DistillerConfig, DistillerResult
+from ..core.privacy_budget import load_budget, spend_epsilon
 
 
 class DistillCommand:
@@ -62,8 +63,6 @@ class DistillCommand:
         dp_epsilon = None
         dp_delta = None
         if use_dp:
-            from ..core.privacy_budget import load_budget, spend_epsilon
-
             spent, max_eps, delta = load_budget(repo.mem_dir)
             epsilon_cost = 0.1
             if not spend_epsilon(repo.mem_dir, epsilon_cost):
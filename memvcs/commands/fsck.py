@@ -3,9 +3,77 @@ agmem fsck - File system consistency check.
 """
 
 import argparse
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Optional
 
 from ..commands.base import require_repo
+from ..core import fast_json
+from ..core.workers import cpu_workers
+
+# Below this many objects, starting worker processes costs more than checking serially
+OBJECT_CHECK_POOL_MIN_OBJECTS = 256
+OBJECT_CHECK_WORKERS = cpu_workers()
+# Objects are small; batch many per IPC round trip
+OBJECT_CHECK_CHUNKSIZE = 64
+# Integrity checks discard decompressed output; cap how much is produced per call
+OBJECT_CHECK_MAX_OUTPUT = 64 * 1024
+# Worker threads verifying branch tips in _check_crypto
+CRYPTO_CHECK_WORKERS = cpu_workers()
+
+# Per-process read buffer reused for every object checked (workers are single-threaded)
+_read_buffer = bytearray(64 * 1024)
+
+
+def _object_is_intact(path: str) -> bool:
+    """Return True if the loose object file reads and decompresses; module-level so it pickles."""
+    view = memoryview(_read_buffer)
+    decompressor = zlib.decompressobj()
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while not decompressor.eof:
+                n = f.readinto(_read_buffer)
+                if not n:
+                    break
+                decompressor.decompress(view[:n], OBJECT_CHECK_MAX_OUTPUT)
+                while decompressor.unconsumed_tail:
+                    decompressor.decompress(decompressor.unconsumed_tail, OBJECT_CHECK_MAX_OUTPUT)
+    except (OSError, zlib.error):
+        return False
+    return decompressor.eof
+
+
+class _CheckPools:
+    """
+    Worker pools shared by the fsck phases, created on first use.
+
+    A phase that needs a pool asks for it here instead of starting its own, so
+    workers are spawned at most once per fsck run.
+    """
+
+    def __init__(self):
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def threads(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=CRYPTO_CHECK_WORKERS)
+        return self._threads
+
+    def processes(self) -> ProcessPoolExecutor:
+        """Return the process pool; raises OSError where processes are unavailable."""
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=OBJECT_CHECK_WORKERS)
+        return self._processes
+
+    def shutdown(self):
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown()
+        self._threads = self._processes = None
 
 
 class FsckCommand:
@@ -25,6 +93,18 @@ class FsckCommand:
             action="store_true",
             help="Actually remove dangling entries (required to make changes)",
         )
+        parser.add_argument(
+            "--connectivity-only",
+            "--fast",
+            dest="connectivity_only",
+            action="store_true",
+            help="Skip decompressing objects; check only refs, signatures and vectors",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Decompress every object, even ones unchanged since the last fsck",
+        )
 
     @staticmethod
     def execute(args) -> int:
@@ -34,6 +114,15 @@ class FsckCommand:
 
         print("Running file system consistency check...")
 
+        pools = _CheckPools()
+        try:
+            return FsckCommand._run_checks(repo, args, pools)
+        finally:
+            pools.shutdown()
+
+    @staticmethod
+    def _run_checks(repo, args, pools: "_CheckPools") -> int:
+        """Run every fsck phase and print the summary; returns the exit code."""
         issues_found = 0
         issues_fixed = 0
 
@@ -54,20 +143,36 @@ class FsckCommand:
         except Exception as e:
             print(f"Warning: Vector store check failed: {e}")
 
-        # Check object store integrity
-        obj_issues, obj_fixed = FsckCommand._check_objects(
-            repo, args.dry_run, args.verbose, args.fix
-        )
-        issues_found += obj_issues
-        issues_fixed += obj_fixed
+        # Check object store integrity (the expensive part: every object is decompressed)
+        if getattr(args, "connectivity_only", False):
+            if args.verbose:
+                print("\nSkipping object store check (--connectivity-only)")
+        else:
+            obj_issues, obj_fixed = FsckCommand._check_objects(
+                repo,
+                args.dry_run,
+                args.verbose,
+                args.fix,
+                full=getattr(args, "full", False),
+                pools=pools,
+            )
+            issues_found += obj_issues
+            issues_fixed += obj_fixed
+
+        # Branch tips and which of them exist, shared by the refs and crypto checks
+        branch_tips, existing_commits = FsckCommand._branch_tips(repo)
 
         # Check refs integrity
-        ref_issues, ref_fixed = FsckCommand._check_refs(repo, args.dry_run, args.verbose, args.fix)
+        ref_issues, ref_fixed = FsckCommand._check_refs(
+            repo, args.dry_run, args.verbose, args.fix, branch_tips, existing_commits
+        )
         issues_found += ref_issues
         issues_fixed += ref_fixed
 
         # Cryptographic verification (Merkle + signature)
-        crypto_issues = FsckCommand._check_crypto(repo, args.verbose)
+        crypto_issues = FsckCommand._check_crypto(
+            repo, args.verbose, branch_tips, existing_commits, pools=pools
+        )
         issues_found += crypto_issues
 
         # Print summary
@@ -92,28 +197,27 @@ class FsckCommand:
         """Check for dangling vector entries."""
         print("\nChecking vector store...")
 
-        current_dir = repo.root / "current"
-        entries = vs.get_all_entries()
+        current_dir = os.path.join(repo.root, "current")
+        # One walk of current/ answers most lookups; only misses (hidden directories,
+        # other separators, real dangling rows) fall back to a stat. The walk waits
+        # for the first row, so a store that cannot open (no sqlite-vec) costs nothing
+        present = None
 
+        # Rows are streamed from the cursor; only dangling rowids are kept
         dangling = []
-
-        for entry in entries:
-            path = entry["path"]
-            full_path = current_dir / path
-
-            if not full_path.exists():
-                dangling.append(entry)
+        for rowid, path in vs.iter_entries():
+            if present is None:
+                present = set(repo._walk_working_files(repo.current_dir))
+            if path not in present and not os.path.exists(os.path.join(current_dir, path)):
+                dangling.append(rowid)
                 if verbose:
-                    print(f"  Dangling: {path} (rowid: {entry['rowid']})")
+                    print(f"  Dangling: {path} (rowid: {rowid})")
 
         if dangling:
             print(f"  Found {len(dangling)} dangling vector entries")
 
             if fix and not dry_run:
-                fixed = 0
-                for entry in dangling:
-                    if vs.delete_entry(entry["rowid"]):
-                        fixed += 1
+                fixed = vs.delete_entries(dangling)
                 print(f"  Removed {fixed} dangling entries")
                 return len(dangling), fixed
             elif dry_run:
@@ -124,33 +228,89 @@ class FsckCommand:
         return len(dangling), 0
 
     @staticmethod
-    def _check_objects(repo, dry_run: bool, verbose: bool, fix: bool) -> tuple:
-        """Check object store integrity."""
+    def _check_objects(
+        repo,
+        dry_run: bool,
+        verbose: bool,
+        fix: bool,
+        full: bool = False,
+        pools: Optional[_CheckPools] = None,
+    ) -> tuple:
+        """
+        Check object store integrity.
+
+        Objects whose stat data is unchanged since they last decompressed cleanly
+        (recorded in .mem/fsck_verified.json) are not decompressed again unless
+        full is set.
+        """
         print("\nChecking object store...")
 
-        issues = 0
-
-        # Check if all referenced blobs exist
+        verified_file = os.path.join(repo.mem_dir, "fsck_verified.json")
+        verified = {}
+        if not full:
+            try:
+                with open(verified_file, "rb") as f:
+                    verified = fast_json.loads(f.read())
+            except (OSError, ValueError):
+                verified = {}
+
+        # Collect (obj_type, hash_id, path) for every loose object first
+        objects = []
+        still_verified = {}
+        objects_dir = os.path.join(repo.root, ".mem", "objects")
         for obj_type in ["blob", "tree", "commit", "tag"]:
-            obj_dir = repo.root / ".mem" / "objects" / obj_type
-            if not obj_dir.exists():
-                continue
-
-            for prefix_dir in obj_dir.iterdir():
-                if not prefix_dir.is_dir():
+            for prefix_path, prefix in FsckCommand._scan_dirs(os.path.join(objects_dir, obj_type)):
+                try:
+                    with os.scandir(prefix_path) as it:
+                        for e in it:
+                            key = f"{obj_type}/{prefix}{e.name}"
+                            try:
+                                st = e.stat()
+                            except OSError:
+                                st = None
+                            stat_key = [st.st_mtime_ns, st.st_size, st.st_ino] if st else None
+                            if stat_key and verified.get(key) == stat_key:
+                                still_verified[key] = stat_key
+                                continue
+                            objects.append((obj_type, prefix + e.name, e.path, key, stat_key))
+                except OSError:
                     continue
-                for obj_file in prefix_dir.iterdir():
-                    try:
-                        # Try to read and decompress
-                        import zlib
-
-                        compressed = obj_file.read_bytes()
-                        zlib.decompress(compressed)
-                    except Exception as e:
-                        issues += 1
-                        if verbose:
-                            hash_id = prefix_dir.name + obj_file.name
-                            print(f"  Corrupted {obj_type}: {hash_id[:8]}...")
+
+        # Decompression is CPU-bound; spread it over processes for large stores
+        paths = [obj[2] for obj in objects]
+        results = None
+        if len(paths) >= OBJECT_CHECK_POOL_MIN_OBJECTS and OBJECT_CHECK_WORKERS > 1:
+            own_pools = pools is None
+            pools = pools or _CheckPools()
+            try:
+                results = list(
+                    pools.processes().map(
+                        _object_is_intact, paths, chunksize=OBJECT_CHECK_CHUNKSIZE
+                    )
+                )
+            except (OSError, BrokenProcessPool):
+                results = None  # no usable process pool here; check serially
+            finally:
+                if own_pools:
+                    pools.shutdown()
+        if results is None:
+            results = [_object_is_intact(path) for path in paths]
+
+        issues = 0
+        for (obj_type, hash_id, _, key, stat_key), ok in zip(objects, results):
+            if not ok:
+                issues += 1
+                if verbose:
+                    print(f"  Corrupted {obj_type}: {hash_id[:8]}...")
+            elif stat_key:
+                still_verified[key] = stat_key
+
+        # Rewritten each run so objects deleted by gc drop out of the record
+        try:
+            with open(verified_file, "wb") as f:
+                f.write(fast_json.dumps(still_verified))
+        except OSError:
+            pass
 
         if issues == 0:
             print("  Object store is consistent")
@@ -160,35 +320,73 @@ class FsckCommand:
         return issues, 0  # Object repair not implemented
 
     @staticmethod
-    def _check_refs(repo, dry_run: bool, verbose: bool, fix: bool) -> tuple:
+    def _branch_tips(repo) -> tuple:
+        """
+        Return ({branch: tip commit hash or None}, set of commit hashes that exist).
+
+        The existence set covers every branch tip and HEAD's commit, checked
+        with one listing per object prefix directory.
+        """
+        branch_tips = {b: repo.refs.get_branch_commit(b) for b in repo.refs.list_branches()}
+        candidates = {h for h in branch_tips.values() if h}
+        head = repo.refs.get_head()
+        if head["type"] == "detached":
+            candidates.add(head["value"])
+        elif head["type"] == "branch" and head["value"] not in branch_tips:
+            head_commit = repo.refs.get_branch_commit(head["value"])
+            if head_commit:
+                candidates.add(head_commit)
+        return branch_tips, repo.object_store.exists_many(candidates, "commit")
+
+    @staticmethod
+    def _scan_dirs(path: str) -> list:
+        """Return (path, name) of the subdirectories of path; [] if it cannot be listed."""
+        try:
+            with os.scandir(path) as it:
+                return [(e.path, e.name) for e in it if e.is_dir()]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _check_refs(
+        repo,
+        dry_run: bool,
+        verbose: bool,
+        fix: bool,
+        branch_tips: Optional[dict] = None,
+        existing_commits: Optional[set] = None,
+    ) -> tuple:
         """Check refs integrity."""
         print("\nChecking refs...")
 
+        if branch_tips is None or existing_commits is None:
+            branch_tips, existing_commits = FsckCommand._branch_tips(repo)
+
         issues = 0
 
         # Check if HEAD points to valid commit
         head = repo.refs.get_head()
         if head["type"] == "branch":
-            branch_commit = repo.refs.get_branch_commit(head["value"])
+            branch_commit = branch_tips.get(head["value"]) or repo.refs.get_branch_commit(
+                head["value"]
+            )
             if not branch_commit:
                 issues += 1
                 if verbose:
                     print(f"  HEAD branch '{head['value']}' has no commit")
-            elif not repo.object_store.exists(branch_commit, "commit"):
+            elif branch_commit not in existing_commits:
                 issues += 1
                 if verbose:
                     print(f"  HEAD points to missing commit: {branch_commit[:8]}")
         elif head["type"] == "detached":
-            if not repo.object_store.exists(head["value"], "commit"):
+            if head["value"] not in existing_commits:
                 issues += 1
                 if verbose:
                     print(f"  Detached HEAD points to missing commit")
 
         # Check all branches
-        branches = repo.refs.list_branches()
-        for branch in branches:
-            commit_hash = repo.refs.get_branch_commit(branch)
-            if commit_hash and not repo.object_store.exists(commit_hash, "commit"):
+        for branch, commit_hash in branch_tips.items():
+            if commit_hash and commit_hash not in existing_commits:
                 issues += 1
                 if verbose:
                     print(f"  Branch '{branch}' points to missing commit")
@@ -201,7 +399,13 @@ class FsckCommand:
         return issues, 0
 
     @staticmethod
-    def _check_crypto(repo, verbose: bool) -> int:
+    def _check_crypto(
+        repo,
+        verbose: bool,
+        branch_tips: Optional[dict] = None,
+        existing_commits: Optional[set] = None,
+        pools: Optional[_CheckPools] = None,
+    ) -> int:
         """Verify Merkle/signature on branch tips. Returns number of issues."""
         print("\nChecking commit signatures...")
         try:
@@ -210,13 +414,32 @@ class FsckCommand:
             if verbose:
                 print("  Crypto verification not available")
             return 0
-        issues = 0
+        if branch_tips is None or existing_commits is None:
+            branch_tips, existing_commits = FsckCommand._branch_tips(repo)
         pub = load_public_key(repo.mem_dir)
-        for branch in repo.refs.list_branches():
-            ch = repo.refs.get_branch_commit(branch)
-            if not ch:
-                continue
-            ok, err = verify_commit(repo.object_store, ch, public_key_pem=pub, mem_dir=repo.mem_dir)
+        tips = [(branch, ch) for branch, ch in branch_tips.items() if ch]
+
+        def verify(tip) -> tuple:
+            if tip[1] not in existing_commits:
+                return False, "commit not found"  # what verify_commit reports, without the load
+            return verify_commit(
+                repo.object_store, tip[1], public_key_pem=pub, mem_dir=repo.mem_dir
+            )
+
+        # Tips verify independently; hashing, decompression and signature checks release the GIL
+        if len(tips) > 1:
+            own_pools = pools is None
+            pools = pools or _CheckPools()
+            try:
+                results = list(pools.threads().map(verify, tips))
+            finally:
+                if own_pools:
+                    pools.shutdown()
+        else:
+            results = [verify(tip) for tip in tips]
+
+        issues = 0
+        for (branch, ch), (ok, err) in zip(tips, results):
             if not ok:
                 issues += 1
                 if verbose:
@@ -6,6 +6,7 @@ import argparse
 
 from ..commands.base import require_repo
 from ..core.gardener import Gardener, GardenerConfig
+from ..core.privacy_budget import load_budget, spend_epsilon
 
 
 class GardenCommand:
@@ -54,8 +55,6 @@ class GardenCommand:
         dp_epsilon = None
         dp_delta = None
         if use_dp:
-            from ..core.privacy_budget import load_budget, spend_epsilon
-
             spent, max_eps, delta = load_budget(repo.mem_dir)
             epsilon_cost = 0.1
             if not spend_epsilon(repo.mem_dir, epsilon_cost):
@@ -7,7 +7,6 @@ Remove unreachable objects; optionally repack.
 import argparse
 
 from ..commands.base import require_repo
-from ..core.pack import run_gc, run_repack
 
 
 class GcCommand:
@@ -35,6 +34,11 @@ class GcCommand:
             action="store_true",
             help="After GC, pack reachable loose objects into a pack file",
         )
+        parser.add_argument(
+            "--lazy-sweep",
+            action="store_true",
+            help="Record unreachable objects and free them during the next repack",
+        )
 
     @staticmethod
     def execute(args) -> int:
@@ -42,15 +46,21 @@ class GcCommand:
         if code != 0:
             return code
 
+        from ..core.pack import run_gc, run_repack
+
         gc_prune_days = getattr(args, "prune_days", 90)
+        lazy_sweep = getattr(args, "lazy_sweep", False)
         deleted, freed = run_gc(
             repo.mem_dir,
             repo.object_store,
             gc_prune_days=gc_prune_days,
             dry_run=args.dry_run,
+            lazy_sweep=lazy_sweep,
         )
         if args.dry_run:
             print(f"Would remove {deleted} unreachable object(s) ({freed} bytes).")
+        elif lazy_sweep:
+            print(f"Marked {deleted} unreachable object(s) ({freed} bytes) for the next repack.")
         else:
             print(f"Removed {deleted} unreachable object(s) ({freed} bytes reclaimed).")
 
@@ -61,7 +71,7 @@ class GcCommand:
                 gc_prune_days=gc_prune_days,
                 dry_run=False,
             )
-            if packed > 0:
+            if packed > 0 or repack_freed > 0:
                 print(
                     f"Packed {packed} object(s) into pack file ({repack_freed} bytes from loose)."
                 )
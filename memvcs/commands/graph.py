@@ -3,10 +3,10 @@ agmem graph - Visualize the knowledge graph.
 """
 
 import argparse
-import json
 from pathlib import Path
 
 from ..commands.base import require_repo
+from ..core import fast_json
 
 
 class GraphCommand:
@@ -59,6 +59,12 @@ class GraphCommand:
         builder = KnowledgeGraphBuilder(repo, vector_store)
 
         print("Building knowledge graph...")
+        if args.format == "summary" and args.no_similarity and not args.serve:
+            # Counts are all the summary needs; skip node/edge records and networkx
+            summary = builder.build_summary()
+            GraphCommand._print_summary(summary, summary["isolated"], [])
+            return 0
+
         graph_data = builder.build_graph(
             include_similarity=not args.no_similarity, similarity_threshold=args.threshold
         )
@@ -67,31 +73,34 @@ class GraphCommand:
             return GraphCommand._serve_graph(repo, graph_data)
 
         if args.format == "summary":
-            GraphCommand._print_summary(graph_data, builder)
+            GraphCommand._print_summary(
+                graph_data.metadata,
+                builder.find_isolated_nodes(),
+                builder.find_potential_contradictions(),
+            )
 
         elif args.format == "json":
-            output = graph_data.to_json()
             if args.output:
-                Path(args.output).write_text(output)
+                Path(args.output).write_bytes(fast_json.dumps(graph_data.to_dict(), indent=True))
                 print(f"Graph data written to: {args.output}")
             else:
-                print(output)
+                # Piped output is for programs; skip the pretty-printing
+                print(graph_data.to_json(compact=True))
 
         elif args.format == "d3":
-            output = builder.export_for_d3()
+            # Reuse the graph built above rather than building it again
             if args.output:
-                Path(args.output).write_text(output)
+                d3_data = builder.d3_format(graph_data)
+                Path(args.output).write_bytes(fast_json.dumps(d3_data, indent=True))
                 print(f"D3 graph data written to: {args.output}")
             else:
-                print(output)
+                print(builder.export_for_d3(graph_data))
 
         return 0
 
     @staticmethod
-    def _print_summary(graph_data, builder):
+    def _print_summary(meta, isolated, contradictions):
         """Print a text summary of the graph."""
-        meta = graph_data.metadata
-
         print("\nKnowledge Graph Summary")
         print("=" * 40)
         print(f"Total files: {meta['total_nodes']}")
@@ -107,8 +116,6 @@ class GraphCommand:
             if count > 0:
                 print(f"  {etype}: {count}")
 
-        # Find isolated nodes
-        isolated = builder.find_isolated_nodes()
         if isolated:
             print(f"\nIsolated files (no connections): {len(isolated)}")
             for path in isolated[:5]:
@@ -116,8 +123,6 @@ class GraphCommand:
             if len(isolated) > 5:
                 print(f"  ... and {len(isolated) - 5} more")
 
-        # Find potential contradictions
-        contradictions = builder.find_potential_contradictions()
         if contradictions:
             print(f"\nPotential contradictions: {len(contradictions)}")
             for path1, path2, sim in contradictions[:3]:
@@ -3,10 +3,21 @@ agmem log - Show commit history.
 """
 
 import argparse
+import sys
 from datetime import datetime
+from functools import lru_cache
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
+
+
+@lru_cache(maxsize=256)
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO commit timestamp like git's default log date; unparsable ones pass through."""
+    try:
+        ts = timestamp[:-1] if timestamp.endswith("Z") else timestamp
+        return datetime.fromisoformat(ts).strftime("%a %b %d %H:%M:%S %Y")
+    except (AttributeError, ValueError):
+        return timestamp
 
 
 class LogCommand:
@@ -43,46 +54,35 @@ class LogCommand:
             return 0
 
         if args.oneline:
-            for commit in commits:
-                print(f"{commit['short_hash']} {commit['message']}")
+            print("\n".join(f"{c['short_hash']} {c['message']}" for c in commits))
         elif args.graph:
-            # Simple ASCII graph
-            for i, commit in enumerate(commits):
-                prefix = "* " if i == 0 else "| "
-                print(f"{prefix}{commit['short_hash']} {commit['message']}")
-                if i < len(commits) - 1:
-                    print("|")
+            # Simple ASCII graph, joined into one write
+            lines = [
+                f"{'* ' if i == 0 else '| '}{c['short_hash']} {c['message']}"
+                for i, c in enumerate(commits)
+            ]
+            print("\n|\n".join(lines))
         else:
-            for i, commit in enumerate(commits):
-                if i > 0:
-                    print()
-
-                # Commit header
-                print(f"\033[33mcommit {commit['hash']}\033[0m")
-
+            # HEAD and its branch tip are the same for every commit shown
+            head = repo.refs.get_head()
+            head_commit = None
+            if head["type"] == "branch":
+                head_commit = repo.refs.get_branch_commit(head["value"])
+
+            # One block per commit, written with a single call
+            blocks = []
+            for commit in commits:
+                header = f"\033[33mcommit {commit['hash']}\033[0m\n"
                 # Show branch info if this is HEAD
-                head = repo.refs.get_head()
-                if head["type"] == "branch":
-                    head_commit = repo.refs.get_branch_commit(head["value"])
-                    if head_commit == commit["hash"]:
-                        print(f"\033[36mHEAD -> {head['value']}\033[0m")
-
-                # Author and date
-                print(f"Author: {commit['author']}")
-
-                # Format timestamp
-                try:
-                    ts = commit["timestamp"]
-                    if ts.endswith("Z"):
-                        ts = ts[:-1]
-                    dt = datetime.fromisoformat(ts)
-                    date_str = dt.strftime("%a %b %d %H:%M:%S %Y")
-                    print(f"Date:   {date_str}")
-                except Exception:
-                    print(f"Date:   {commit['timestamp']}")
-
-                # Message
-                print()
-                print(f"    {commit['message']}")
+                if head_commit and head_commit == commit["hash"]:
+                    header += f"\033[36mHEAD -> {head['value']}\033[0m\n"
+                blocks.append(
+                    f"{header}"
+                    f"Author: {commit['author']}\n"
+                    f"Date:   {_format_timestamp(commit['timestamp'])}\n"
+                    "\n"
+                    f"    {commit['message']}\n"
+                )
+            sys.stdout.write("\n".join(blocks))
 
         return 0
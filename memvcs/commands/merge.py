@@ -5,8 +5,6 @@ agmem merge - Join two or more development histories together.
 import argparse
 
 from ..commands.base import require_repo
-from ..core.merge import MergeEngine
-from ..core.repository import Repository
 
 
 class MergeCommand:
@@ -58,25 +56,23 @@ class MergeCommand:
             print(f"Error: Branch '{args.branch}' not found.")
             return 1
 
-        # Trust check for branch tip (may be from another agent)
+        # Trust check for branch tip (may be from another agent). A tip that is
+        # already ours brings nothing in, so its signature need not be checked.
         other_commit_hash = repo.refs.get_branch_commit(args.branch)
-        if other_commit_hash:
-            from ..core.objects import Commit
-            from ..core.trust import find_verifying_key, get_trust_level
-
-            other_commit = Commit.load(repo.object_store, other_commit_hash)
-            if other_commit and other_commit.metadata:
-                key_pem = find_verifying_key(repo.mem_dir, other_commit.metadata)
-                if key_pem is not None:
-                    level = get_trust_level(repo.mem_dir, key_pem)
-                    if level == "untrusted":
-                        print(f"Merge blocked: branch '{args.branch}' signed by untrusted key.")
-                        return 1
-                    if level == "conditional" and not getattr(args, "yes", False):
-                        print("Branch signed by conditionally trusted key. Use --yes to merge.")
-                        return 1
+        if other_commit_hash and other_commit_hash != repo.refs.get_branch_commit(current_branch):
+            from ..core.trust import commit_trust_level
+
+            level = commit_trust_level(repo, other_commit_hash)
+            if level == "untrusted":
+                print(f"Merge blocked: branch '{args.branch}' signed by untrusted key.")
+                return 1
+            if level == "conditional" and not getattr(args, "yes", False):
+                print("Branch signed by conditionally trusted key. Use --yes to merge.")
+                return 1
 
         # Perform merge
+        from ..core.merge import MergeEngine
+
         engine = MergeEngine(repo)
         result = engine.merge(args.branch, message=args.message)
 
@@ -99,7 +95,7 @@ class MergeCommand:
             if result.conflicts:
                 # Persist conflicts for agmem resolve
                 try:
-                    import json
+                    from ..core import fast_json
 
                     merge_dir = repo.mem_dir / "merge"
                     merge_dir.mkdir(parents=True, exist_ok=True)
@@ -115,7 +111,9 @@ class MergeCommand:
                         }
                         for c in result.conflicts
                     ]
-                    (merge_dir / "conflicts.json").write_text(json.dumps(conflicts_data, indent=2))
+                    (merge_dir / "conflicts.json").write_bytes(
+                        fast_json.dumps(conflicts_data, indent=True)
+                    )
                 except Exception:
                     pass
                 print()
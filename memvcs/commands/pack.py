@@ -9,9 +9,17 @@ import sys
 from pathlib import Path
 
 from ..commands.base import require_repo
-from ..core.access_index import AccessIndex
-from ..retrieval import RecallEngine
-from ..retrieval.pack import PackEngine
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write pre-encoded output in one call, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
 
 
 class PackCommand:
@@ -69,61 +77,71 @@ class PackCommand:
         if code != 0:
             return code
 
-        vector_store = None
-        try:
-            from ..core.vector_store import VectorStore
+        from ..core.vector_store import (
+            VectorStore,
+            forget_vector_store_available,
+            vector_store_available,
+        )
 
-            vs = VectorStore(repo.mem_dir)
-            vs._get_connection()  # ensure sqlite-vec is usable; may raise
-            vector_store = vs
+        # Probe result is cached in .mem/features.json; no database is opened here
+        vector_store = VectorStore(repo.mem_dir) if vector_store_available(repo.mem_dir) else None
+
+        try:
+            result = PackCommand._pack(repo, args, vector_store)
         except Exception:
-            pass
+            if vector_store is None:
+                raise
+            # The cached probe was wrong or the database is unusable: forget the
+            # probe and pack without vectors, as when sqlite-vec is missing
+            forget_vector_store_available(repo.mem_dir)
+            if hasattr(vector_store, "close"):
+                vector_store.close()
+            vector_store = None
+            result = PackCommand._pack(repo, args, None)
+
+        if args.format == "json":
+            from ..core import fast_json
+
+            payload = {
+                "content": result.content,
+                "total_tokens": result.total_tokens,
+                "budget": result.budget,
+                "items_used": result.items_used,
+                "items_total": result.items_total,
+            }
+            _write_stdout(fast_json.dumps(payload) + b"\n")
+        else:
+            _write_stdout(result.content.encode("utf-8") + b"\n")
+            sys.stderr.write(
+                f"\n# Pack stats: {result.total_tokens}/{result.budget} tokens, "
+                f"{result.items_used}/{result.items_total} items\n"
+            )
+
+        if vector_store and hasattr(vector_store, "close"):
+            vector_store.close()
+        return 0
+
+    @staticmethod
+    def _pack(repo, args, vector_store):
+        """Recall and pack memories for args, with or without a vector store."""
+        from ..core.access_index import AccessIndex
+        from ..retrieval import RecallEngine
+        from ..retrieval.pack import PackEngine
 
-        access_index = AccessIndex(repo.mem_dir)
         recall_engine = RecallEngine(
             repo=repo,
             vector_store=vector_store,
-            access_index=access_index,
+            access_index=AccessIndex(repo.mem_dir),
             use_cache=True,
         )
-
-        strategy = "hybrid" if args.strategy == "balanced" else args.strategy
         pack_engine = PackEngine(
             recall_engine=recall_engine,
             model=args.model,
             summarization_cascade=False,
         )
-
-        result = pack_engine.pack(
+        return pack_engine.pack(
             context=args.context,
             budget=args.budget,
-            strategy=strategy,
+            strategy="hybrid" if args.strategy == "balanced" else args.strategy,
             exclude=args.exclude,
         )
-
-        if args.format == "json":
-            import json
-
-            print(
-                json.dumps(
-                    {
-                        "content": result.content,
-                        "total_tokens": result.total_tokens,
-                        "budget": result.budget,
-                        "items_used": result.items_used,
-                        "items_total": result.items_total,
-                    },
-                    indent=2,
-                )
-            )
-        else:
-            print(result.content)
-            print(
-                f"\n# Pack stats: {result.total_tokens}/{result.budget} tokens, "
-                f"{result.items_used}/{result.items_total} items",
-                file=sys.stderr,
-            )
-
-        if vector_store and hasattr(vector_store, "close"):
-            vector_store.close()
-        return 0
@@ -8,7 +8,6 @@ import argparse
 from pathlib import Path
 
 from ..commands.base import require_repo
-from ..core.zk_proofs import prove_keyword_containment, prove_memory_freshness
 
 
 class ProveCommand:
@@ -43,6 +42,8 @@ class ProveCommand:
             print(f"Memory file not found: {args.memory}")
             return 1
 
+        from ..core.zk_proofs import prove_keyword_containment, prove_memory_freshness
+
         out = args.output or "proof.bin"
         out_path = Path(out)
         if not out_path.is_absolute():
@@ -4,6 +4,7 @@ agmem pull - Pull memory from remote.
 
 import argparse
 from pathlib import Path
+from typing import List, Optional
 
 
 class PullCommand:
@@ -30,11 +31,17 @@ class PullCommand:
             action="store_true",
             help="Accept conditionally trusted remote commits without prompting",
         )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=None,
+            help="Fetch only the last N commits of each ref (older merge bases are unavailable)",
+        )
 
     @staticmethod
     def execute(args) -> int:
         from memvcs.commands.base import require_repo
-        from memvcs.core.remote import Remote
+        from memvcs.core.remote import Remote, read_shallow
 
         repo, code = require_repo()
         if code != 0:
@@ -48,36 +55,44 @@ class PullCommand:
             return 1
 
         try:
-            msg = remote.fetch(branch=args.branch)
-            print(msg)
+            # List remote refs first; fetch only when some differ from what we have.
+            # A shallow clone pulled without --depth always fetches, to deepen it
+            depth = getattr(args, "depth", None)
+            listed = remote.ls_refs([args.branch] if args.branch else None)
+            changed = PullCommand._changed_refs(repo, args.remote, listed)
+            if depth is None and read_shallow(repo.mem_dir):
+                changed = None
+            if changed is None or changed:
+                fetch_branch = args.branch
+                if fetch_branch is None and changed and len(changed) == 1:
+                    kind, _, name = changed[0].partition("/")
+                    if kind == "heads":
+                        fetch_branch = name
+                msg = remote.fetch(branch=fetch_branch, depth=depth)
+                print(msg)
             # Merge fetched refs into current branch
             current_branch = repo.refs.get_current_branch()
             if current_branch is not None:
                 remote_ref = f"{args.remote}/{current_branch}"
                 remote_hash = repo.resolve_ref(remote_ref)
-                if remote_hash:
+                if remote_hash and remote_hash == repo.refs.get_branch_commit(current_branch):
+                    print("Already up to date.")
+                elif remote_hash:
                     from memvcs.core.crypto_verify import verify_commit_optional
 
                     verify_commit_optional(
                         repo.object_store, remote_hash, mem_dir=repo.mem_dir, strict=False
                     )
                     # Trust check: block or require confirmation for untrusted/conditional
-                    from memvcs.core.objects import Commit
-                    from memvcs.core.trust import find_verifying_key, get_trust_level
+                    from memvcs.core.trust import commit_trust_level
 
-                    remote_commit = Commit.load(repo.object_store, remote_hash)
-                    if remote_commit and remote_commit.metadata:
-                        key_pem = find_verifying_key(repo.mem_dir, remote_commit.metadata)
-                        if key_pem is not None:
-                            level = get_trust_level(repo.mem_dir, key_pem)
-                            if level == "untrusted":
-                                print(f"Pull blocked: remote commit signed by untrusted key.")
-                                return 1
-                            if level == "conditional" and not getattr(args, "yes", False):
-                                print(
-                                    "Remote commit from conditionally trusted key. Use --yes to merge."
-                                )
-                                return 1
+                    level = commit_trust_level(repo, remote_hash)
+                    if level == "untrusted":
+                        print(f"Pull blocked: remote commit signed by untrusted key.")
+                        return 1
+                    if level == "conditional" and not getattr(args, "yes", False):
+                        print("Remote commit from conditionally trusted key. Use --yes to merge.")
+                        return 1
                     from memvcs.core.merge import MergeEngine
 
                     merge_engine = MergeEngine(repo)
@@ -93,3 +108,25 @@ class PullCommand:
         except ValueError as e:
             print(f"Error: {e}")
             return 1
+
+    @staticmethod
+    def _changed_refs(repo, remote_name: str, listed) -> Optional[List[str]]:
+        """
+        Return the listed remote refs whose hash differs from the local copy.
+
+        Heads are compared with remote-tracking refs and tags with local tags; a
+        ref whose commit is missing from the object store also counts as changed.
+        None (remote cannot list refs) means everything must be fetched.
+        """
+        if listed is None:
+            return None
+        changed = []
+        for ref, commit_hash in listed.items():
+            kind, _, name = ref.partition("/")
+            if kind == "heads":
+                local_hash = repo.refs.get_remote_branch_commit(remote_name, name)
+            else:
+                local_hash = repo.refs.get_tag_commit(name)
+            if local_hash != commit_hash or not repo.object_store.exists(commit_hash, "commit"):
+                changed.append(ref)
+        return changed
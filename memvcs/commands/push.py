@@ -3,6 +3,7 @@ agmem push - Push memory to remote with auto-rebase support.
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -42,6 +43,12 @@ class PushCommand:
             action="store_true",
             help="Don't attempt auto-rebase on conflicts",
         )
+        parser.add_argument(
+            "--depth",
+            type=int,
+            default=None,
+            help="Fetch only the last N remote commits before pushing (full history is pushed)",
+        )
 
     @staticmethod
     def execute(args) -> int:
@@ -70,7 +77,6 @@ class PushCommand:
         # Force push warning
         if args.force:
             print("WARNING: Force push may overwrite remote changes!")
-            local_hash = repo.refs.get_branch_commit(branch)
             try:
                 msg = remote.push(branch=branch)
                 print(msg)
@@ -81,22 +87,32 @@ class PushCommand:
 
         # Auto-rebase workflow
         if not args.no_rebase:
-            # Fetch remote state
-            try:
-                print(f"Fetching from {args.remote}...")
-                remote.fetch()
-            except Exception as e:
-                print(f"Note: Could not fetch remote ({e}), attempting direct push...")
+            local_hash = repo.refs.get_branch_commit(branch)
+            merge_engine = MergeEngine(repo)
+
+            # Fetch only writes remote-tracking refs and objects, so walk the
+            # local history while it runs
+            print(f"Fetching from {args.remote}...")
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                fetched = pool.submit(remote.fetch, depth=getattr(args, "depth", None))
+                local_ancestors = (
+                    merge_engine.first_parent_ancestors(local_hash) if local_hash else set()
+                )
+                try:
+                    fetched.result()
+                except Exception as e:
+                    print(f"Note: Could not fetch remote ({e}), attempting direct push...")
 
             # Check if we're behind remote
-            local_hash = repo.refs.get_branch_commit(branch)
             remote_branch = f"{args.remote}/{branch}"
             remote_hash = repo.resolve_ref(remote_branch)
 
-            if remote_hash and remote_hash != local_hash:
+            # Remote tip already in local history: we're ahead, nothing to merge
+            if remote_hash and remote_hash not in local_ancestors:
                 # Check if we can fast-forward or need rebase
-                merge_engine = MergeEngine(repo)
-                ancestor = merge_engine.find_common_ancestor(local_hash, remote_hash)
+                ancestor = merge_engine.find_common_ancestor(
+                    local_hash, remote_hash, local_ancestors
+                )
 
                 if ancestor == local_hash:
                     # We're behind - need to pull first
@@ -113,8 +129,6 @@ class PushCommand:
 
                         if result.success:
                             print(f"Auto-merged with {remote_branch}")
-                            # Update local hash after merge
-                            local_hash = repo.refs.get_branch_commit(branch)
                         else:
                             print("Auto-merge failed with conflicts:")
                             for conflict in result.conflicts:
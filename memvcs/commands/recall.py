@@ -3,11 +3,12 @@ agmem recall - Context-aware retrieval with pluggable strategies.
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
+from typing import Any, Dict, Iterable
 
 from ..commands.base import require_repo
+from ..core import fast_json
 from ..core.access_index import AccessIndex
 from ..retrieval import RecallEngine
 
@@ -21,6 +22,33 @@ def _is_vector_unavailable_error(exc: Exception) -> bool:
     )
 
 
+def _write_json_array(items: Iterable[Dict[str, Any]]) -> None:
+    """
+    Write items to stdout as a JSON array indented by two spaces, one item at a time.
+
+    Neither the list of dicts nor the whole document is built in memory.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+
+    def write(data: bytes) -> None:
+        if buffer is None:
+            sys.stdout.write(data.decode("utf-8"))
+        else:
+            buffer.write(data)
+
+    count = 0
+    for item in items:
+        # JSON strings escape newlines, so every raw newline is layout: indent it
+        encoded = fast_json.dumps(item, indent=True).replace(b"\n", b"\n  ")
+        write((b",\n  " if count else b"[\n  ") + encoded)
+        count += 1
+    write(b"\n]\n" if count else b"[]\n")
+    if buffer is not None:
+        buffer.flush()
+
+
 class RecallCommand:
     """Context-aware recall with pluggable strategies."""
 
@@ -131,8 +159,7 @@ class RecallCommand:
                 raise
 
         if args.format == "json":
-            output = [r.to_dict() for r in results]
-            print(json.dumps(output, indent=2))
+            _write_json_array(r.to_dict() for r in results)
         else:
             for r in results:
                 print(f"\n--- {r.path} (score: {r.relevance_score:.4f}) ---")
@@ -6,7 +6,6 @@ import argparse
 from pathlib import Path
 
 from ..commands.base import require_repo
-from ..core.repository import Repository
 
 
 class ReflogCommand:
@@ -5,11 +5,15 @@ Resolve merge conflicts with ours/theirs/both choices; record in audit.
 """
 
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from ..commands.base import require_repo
+from ..core import fast_json
+from ..core.workers import io_workers
+
+RESOLVE_WRITE_WORKERS = io_workers()
 
 
 def _path_under_current(path_str: str, current_dir: Path) -> Optional[Path]:
@@ -73,7 +77,7 @@ class ResolveCommand:
             return 0
 
         try:
-            conflicts = json.loads(conflicts_file.read_text())
+            conflicts = fast_json.loads(conflicts_file.read_bytes())
         except Exception:
             print("Could not read conflicts file.")
             return 1
@@ -91,29 +95,43 @@ class ResolveCommand:
         elif args.both:
             choice = "both"
 
-        resolved = 0
-        remaining = []
-        for c in conflicts:
-            path = c.get("path", "")
-            if args.path and path != args.path:
-                remaining.append(c)
-                continue
+        # Index by path: resolving one path is a lookup, not a scan of every conflict
+        by_path = {c.get("path", ""): c for c in conflicts}
+        if args.path:
+            targets = [(args.path, by_path[args.path])] if args.path in by_path else []
+        else:
+            targets = list(by_path.items())
+
+        writes = []
+        for path, c in targets:
             if choice is None:
                 print(f"Conflict: {path}")
                 print("  Use: agmem resolve <path> --ours | --theirs | --both")
-                remaining.append(c)
                 continue
             ours_content = c.get("ours_content") or ""
             theirs_content = c.get("theirs_content") or ""
             full_path = _path_under_current(path, repo.current_dir)
             if full_path is None:
                 print(f"Error: Conflict path escapes repository: {path}")
-                remaining.append(c)
                 continue
             content = _resolved_content(choice, ours_content, theirs_content)
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            writes.append((path, full_path, content))
+
+        for parent in {full_path.parent for _, full_path, _ in writes}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        def write(item):
+            _, full_path, content = item
             full_path.write_text(content, encoding="utf-8")
-            resolved += 1
+
+        if len(writes) > 1:
+            with ThreadPoolExecutor(max_workers=RESOLVE_WRITE_WORKERS) as pool:
+                list(pool.map(write, writes))
+        elif writes:
+            write(writes[0])
+
+        for path, _, _ in writes:
+            del by_path[path]
             try:
                 from ..core.audit import append_audit
 
@@ -121,9 +139,12 @@ class ResolveCommand:
             except Exception:
                 pass
 
-        if remaining:
-            conflicts_file.write_text(json.dumps(remaining, indent=2))
-        else:
+        resolved = len(writes)
+        remaining = list(by_path.values())
+        # Rewrite only when something was resolved; a listing leaves merge's file as is
+        if resolved and remaining:
+            conflicts_file.write_bytes(fast_json.dumps(remaining, indent=True))
+        elif resolved:
             conflicts_file.unlink(missing_ok=True)
         if resolved:
             print(f"Resolved {resolved} conflict(s). Stage and commit to complete.")
@@ -3,12 +3,64 @@ agmem resurrect - Restore archived (decayed) memories.
 """
 
 import argparse
+import fnmatch
+import os
+import re
 import shutil
 from pathlib import Path
+from typing import List, Tuple
 
 from ..commands.base import require_repo
 
 
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src's bytes to dst in the kernel; False if copy_file_range is unavailable or fails."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystems report no progress instead of an error
+                    return False
+                remaining -= copied
+        return True
+    except OSError:
+        return False
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy src to dst with its metadata, like shutil.copy2.
+
+    The data goes through os.copy_file_range where the platform has it: the
+    kernel copies without a userspace buffer and can share extents (reflink)
+    on filesystems such as btrfs and XFS. Otherwise shutil.copyfile is used.
+    """
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _scan_archives(forgetting_dir: Path) -> List[Tuple[str, List[os.DirEntry]]]:
+    """Return (archive name, archived files) per archive dir, both sorted by name."""
+    archives = []
+    with os.scandir(forgetting_dir) as subs:
+        for sub in subs:
+            if not sub.is_dir(follow_symlinks=False):
+                continue
+            # DirEntry caches the type from the directory read: no stat per file
+            with os.scandir(sub.path) as entries:
+                files = [f for f in entries if f.is_file(follow_symlinks=False)]
+            files.sort(key=lambda f: f.name)
+            archives.append((sub.name, files))
+    archives.sort(key=lambda a: a[0])
+    return archives
+
+
 class ResurrectCommand:
     """Restore memories from .mem/forgetting/."""
 
@@ -20,7 +72,7 @@ class ResurrectCommand:
         parser.add_argument(
             "path",
             nargs="?",
-            help="Path or pattern to restore (e.g., semantic/user-prefs.md)",
+            help="Path, substring or glob to restore (e.g., semantic/user-prefs.md, episodic/*)",
         )
         parser.add_argument(
             "--list",
@@ -40,13 +92,12 @@ class ResurrectCommand:
             print("No forgotten memories found.")
             return 0
 
+        archives = _scan_archives(forgetting_dir)
         if args.list:
-            for sub in sorted(forgetting_dir.iterdir()):
-                if sub.is_dir():
-                    print(f"\n{sub.name}:")
-                    for f in sorted(sub.glob("*")):
-                        if f.is_file():
-                            print(f"  - {f.name}")
+            for name, files in archives:
+                print(f"\n{name}:")
+                for f in files:
+                    print(f"  - {f.name}")
             return 0
 
         if not args.path:
@@ -55,14 +106,15 @@ class ResurrectCommand:
             print("       agmem resurrect --list")
             return 1
 
-        # Find archived file
+        # Find archived file; archives are named after their path with / as _
         pattern = args.path.replace("/", "_")
-        found = []
-        for sub in forgetting_dir.iterdir():
-            if sub.is_dir():
-                for f in sub.glob("*"):
-                    if f.is_file() and (pattern in f.name or f.name == args.path):
-                        found.append(f)
+        archived_files = [f for _, files in archives for f in files]
+        if any(c in pattern for c in "*?["):
+            # Glob: compile once, then one regex match per archived file
+            regex = re.compile(fnmatch.translate(pattern))
+            found = [f for f in archived_files if regex.match(f.name)]
+        else:
+            found = [f for f in archived_files if pattern in f.name or f.name == args.path]
 
         if not found:
             print(f"No archived memory matching '{args.path}' found.")
@@ -76,7 +128,7 @@ class ResurrectCommand:
             )
             dest = repo.current_dir / orig_path
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(str(archived), str(dest))
+            _fast_copy(archived.path, str(dest))
             print(f"Restored {archived.name} -> {orig_path}")
 
         return 0
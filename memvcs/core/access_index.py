@@ -6,12 +6,15 @@ Stores access log and recall cache in .mem/index.json.
 
 import json
 import hashlib
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 # Maximum entries in access log before compaction
 ACCESS_LOG_MAX = 10_000
+# Cached recall results older than this are ignored (memory files change between runs)
+RECALL_CACHE_TTL_SECONDS = 3600
 
 
 class AccessIndex:
@@ -123,9 +126,11 @@ class AccessIndex:
             counts[p] = counts.get(p, 0) + 1
         return counts
 
-    def get_cache_key(self, context: str, strategy: str, limit: int, exclude: List[str]) -> str:
-        """Compute cache key for recall results."""
-        payload = f"{context}|{strategy}|{limit}|{','.join(sorted(exclude))}"
+    def get_cache_key(
+        self, context: str, strategy: str, limit: int, exclude: List[str], head: str = ""
+    ) -> str:
+        """Compute cache key for recall results; head (HEAD commit hash) ties it to a commit."""
+        payload = f"{context}|{strategy}|{limit}|{','.join(sorted(exclude))}|{head}"
         return hashlib.sha256(payload.encode()).hexdigest()
 
     def get_cached_recall(
@@ -134,12 +139,16 @@ class AccessIndex:
         strategy: str,
         limit: int,
         exclude: List[str],
+        max_age: float = RECALL_CACHE_TTL_SECONDS,
+        head: str = "",
     ) -> Optional[Dict[str, Any]]:
-        """Get cached recall results if available."""
-        key = self.get_cache_key(context, strategy, limit, exclude)
+        """Get cached recall results if available and younger than max_age seconds."""
+        key = self.get_cache_key(context, strategy, limit, exclude, head)
         data = self._load()
-        cache = data.get("recall_cache", {})
-        return cache.get(key)
+        entry = data.get("recall_cache", {}).get(key)
+        if entry is None or time.time() - entry.get("cached_ts", 0) > max_age:
+            return None
+        return entry
 
     def set_cached_recall(
         self,
@@ -148,15 +157,17 @@ class AccessIndex:
         limit: int,
         exclude: List[str],
         results: List[Dict[str, Any]],
+        head: str = "",
     ) -> None:
         """Cache recall results."""
-        key = self.get_cache_key(context, strategy, limit, exclude)
+        key = self.get_cache_key(context, strategy, limit, exclude, head)
         data = self._load()
         if "recall_cache" not in data:
             data["recall_cache"] = {}
         data["recall_cache"][key] = {
             "results": results,
             "cached_at": datetime.utcnow().isoformat() + "Z",
+            "cached_ts": time.time(),
         }
         # Limit cache size
         cache = data["recall_cache"]
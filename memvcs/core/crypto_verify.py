@@ -9,6 +9,7 @@ import hashlib
 import hmac
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple, Any, Dict
 
@@ -204,12 +205,18 @@ def sign_merkle_root(root_hex: str, private_key_pem: bytes) -> str:
     return sig.hex()
 
 
+@lru_cache(maxsize=4)
+def _parse_public_key(public_key_pem: bytes) -> Any:
+    """Parse a PEM public key once per distinct PEM (keyed on content, so never stale)."""
+    return serialization.load_pem_public_key(public_key_pem)
+
+
 def verify_signature(root_hex: str, signature_hex: str, public_key_pem: bytes) -> bool:
     """Verify signature of Merkle root. Returns True if valid."""
     if not ED25519_AVAILABLE:
         return False
     try:
-        key = serialization.load_pem_public_key(public_key_pem)
+        key = _parse_public_key(bytes(public_key_pem))
         if not isinstance(key, Ed25519PublicKey):
             return False
         key.verify(bytes.fromhex(signature_hex), root_hex.encode())
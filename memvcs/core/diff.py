@@ -5,11 +5,11 @@ Compare commits, trees, and files.
 """
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterable, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 
-from .objects import ObjectStore, Commit, Tree, Blob
+from .objects import ObjectStore, Commit, Tree, Blob, hash_object
 
 
 class DiffType(Enum):
@@ -34,6 +34,19 @@ class FileDiff:
     diff_lines: List[str]
 
 
+@dataclass(frozen=True)
+class WorkingBlob:
+    """
+    Working file whose blob hash is already known.
+
+    content is None when the blob is already stored (a stat cache hit); it is
+    then loaded only if the file differs from the commit.
+    """
+
+    blob_hash: str
+    content: Optional[bytes] = None
+
+
 @dataclass
 class TreeDiff:
     """Difference between two trees."""
@@ -42,6 +55,8 @@ class TreeDiff:
     added_count: int
     deleted_count: int
     modified_count: int
+    # Paths whose blob was missing from the object store and could not be diffed
+    missing: List[str] = field(default_factory=list)
 
 
 class DiffEngine:
@@ -134,13 +149,20 @@ class DiffEngine:
 
         return diff_lines
 
-    def diff_trees(self, old_tree_hash: Optional[str], new_tree_hash: Optional[str]) -> TreeDiff:
+    def diff_trees(
+        self,
+        old_tree_hash: Optional[str],
+        new_tree_hash: Optional[str],
+        with_content: bool = True,
+    ) -> TreeDiff:
         """
         Compute diff between two trees.
 
         Args:
             old_tree_hash: Hash of old tree (None for empty)
             new_tree_hash: Hash of new tree (None for empty)
+            with_content: Load blobs and compute line diffs; when False only the
+                paths, hashes and counts are filled in (enough for --stat)
 
         Returns:
             TreeDiff with file differences
@@ -155,14 +177,18 @@ class DiffEngine:
         deleted = 0
         modified = 0
 
+        # Without content, blob loads and line diffs are skipped entirely
+        load = self.get_blob_content if with_content else lambda _: None
+        line_diff = self.compute_line_diff if with_content else lambda _old, _new: []
+
         for path in sorted(all_paths):
             old_hash = old_files.get(path)
             new_hash = new_files.get(path)
 
             if not old_hash and new_hash:
                 # Added
-                new_content = self.get_blob_content(new_hash)
-                diff_lines = self.compute_line_diff(None, new_content)
+                new_content = load(new_hash)
+                diff_lines = line_diff(None, new_content)
 
                 file_diffs.append(
                     FileDiff(
@@ -179,8 +205,8 @@ class DiffEngine:
 
             elif old_hash and not new_hash:
                 # Deleted
-                old_content = self.get_blob_content(old_hash)
-                diff_lines = self.compute_line_diff(old_content, None)
+                old_content = load(old_hash)
+                diff_lines = line_diff(old_content, None)
 
                 file_diffs.append(
                     FileDiff(
@@ -197,9 +223,9 @@ class DiffEngine:
 
             elif old_hash != new_hash:
                 # Modified
-                old_content = self.get_blob_content(old_hash)
-                new_content = self.get_blob_content(new_hash)
-                diff_lines = self.compute_line_diff(old_content, new_content)
+                old_content = load(old_hash)
+                new_content = load(new_hash)
+                diff_lines = line_diff(old_content, new_content)
 
                 file_diffs.append(
                     FileDiff(
@@ -219,7 +245,10 @@ class DiffEngine:
         )
 
     def diff_commits(
-        self, old_commit_hash: Optional[str], new_commit_hash: Optional[str]
+        self,
+        old_commit_hash: Optional[str],
+        new_commit_hash: Optional[str],
+        with_content: bool = True,
     ) -> TreeDiff:
         """
         Compute diff between two commits.
@@ -227,6 +256,7 @@ class DiffEngine:
         Args:
             old_commit_hash: Hash of old commit (None for empty)
             new_commit_hash: Hash of new commit (None for empty)
+            with_content: See diff_trees
 
         Returns:
             TreeDiff with file differences
@@ -244,7 +274,7 @@ class DiffEngine:
             if new_commit:
                 new_tree_hash = new_commit.tree
 
-        return self.diff_trees(old_tree_hash, new_tree_hash)
+        return self.diff_trees(old_tree_hash, new_tree_hash, with_content)
 
     def format_diff(self, tree_diff: TreeDiff, old_ref: str = "a", new_ref: str = "b") -> str:
         """
@@ -296,100 +326,167 @@ class DiffEngine:
 
         return "\n".join(lines)
 
-    def diff_working_dir(self, commit_hash: str, working_files: Dict[str, bytes]) -> TreeDiff:
+    def diff_working_dir(
+        self, commit_hash: str, working_files: Dict[str, Union[bytes, WorkingBlob]]
+    ) -> TreeDiff:
         """
         Compute diff between a commit and working directory.
 
         Args:
             commit_hash: Commit to compare against
-            working_files: Dict mapping paths to file contents
+            working_files: Dict mapping paths to file contents or WorkingBlobs
+
+        Returns:
+            TreeDiff with differences
+        """
+        return self.diff_working_dir_streaming(
+            commit_hash,
+            ((path, lambda c=working_files[path]: c) for path in sorted(working_files)),
+        )
+
+    def diff_working_dir_streaming(
+        self,
+        commit_hash: str,
+        working_files: Iterable[Tuple[str, Callable[[], Union[bytes, WorkingBlob]]]],
+        with_content: bool = True,
+    ) -> TreeDiff:
+        """
+        Compute diff between a commit and a stream of working files.
+
+        Each loader is called once, when its path is reached, and its content is
+        dropped unless the file changed, so only changed files are held in memory.
+
+        Args:
+            commit_hash: Commit to compare against
+            working_files: (path, loader) pairs in sorted path order; a loader
+                returns the file's bytes or a WorkingBlob
+            with_content: See diff_trees; when False, changed blobs are neither
+                loaded nor stored
 
         Returns:
             TreeDiff with differences
         """
-        # Get commit files
         commit = Commit.load(self.object_store, commit_hash)
         if not commit:
             return TreeDiff(files=[], added_count=0, deleted_count=0, modified_count=0)
 
         commit_files = self.get_tree_files(commit.tree)
+        commit_paths = sorted(commit_files)
 
         file_diffs = []
-        added = 0
-        deleted = 0
-        modified = 0
-
-        all_paths = set(commit_files.keys()) | set(working_files.keys())
-
-        for path in sorted(all_paths):
-            commit_hash_id = commit_files.get(path)
-            working_content = working_files.get(path)
-
-            # Compute working file hash
-            working_hash = None
-            if working_content is not None:
-                blob = Blob(content=working_content)
-                working_hash = blob.store(self.object_store)
-
-            if not commit_hash_id and working_hash:
-                # Added
-                new_content = (
-                    working_content.decode("utf-8", errors="replace") if working_content else None
-                )
-                diff_lines = self.compute_line_diff(None, new_content)
+        missing = []
+        pos = 0
 
+        # Merge-join the sorted commit paths with the sorted working stream
+        for path, load in working_files:
+            while pos < len(commit_paths) and commit_paths[pos] < path:
                 file_diffs.append(
-                    FileDiff(
-                        path=path,
-                        diff_type=DiffType.ADDED,
-                        old_hash=None,
-                        new_hash=working_hash,
-                        old_content=None,
-                        new_content=new_content,
-                        diff_lines=diff_lines,
-                    )
+                    self._working_file_diff(commit_paths[pos], commit_files, None, with_content)
                 )
-                added += 1
-
-            elif commit_hash_id and not working_hash:
-                # Deleted
-                old_content = self.get_blob_content(commit_hash_id)
-                diff_lines = self.compute_line_diff(old_content, None)
+                pos += 1
+            if pos < len(commit_paths) and commit_paths[pos] == path:
+                pos += 1
+            file_diff = self._working_file_diff(
+                path, commit_files, load(), with_content, missing
+            )
+            if file_diff:
+                file_diffs.append(file_diff)
+        for path in commit_paths[pos:]:
+            file_diffs.append(self._working_file_diff(path, commit_files, None, with_content))
 
-                file_diffs.append(
-                    FileDiff(
-                        path=path,
-                        diff_type=DiffType.DELETED,
-                        old_hash=commit_hash_id,
-                        new_hash=None,
-                        old_content=old_content,
-                        new_content=None,
-                        diff_lines=diff_lines,
-                    )
-                )
-                deleted += 1
+        return TreeDiff(
+            files=file_diffs,
+            added_count=sum(1 for f in file_diffs if f.diff_type == DiffType.ADDED),
+            deleted_count=sum(1 for f in file_diffs if f.diff_type == DiffType.DELETED),
+            modified_count=sum(1 for f in file_diffs if f.diff_type == DiffType.MODIFIED),
+            missing=missing,
+        )
 
-            elif commit_hash_id != working_hash:
-                # Modified
-                old_content = self.get_blob_content(commit_hash_id)
-                new_content = (
-                    working_content.decode("utf-8", errors="replace") if working_content else None
-                )
-                diff_lines = self.compute_line_diff(old_content, new_content)
+    def _working_file_diff(
+        self,
+        path: str,
+        commit_files: Dict[str, str],
+        working_content: Union[bytes, WorkingBlob, None],
+        with_content: bool = True,
+        missing: Optional[List[str]] = None,
+    ) -> Optional[FileDiff]:
+        """
+        Diff one working file against the commit's blob; None if unchanged.
 
-                file_diffs.append(
-                    FileDiff(
-                        path=path,
-                        diff_type=DiffType.MODIFIED,
-                        old_hash=commit_hash_id,
-                        new_hash=working_hash,
-                        old_content=old_content,
-                        new_content=new_content,
-                        diff_lines=diff_lines,
-                    )
-                )
-                modified += 1
+        A WorkingBlob whose blob is not in the object store is skipped (None) and
+        its path appended to missing, rather than diffed as an emptied file.
+        """
+        commit_hash_id = commit_files.get(path)
+        load = self.get_blob_content if with_content else lambda _: None
+        line_diff = self.compute_line_diff if with_content else lambda _old, _new: []
+
+        # Compute working file hash
+        working_hash = None
+        if isinstance(working_content, WorkingBlob):
+            working_hash = working_content.blob_hash
+            if working_hash == commit_hash_id:
+                return None
+            if not with_content:
+                working_content = None
+            elif working_content.content is not None:
+                working_content = working_content.content
+                Blob(content=working_content).store(self.object_store)
+            else:
+                blob = Blob.load(self.object_store, working_hash)
+                if blob is None:
+                    if missing is not None:
+                        missing.append(path)
+                    return None
+                working_content = blob.content
+        elif working_content is not None:
+            if with_content:
+                working_hash = Blob(content=working_content).store(self.object_store)
+            else:
+                working_hash = hash_object(working_content, "blob")
+                working_content = None
+
+        if not commit_hash_id and working_hash:
+            # Added
+            new_content = (
+                working_content.decode("utf-8", errors="replace") if working_content else None
+            )
+            return FileDiff(
+                path=path,
+                diff_type=DiffType.ADDED,
+                old_hash=None,
+                new_hash=working_hash,
+                old_content=None,
+                new_content=new_content,
+                diff_lines=line_diff(None, new_content),
+            )
+
+        if commit_hash_id and not working_hash:
+            # Deleted
+            old_content = load(commit_hash_id)
+            return FileDiff(
+                path=path,
+                diff_type=DiffType.DELETED,
+                old_hash=commit_hash_id,
+                new_hash=None,
+                old_content=old_content,
+                new_content=None,
+                diff_lines=line_diff(old_content, None),
+            )
+
+        if commit_hash_id != working_hash:
+            # Modified
+            old_content = load(commit_hash_id)
+            new_content = (
+                working_content.decode("utf-8", errors="replace") if working_content else None
+            )
+            return FileDiff(
+                path=path,
+                diff_type=DiffType.MODIFIED,
+                old_hash=commit_hash_id,
+                new_hash=working_hash,
+                old_content=old_content,
+                new_content=new_content,
+                diff_lines=line_diff(old_content, new_content),
+            )
 
-        return TreeDiff(
-            files=file_diffs, added_count=added, deleted_count=deleted, modified_count=modified
-        )
+        return None
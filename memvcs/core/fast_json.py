@@ -0,0 +1,32 @@
+"""
+JSON helpers for agmem's metadata files (config, staging index, caches).
+
+Uses orjson when installed (pip install agmem[fastjson]) and falls back to the
+standard library otherwise. Both work on bytes, so callers read and write files
+with read_bytes()/write_bytes() and skip the text decode/encode. Not for object
+serialization: tree and commit bytes feed content hashes and must stay stable.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str. Raises ValueError on invalid input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, indented by two spaces if indent is set."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
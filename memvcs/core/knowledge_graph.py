@@ -7,10 +7,12 @@ Visualizes connections between memory files to spot contradictions or knowledge
 import re
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+from . import fast_json
+
 try:
     import networkx as nx
 
@@ -18,6 +20,9 @@ try:
 except ImportError:
     NETWORKX_AVAILABLE = False
 
+# Embedding rows per block of the similarity matrix product
+SIMILARITY_BLOCK_ROWS = 512
+
 
 @dataclass
 class GraphNode:
@@ -72,7 +77,10 @@ class KnowledgeGraphData:
             "metadata": self.metadata,
         }
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: int = 2, compact: bool = False) -> str:
+        """Serialize to JSON; compact output (no whitespace) is for piping to other tools."""
+        if compact:
+            return fast_json.dumps(self.to_dict()).decode("utf-8")
         return json.dumps(self.to_dict(), indent=indent)
 
 
@@ -112,6 +120,12 @@ class KnowledgeGraphBuilder:
         self._graph = None
         if NETWORKX_AVAILABLE:
             self._graph = nx.DiGraph()
+        # Kept from the last build_graph for find_potential_contradictions
+        self._topic_pairs: Set[Tuple[str, str]] = set()
+        self._embedding_rows: Dict[str, int] = {}
+        self._embeddings = None
+        # Kept from the last build_graph for find_isolated_nodes
+        self._isolated: List[str] = []
 
     def _detect_memory_type(self, filepath: str) -> str:
         """Detect memory type from file path."""
@@ -194,113 +208,164 @@ class KnowledgeGraphBuilder:
         """
         nodes = []
         edges = []
-        file_paths = []
         file_contents = {}
         file_tags = defaultdict(list)
 
         # Collect all memory files
-        if not self.current_dir.exists():
-            return KnowledgeGraphData(nodes=[], edges=[])
+        for rel_path, stem, content, tags in self._collect_files():
+            node = GraphNode(
+                id=rel_path,
+                label=stem,
+                memory_type=self._detect_memory_type(rel_path),
+                size=len(content),
+                tags=tags,
+            )
+            nodes.append(node)
+            file_contents[rel_path] = content
+
+            # Index tags
+            for tag in tags:
+                file_tags[tag].append(rel_path)
+
+            # Add to NetworkX graph if available
+            if self._graph is not None:
+                self._graph.add_node(rel_path, **node.to_dict())
+
+        for source, target, edge_type, weight in self._iter_edges(
+            file_contents, file_tags, include_similarity, similarity_threshold
+        ):
+            edges.append(
+                GraphEdge(source=source, target=target, edge_type=edge_type, weight=weight)
+            )
+
+            if self._graph is not None:
+                self._graph.add_edge(source, target, type=edge_type, weight=weight)
+
+        edge_type_counts = defaultdict(int)
+        connected = set()
+        for e in edges:
+            edge_type_counts[e.edge_type] += 1
+            connected.add(e.source)
+            connected.add(e.target)
+        metadata = self._build_metadata([n.memory_type for n in nodes], edge_type_counts)
+        self._isolated = [n.id for n in nodes if n.id not in connected]
 
+        return KnowledgeGraphData(nodes=nodes, edges=edges, metadata=metadata)
+
+    def build_summary(
+        self, include_similarity: bool = False, similarity_threshold: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Graph metadata as in build_graph, plus "isolated": paths with no connections.
+
+        Only counts edges: no node or edge records and no networkx graph are built,
+        so this suits text summaries of large repositories.
+        """
+        memory_types = []
+        file_contents = {}
+        file_tags = defaultdict(list)
+        for rel_path, _, content, tags in self._collect_files():
+            memory_types.append(self._detect_memory_type(rel_path))
+            file_contents[rel_path] = content
+            for tag in tags:
+                file_tags[tag].append(rel_path)
+
+        edge_type_counts = defaultdict(int)
+        connected = set()
+        for source, target, edge_type, _ in self._iter_edges(
+            file_contents, file_tags, include_similarity, similarity_threshold
+        ):
+            edge_type_counts[edge_type] += 1
+            connected.add(source)
+            connected.add(target)
+
+        metadata = self._build_metadata(memory_types, edge_type_counts)
+        metadata["isolated"] = [path for path in file_contents if path not in connected]
+        return metadata
+
+    def _collect_files(self) -> List[Tuple[str, str, str, List[str]]]:
+        """Read memory files as (path relative to current/, stem, content, tags)."""
+        self._topic_pairs = set()
+        self._embedding_rows = {}
+        self._embeddings = None
+
+        files = []
+        if not self.current_dir.exists():
+            return files
         for memory_file in self.current_dir.glob("**/*.md"):
             try:
                 rel_path = str(memory_file.relative_to(self.current_dir))
                 content = memory_file.read_text()
-
-                # Create node
-                memory_type = self._detect_memory_type(rel_path)
                 tags = self._extract_tags_from_frontmatter(content)
-
-                node = GraphNode(
-                    id=rel_path,
-                    label=memory_file.stem,
-                    memory_type=memory_type,
-                    size=len(content),
-                    tags=tags,
-                )
-                nodes.append(node)
-                file_paths.append(rel_path)
-                file_contents[rel_path] = content
-
-                # Index tags
-                for tag in tags:
-                    file_tags[tag].append(rel_path)
-
-                # Add to NetworkX graph if available
-                if self._graph is not None:
-                    self._graph.add_node(rel_path, **node.to_dict())
-
+                files.append((rel_path, memory_file.stem, content, tags))
             except Exception:
                 continue
-
-        # Add wikilink edges
+        return files
+
+    def _iter_edges(
+        self,
+        file_contents: Dict[str, str],
+        file_tags: Dict[str, List[str]],
+        include_similarity: bool,
+        similarity_threshold: float,
+    ) -> Iterator[Tuple[str, str, str, float]]:
+        """Yield (source, target, edge_type, weight) for every detected connection."""
+        # Wikilink edges
         for source_path, content in file_contents.items():
             links = self._extract_wikilinks(content)
             for target in links:
                 target_path = self._normalize_link_target(target, source_path)
                 if target_path and target_path in file_contents:
-                    edge = GraphEdge(
-                        source=source_path, target=target_path, edge_type="reference", weight=1.0
-                    )
-                    edges.append(edge)
+                    yield source_path, target_path, "reference", 1.0
 
-                    if self._graph is not None:
-                        self._graph.add_edge(source_path, target_path, type="reference", weight=1.0)
-
-        # Add tag-based edges
+        # Tag-based edges
         for tag, files in file_tags.items():
             if len(files) > 1:
                 for i, file1 in enumerate(files):
                     for file2 in files[i + 1 :]:
-                        edge = GraphEdge(
-                            source=file1, target=file2, edge_type="same_topic", weight=0.5
-                        )
-                        edges.append(edge)
-
-                        if self._graph is not None:
-                            self._graph.add_edge(file1, file2, type="same_topic", weight=0.5)
+                        self._topic_pairs.add((file1, file2))
+                        yield file1, file2, "same_topic", 0.5
 
-        # Add similarity edges
-        if include_similarity and self.vector_store and len(file_paths) > 1:
+        # Similarity edges
+        if include_similarity and self.vector_store and len(file_contents) > 1:
             try:
-                edges.extend(
-                    self._build_similarity_edges(file_paths, file_contents, similarity_threshold)
-                )
+                yield from self._similarity_edges(file_contents, similarity_threshold)
             except Exception:
                 pass  # Skip similarity if vector store fails
 
-        # Add co-occurrence edges (files sharing entities)
+        # Co-occurrence edges (files sharing entities)
         try:
-            edges.extend(self._build_cooccurrence_edges(file_paths, file_contents))
+            yield from self._cooccurrence_edges(file_contents)
         except Exception:
             pass
 
-        # Add causal edges (phrases like "caused by", "because of" linking to another file)
+        # Causal edges (phrases like "caused by", "because of" linking to another file)
         try:
-            edges.extend(self._build_causal_edges(file_contents))
+            yield from self._causal_edges(file_contents)
         except Exception:
             pass
 
-        # Build metadata
-        edge_type_counts = defaultdict(int)
-        for e in edges:
-            edge_type_counts[e.edge_type] += 1
-        metadata = {
-            "total_nodes": len(nodes),
-            "total_edges": len(edges),
+    @staticmethod
+    def _build_metadata(
+        memory_types: List[str], edge_type_counts: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Summary counts shared by build_graph and build_summary."""
+        type_counts = defaultdict(int)
+        for memory_type in memory_types:
+            type_counts[memory_type] += 1
+        known = ("episodic", "semantic", "procedural")
+        return {
+            "total_nodes": len(memory_types),
+            "total_edges": sum(edge_type_counts.values()),
             "memory_types": {
-                "episodic": sum(1 for n in nodes if n.memory_type == "episodic"),
-                "semantic": sum(1 for n in nodes if n.memory_type == "semantic"),
-                "procedural": sum(1 for n in nodes if n.memory_type == "procedural"),
-                "other": sum(
-                    1 for n in nodes if n.memory_type not in ["episodic", "semantic", "procedural"]
-                ),
+                "episodic": type_counts["episodic"],
+                "semantic": type_counts["semantic"],
+                "procedural": type_counts["procedural"],
+                "other": sum(c for t, c in type_counts.items() if t not in known),
             },
             "edge_types": dict(edge_type_counts),
         }
 
-        return KnowledgeGraphData(nodes=nodes, edges=edges, metadata=metadata)
-
     def _extract_entities_simple(self, content: str) -> Set[str]:
         """Extract simple entity tokens (capitalized words, key phrases) for co-occurrence."""
         entities = set()
@@ -312,30 +377,25 @@ class KnowledgeGraphBuilder:
                 entities.add(phrase)
         return entities
 
-    def _build_cooccurrence_edges(
-        self, file_paths: List[str], file_contents: Dict[str, str]
-    ) -> List[GraphEdge]:
-        """Build edges between files that share at least one entity (co-occurrence)."""
+    def _cooccurrence_edges(
+        self, file_contents: Dict[str, str]
+    ) -> List[Tuple[str, str, str, float]]:
+        """Edges between files that share at least one entity (co-occurrence)."""
         file_entities: Dict[str, Set[str]] = {}
         for path, content in file_contents.items():
             file_entities[path] = self._extract_entities_simple(content)
         edges = []
-        paths_list = list(file_paths)
+        paths_list = list(file_contents)
         for i, path1 in enumerate(paths_list):
             for path2 in paths_list[i + 1 :]:
                 common = file_entities.get(path1, set()) & file_entities.get(path2, set())
                 if common:
                     w = min(1.0, 0.3 + 0.1 * len(common))
-                    edge = GraphEdge(
-                        source=path1, target=path2, edge_type="co_occurrence", weight=w
-                    )
-                    edges.append(edge)
-                    if self._graph is not None:
-                        self._graph.add_edge(path1, path2, type="co_occurrence", weight=w)
+                    edges.append((path1, path2, "co_occurrence", w))
         return edges
 
-    def _build_causal_edges(self, file_contents: Dict[str, str]) -> List[GraphEdge]:
-        """Build edges when content has causal phrases linking to another file (e.g. caused by [[X]])."""
+    def _causal_edges(self, file_contents: Dict[str, str]) -> List[Tuple[str, str, str, float]]:
+        """Edges where content has causal phrases linking to another file (caused by [[X]])."""
         causal_phrases = re.compile(
             r"(?:caused by|because of|led to|due to)\s+(?:\[\[([^\]]+)\]\]|(\w+))",
             re.IGNORECASE,
@@ -348,91 +408,106 @@ class KnowledgeGraphBuilder:
                     continue
                 target_path = self._normalize_link_target(target.strip(), source_path)
                 if target_path and target_path in file_contents and target_path != source_path:
-                    edge = GraphEdge(
-                        source=source_path, target=target_path, edge_type="causal", weight=0.7
-                    )
-                    edges.append(edge)
-                    if self._graph is not None:
-                        self._graph.add_edge(source_path, target_path, type="causal", weight=0.7)
+                    edges.append((source_path, target_path, "causal", 0.7))
         return edges
 
-    def _build_similarity_edges(
-        self, file_paths: List[str], file_contents: Dict[str, str], threshold: float
-    ) -> List[GraphEdge]:
-        """Build edges based on semantic similarity."""
-        edges = []
-
-        # Get embeddings for all files
-        embeddings = {}
-        for path, content in file_contents.items():
-            try:
-                # Use first 2000 chars for efficiency
-                truncated = content[:2000]
-                emb = self.vector_store._embed(truncated)
-                embeddings[path] = emb
-            except Exception:
-                continue
-
-        # Compute pairwise similarities
-        import math
-
-        def cosine_similarity(a: List[float], b: List[float]) -> float:
-            dot = sum(x * y for x, y in zip(a, b))
-            norm_a = math.sqrt(sum(x * x for x in a))
-            norm_b = math.sqrt(sum(x * x for x in b))
-            if norm_a == 0 or norm_b == 0:
-                return 0
-            return dot / (norm_a * norm_b)
-
-        paths_list = list(embeddings.keys())
-        for i, path1 in enumerate(paths_list):
-            for path2 in paths_list[i + 1 :]:
-                sim = cosine_similarity(embeddings[path1], embeddings[path2])
-                if sim >= threshold:
-                    edge = GraphEdge(source=path1, target=path2, edge_type="similarity", weight=sim)
-                    edges.append(edge)
-
-                    if self._graph is not None:
-                        self._graph.add_edge(path1, path2, type="similarity", weight=sim)
+    def _similarity_edges(
+        self, file_contents: Dict[str, str], threshold: float
+    ) -> List[Tuple[str, str, str, float]]:
+        """Edges based on semantic similarity."""
+        paths_list = list(file_contents)
+        # One batched model call; first 2000 chars of each file for efficiency
+        embeddings = self.vector_store.embed_many([file_contents[p][:2000] for p in paths_list])
+        self._embedding_rows = {path: i for i, path in enumerate(paths_list)}
+        self._embeddings = embeddings
+
+        return [
+            (paths_list[i], paths_list[j], "similarity", sim)
+            for i, j, sim in self._similarity_edges_batched(embeddings, threshold)
+        ]
+
+    @staticmethod
+    def _similarity_edges_batched(embeddings, threshold: float) -> List[Tuple[int, int, float]]:
+        """
+        Return (i, j, similarity) for row pairs i < j at or above threshold.
 
-        return edges
+        Rows must be L2-normalized. Uses one NumPy matrix product when NumPy is
+        installed (it is whenever sentence-transformers is), else plain dot products.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            rows = [list(e) for e in embeddings]
+            return [
+                (i, j, sim)
+                for i in range(len(rows))
+                for j in range(i + 1, len(rows))
+                if (sim := sum(x * y for x, y in zip(rows[i], rows[j]))) >= threshold
+            ]
+
+        # Row blocks of the upper triangle: peak memory is one block x N, not N x N
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        pairs = []
+        for start in range(0, len(matrix), SIMILARITY_BLOCK_ROWS):
+            block = matrix[start : start + SIMILARITY_BLOCK_ROWS] @ matrix[start:].T
+            rows, cols = np.nonzero(np.triu(block >= threshold, k=1))
+            sims = block[rows, cols].tolist()
+            pairs.extend(
+                (start + i, start + j, sim) for i, j, sim in zip(rows.tolist(), cols.tolist(), sims)
+            )
+        return pairs
 
     def find_isolated_nodes(self) -> List[str]:
-        """Find nodes with no connections (knowledge islands)."""
-        if self._graph is None or len(self._graph) == 0:
-            return []
+        """
+        Find nodes with no connections (knowledge islands).
 
-        # Convert to undirected for analysis
-        undirected = self._graph.to_undirected()
-        return [node for node in undirected.nodes() if undirected.degree(node) == 0]
+        Taken from the edges of the last build_graph, as build_summary does, so the
+        result does not depend on networkx being installed.
+        """
+        return list(self._isolated)
 
-    def find_potential_contradictions(self) -> List[Tuple[str, str, float]]:
+    def find_potential_contradictions(self, threshold: float = 0.3) -> List[Tuple[str, str, float]]:
         """
         Find files that might have contradictory information.
 
-        Returns files in the same topic cluster with low similarity.
+        Returns pairs of files sharing a tag (same topic) whose embeddings have
+        similarity below threshold, least similar first. Needs a preceding
+        build_graph with similarity enabled; otherwise returns [].
         """
-        if self._graph is None:
+        if self._embeddings is None or not self._topic_pairs:
             return []
 
-        contradictions = []
+        rows = self._embedding_rows
+        pairs = [(u, v) for u, v in self._topic_pairs if u in rows and v in rows]
+        sims = self._pair_similarities([(rows[u], rows[v]) for u, v in pairs])
+        found = [(u, v, sim) for (u, v), sim in zip(pairs, sims) if sim < threshold]
+        found.sort(key=lambda item: item[2])
+        return found
+
+    def _pair_similarities(self, index_pairs: List[Tuple[int, int]]) -> List[float]:
+        """Dot products of the given embedding row pairs (cosine similarity for unit rows)."""
+        if not index_pairs:
+            return []
+        try:
+            import numpy as np
+        except ImportError:
+            emb = self._embeddings
+            return [sum(x * y for x, y in zip(emb[i], emb[j])) for i, j in index_pairs]
 
-        # Files connected by same_topic but with low similarity
-        for u, v, data in self._graph.edges(data=True):
-            if data.get("type") == "same_topic":
-                # Check if there's also a similarity edge
-                sim_edge = self._graph.get_edge_data(u, v)
-                if sim_edge and sim_edge.get("type") == "similarity":
-                    if sim_edge.get("weight", 1.0) < 0.3:
-                        contradictions.append((u, v, sim_edge.get("weight", 0)))
+        matrix = np.asarray(self._embeddings, dtype=np.float32)
+        left, right = (np.fromiter(side, dtype=np.intp) for side in zip(*index_pairs))
+        return np.einsum("ij,ij->i", matrix[left], matrix[right]).tolist()
 
-        return contradictions
+    def export_for_d3(self, graph_data: Optional[KnowledgeGraphData] = None) -> str:
+        """Export graph in D3.js force-graph format (builds the graph unless given)."""
+        return json.dumps(self.d3_format(graph_data), indent=2)
 
-    def export_for_d3(self) -> str:
-        """Export graph in D3.js force-graph format."""
-        graph_data = self.build_graph()
+    def d3_format(self, graph_data: Optional[KnowledgeGraphData] = None) -> Dict[str, Any]:
+        """Return the D3.js force-graph structure (builds the graph unless given)."""
+        if graph_data is None:
+            graph_data = self.build_graph()
 
-        d3_format = {
+        return {
             "nodes": [
                 {
                     "id": n.id,
@@ -447,5 +522,3 @@ class KnowledgeGraphBuilder:
                 for e in graph_data.edges
             ],
         }
-
-        return json.dumps(d3_format, indent=2)
@@ -7,7 +7,7 @@ Implements memory-type-aware merging strategies with frontmatter support.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -76,27 +76,37 @@ class MergeEngine:
         # Default to semantic for unknown types
         return MergeStrategy.SEMANTIC
 
-    def find_common_ancestor(self, commit1: str, commit2: str) -> Optional[str]:
+    def first_parent_ancestors(self, commit_hash: str) -> Set[str]:
+        """Return commit_hash and every commit on its first-parent chain."""
+        ancestors = set()
+        current = commit_hash
+
+        while current:
+            ancestors.add(current)
+            commit = Commit.load(self.object_store, current)
+            if not commit or not commit.parents:
+                break
+            current = commit.parents[0]  # Follow first parent
+
+        return ancestors
+
+    def find_common_ancestor(
+        self, commit1: str, commit2: str, ancestors1: Optional[Set[str]] = None
+    ) -> Optional[str]:
         """
         Find the common ancestor of two commits.
 
         Args:
             commit1: First commit hash
             commit2: Second commit hash
+            ancestors1: first_parent_ancestors(commit1), if already computed
 
         Returns:
             Common ancestor commit hash or None
         """
         # Build ancestor chain for commit1
-        ancestors1 = set()
-        current = commit1
-
-        while current:
-            ancestors1.add(current)
-            commit = Commit.load(self.object_store, current)
-            if not commit or not commit.parents:
-                break
-            current = commit.parents[0]  # Follow first parent
+        if ancestors1 is None:
+            ancestors1 = self.first_parent_ancestors(commit1)
 
         # Walk back from commit2 and find first common ancestor
         current = commit2
@@ -7,10 +7,12 @@ Implements Git-style content-addressable storage with blob, tree, and commit obj
 import hashlib
 import json
 import os
+import threading
 import zlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Iterable, List, Any, Set, Union
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
 
@@ -21,14 +23,66 @@ def _valid_object_hash(hash_id: str) -> bool:
     return all(c in "0123456789abcdef" for c in hash_id.lower())
 
 
+# Retrieved commits/trees kept in memory per store (LRU); objects are immutable once stored.
+# Blobs are always read from disk so integrity checks see tampered content.
+OBJECT_CACHE_SIZE = 1024
+OBJECT_CACHE_TYPES = frozenset({"commit", "tree"})
+# Objects larger than this are never cached, to bound memory
+OBJECT_CACHE_MAX_BYTES = 1024 * 1024
+
+
+def hash_object(content: Union[bytes, memoryview], obj_type: str) -> str:
+    """
+    Return the object ID of content: SHA-256 of a "<type> <size>\\0" header and the content.
+
+    The header and content are fed to the digest separately, so buffers (such
+    as memoryviews of a reused read buffer) are hashed without being copied.
+    """
+    digest = hashlib.sha256(f"{obj_type} {len(content)}\0".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
 class ObjectStore:
     """Content-addressable object storage system."""
 
-    def __init__(self, objects_dir: Path, encryptor: Optional[Any] = None):
+    def __init__(
+        self,
+        objects_dir: Path,
+        encryptor: Optional[Any] = None,
+        cache_size: int = OBJECT_CACHE_SIZE,
+    ):
         self.objects_dir = Path(objects_dir)
         self._encryptor = encryptor
+        self._cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._cache_size = cache_size
+        # Stores are shared by worker threads (staging, fsck); LRU updates must not interleave
+        self._cache_lock = threading.Lock()
         self._ensure_directories()
 
+    def _cache_get(self, hash_id: str, obj_type: str) -> Optional[bytes]:
+        """Return cached content and mark it most recently used."""
+        key = (obj_type, hash_id)
+        with self._cache_lock:
+            content = self._cache.get(key)
+            if content is not None:
+                self._cache.move_to_end(key)
+        return content
+
+    def _cache_put(self, hash_id: str, obj_type: str, content: bytes) -> None:
+        """Cache retrieved content, evicting the least recently used entry when full."""
+        if (
+            self._cache_size <= 0
+            or obj_type not in OBJECT_CACHE_TYPES
+            or len(content) > OBJECT_CACHE_MAX_BYTES
+        ):
+            return
+        with self._cache_lock:
+            self._cache[(obj_type, hash_id)] = content
+            self._cache.move_to_end((obj_type, hash_id))
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
     def _ensure_directories(self):
         """Create object storage directories."""
         for obj_type in ["blob", "tree", "commit", "tag"]:
@@ -42,12 +96,6 @@ class ObjectStore:
         suffix = hash_id[2:]
         return self.objects_dir / obj_type / prefix / suffix
 
-    def _compute_hash(self, content: bytes, obj_type: str) -> str:
-        """Compute SHA-256 hash of content with type header."""
-        header = f"{obj_type} {len(content)}\0".encode()
-        full_content = header + content
-        return hashlib.sha256(full_content).hexdigest()
-
     def store(self, content: bytes, obj_type: str) -> str:
         """
         Store content and return its hash ID.
@@ -59,7 +107,7 @@ class ObjectStore:
         Returns:
             SHA-256 hash ID of stored object
         """
-        hash_id = self._compute_hash(content, obj_type)
+        hash_id = hash_object(content, obj_type)
         obj_path = self._get_object_path(hash_id, obj_type)
 
         # Don't store if already exists (deduplication)
@@ -94,6 +142,10 @@ class ObjectStore:
         """
         obj_path = self._get_object_path(hash_id, obj_type)
 
+        cached = self._cache_get(hash_id, obj_type)
+        if cached is not None:
+            return cached
+
         if obj_path.exists():
             raw = obj_path.read_bytes()
             # Optionally decrypt (iv+tag minimum 12+16 bytes)
@@ -105,6 +157,7 @@ class ObjectStore:
             full_content = zlib.decompress(raw)
             null_idx = full_content.index(b"\0")
             content = full_content[null_idx + 1 :]
+            self._cache_put(hash_id, obj_type, content)
             return content
 
         # Try pack file when loose object missing
@@ -113,6 +166,7 @@ class ObjectStore:
 
             result = retrieve_from_pack(self.objects_dir, hash_id, expected_type=obj_type)
             if result is not None:
+                self._cache_put(hash_id, obj_type, result[1])
                 return result[1]
         except Exception:
             pass
@@ -132,9 +186,34 @@ class ObjectStore:
         except Exception:
             return False
 
+    def exists_many(self, hash_ids: Iterable[str], obj_type: str) -> Set[str]:
+        """
+        Return the subset of hash_ids present as objects of obj_type (loose or pack).
+
+        Lists each prefix directory once instead of stat-ing every object path;
+        invalid hashes are treated as missing.
+        """
+        present = set()
+        listings: Dict[str, Set[str]] = {}
+        type_dir = self.objects_dir / obj_type
+        for hash_id in set(hash_ids):
+            if not _valid_object_hash(hash_id):
+                continue
+            prefix = hash_id[:2]
+            if prefix not in listings:
+                try:
+                    listings[prefix] = set(os.listdir(type_dir / prefix))
+                except OSError:
+                    listings[prefix] = set()
+            if hash_id[2:] in listings[prefix] or self.exists(hash_id, obj_type):
+                present.add(hash_id)
+        return present
+
     def delete(self, hash_id: str, obj_type: str) -> bool:
         """Delete an object. Returns True if deleted, False if not found."""
         obj_path = self._get_object_path(hash_id, obj_type)
+        with self._cache_lock:
+            self._cache.pop((obj_type, hash_id), None)
         if obj_path.exists():
             obj_path.unlink()
             # Clean up empty parent directories
@@ -200,6 +279,7 @@ class Tree:
     """Tree object for storing directory structure."""
 
     entries: List[TreeEntry]
+    _index: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -239,6 +319,18 @@ class Tree:
         ]
         return Tree(entries=entries)
 
+    def index(self) -> Dict[str, str]:
+        """
+        Map full entry paths (path/name) to blob hashes.
+
+        Built on first use and cached; entries must not be mutated afterwards.
+        """
+        if self._index is None:
+            self._index = {
+                (e.path + "/" + e.name if e.path else e.name): e.hash for e in self.entries
+            }
+        return self._index
+
     def get_entry(self, name: str) -> Optional[TreeEntry]:
         """Get an entry by name."""
         for entry in self.entries:
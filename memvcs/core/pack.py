@@ -7,7 +7,9 @@ Includes delta encoding for similar objects (5-10x compression for similar conte
 
 import bisect
 import hashlib
+import os
 import struct
+import time
 import zlib
 from pathlib import Path
 from typing import Set, Dict, List, Optional, Tuple
@@ -33,38 +35,43 @@ TYPE_TO_BYTE = {
     "delta": OBJ_TYPE_DELTA,
 }
 BYTE_TO_TYPE = {v: k for k, v in TYPE_TO_BYTE.items()}
+# Lazy sweep: run_gc records unreachable objects here; run_repack frees them
+SWEEP_DIR = "gc"
+SWEEP_MANIFEST_PREFIX = "unmarked-"
 
 
 def _pack_dir(objects_dir: Path) -> Path:
     return objects_dir / "pack"
 
 
-def _get_loose_object_type(objects_dir: Path, hash_id: str) -> Optional[str]:
-    """Return obj_type for a loose object, or None if not found."""
-    if len(hash_id) < 4:
-        return None
-    prefix, suffix = hash_id[:2], hash_id[2:]
+def _scan_loose_objects(objects_dir: Path) -> Dict[str, Tuple[str, str]]:
+    """
+    Map every loose object hash to (obj_type, file path) in one scandir walk.
+
+    Type and path come from the directory layout, so callers need no per-object
+    existence probes. If a hash is stored under several types the first of
+    blob, tree, commit, tag wins.
+    """
+    found: Dict[str, Tuple[str, str]] = {}
     for obj_type in ["blob", "tree", "commit", "tag"]:
-        p = objects_dir / obj_type / prefix / suffix
-        if p.exists():
-            return obj_type
-    return None
+        try:
+            with os.scandir(objects_dir / obj_type) as shards:
+                prefix_dirs = [(e.name, e.path) for e in shards if e.is_dir()]
+        except OSError:
+            continue
+        for prefix, prefix_path in prefix_dirs:
+            try:
+                with os.scandir(prefix_path) as it:
+                    for entry in it:
+                        found.setdefault(prefix + entry.name, (obj_type, entry.path))
+            except OSError:
+                continue
+    return found
 
 
 def list_loose_objects(objects_dir: Path) -> Set[str]:
     """List all loose object hashes (blob, tree, commit, tag)."""
-    hashes = set()
-    for obj_type in ["blob", "tree", "commit", "tag"]:
-        type_dir = objects_dir / obj_type
-        if not type_dir.exists():
-            continue
-        for prefix_dir in type_dir.iterdir():
-            if not prefix_dir.is_dir():
-                continue
-            for f in prefix_dir.iterdir():
-                hash_id = prefix_dir.name + f.name
-                hashes.add(hash_id)
-    return hashes
+    return set(_scan_loose_objects(objects_dir))
 
 
 def reachable_from_refs(mem_dir: Path, store: ObjectStore, gc_prune_days: int = 90) -> Set[str]:
@@ -101,31 +108,89 @@ def _collect_from_commit(store: ObjectStore, commit_hash: str) -> Set[str]:
 
 
 def run_gc(
-    mem_dir: Path, store: ObjectStore, gc_prune_days: int = 90, dry_run: bool = False
+    mem_dir: Path,
+    store: ObjectStore,
+    gc_prune_days: int = 90,
+    dry_run: bool = False,
+    lazy_sweep: bool = False,
 ) -> Tuple[int, int]:
     """
     Garbage collect: delete unreachable loose objects.
     Returns (deleted_count, bytes_freed). dry_run: only report, do not delete.
+    lazy_sweep: record the unreachable objects in a sweep manifest instead of
+    deleting them; the next run_repack frees them (see sweep_unmarked).
     """
-    loose = list_loose_objects(mem_dir / "objects")
+    loose = _scan_loose_objects(mem_dir / "objects")
     reachable = reachable_from_refs(mem_dir, store, gc_prune_days)
-    to_delete = loose - reachable
+    to_delete = loose.keys() - reachable
     freed = 0
+    unmarked: List[str] = []
     for hash_id in to_delete:
-        # Resolve type from path
-        for obj_type in ["blob", "tree", "commit", "tag"]:
-            p = store.objects_dir / obj_type / hash_id[:2] / hash_id[2:]
-            if p.exists():
-                if not dry_run:
-                    size = p.stat().st_size
-                    p.unlink()
-                    freed += size
-                else:
-                    freed += p.stat().st_size
-                break
+        obj_type, path = loose[hash_id]
+        try:
+            size = os.stat(path).st_size
+            if not dry_run and not lazy_sweep:
+                os.unlink(path)
+        except FileNotFoundError:
+            continue
+        freed += size
+        if lazy_sweep:
+            unmarked.append(f"{obj_type} {hash_id}\n")
+    if dry_run:
+        return (len(to_delete), freed)
+    if lazy_sweep:
+        if unmarked:
+            sweep_dir = mem_dir / SWEEP_DIR
+            sweep_dir.mkdir(parents=True, exist_ok=True)
+            manifest = sweep_dir / f"{SWEEP_MANIFEST_PREFIX}{time.time_ns()}"
+            manifest.write_text("".join(unmarked))
+    else:
+        # Everything unreachable is gone; older manifests have nothing left to sweep
+        for manifest in _sweep_manifests(mem_dir):
+            manifest.unlink(missing_ok=True)
     return (len(to_delete), freed)
 
 
+def _sweep_manifests(mem_dir: Path) -> List[Path]:
+    """Return the pending lazy-sweep manifests, oldest first."""
+    sweep_dir = mem_dir / SWEEP_DIR
+    if not sweep_dir.is_dir():
+        return []
+    return sorted(sweep_dir.glob(f"{SWEEP_MANIFEST_PREFIX}*"))
+
+
+def sweep_unmarked(mem_dir: Path, store: ObjectStore, reachable: Set[str]) -> Tuple[int, int]:
+    """
+    Free the objects recorded by lazy-sweep GC runs, then drop the manifests.
+
+    Objects that became reachable again since they were recorded (e.g. the same
+    content was committed anew) are kept. Returns (deleted_count, bytes_freed).
+    """
+    deleted = 0
+    freed = 0
+    for manifest in _sweep_manifests(mem_dir):
+        try:
+            lines = manifest.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            obj_type, _, hash_id = line.partition(" ")
+            if obj_type not in ("blob", "tree", "commit", "tag") or len(hash_id) < 4:
+                continue
+            if hash_id in reachable:
+                continue
+            p = store.objects_dir / obj_type / hash_id[:2] / hash_id[2:]
+            try:
+                size = p.stat().st_size
+                p.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+            freed += size
+        manifest.unlink(missing_ok=True)
+    return (deleted, freed)
+
+
 def write_pack_with_delta(
     objects_dir: Path,
     store: ObjectStore,
@@ -423,28 +488,24 @@ def run_repack(
 ) -> Tuple[int, int]:
     """
     After GC: pack all reachable loose objects into a pack file, then delete those loose objects.
+    Objects left by a lazy-sweep GC (see run_gc) are freed in the same pass.
     Returns (objects_packed, bytes_freed_from_loose).
     """
     objects_dir = mem_dir / "objects"
     reachable = reachable_from_refs(mem_dir, store, gc_prune_days)
-    loose = list_loose_objects(objects_dir)
-    to_pack = reachable & loose
-    if not to_pack:
-        return (0, 0)
-    hash_to_type: Dict[str, str] = {}
-    for hash_id in to_pack:
-        obj_type = _get_loose_object_type(objects_dir, hash_id)
-        if obj_type:
-            hash_to_type[hash_id] = obj_type
+    freed = 0 if dry_run else sweep_unmarked(mem_dir, store, reachable)[1]
+    loose = _scan_loose_objects(objects_dir)
+    hash_to_type: Dict[str, str] = {h: loose[h][0] for h in reachable & loose.keys()}
     if not hash_to_type:
-        return (0, 0)
+        return (0, freed)
     if dry_run:
         return (len(hash_to_type), 0)
     write_pack_with_delta(objects_dir, store, hash_to_type)
-    freed = 0
-    for hash_id, obj_type in hash_to_type.items():
-        p = store.objects_dir / obj_type / hash_id[:2] / hash_id[2:]
-        if p.exists():
-            freed += p.stat().st_size
-            p.unlink()
+    for hash_id in hash_to_type:
+        path = loose[hash_id][1]
+        try:
+            freed += os.stat(path).st_size
+            os.unlink(path)
+        except FileNotFoundError:
+            continue
     return (len(hash_to_type), freed)
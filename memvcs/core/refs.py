@@ -5,14 +5,18 @@ Manages HEAD, branches, tags, stash, and reflog.
 """
 
 import os
+import time
+from contextlib import closing
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 # Minimum length for partial commit hash; full SHA-256 hex is 64 chars
 COMMIT_HASH_MIN_LEN = 4
 COMMIT_HASH_MAX_LEN = 64
 COMMIT_HASH_HEX_CHARS = set("0123456789abcdef")
+# Reflogs are read newest-first from the end in blocks of this size
+REFLOG_TAIL_BLOCK = 4096
 
 
 def _safe_ref_name(name: str) -> bool:
@@ -24,6 +28,33 @@ def _safe_ref_name(name: str) -> bool:
     return True
 
 
+def _iter_lines_reversed(path: Path, block_size: int = REFLOG_TAIL_BLOCK) -> Iterator[str]:
+    """
+    Yield a file's lines last to first, reading backwards in blocks.
+
+    Only as much of the file as the caller consumes is read, so taking the
+    newest few entries of a long reflog costs one or two block reads. Callers
+    that stop early should close the generator (contextlib.closing) to release
+    the file descriptor.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        pos = os.lseek(fd, 0, os.SEEK_END)
+        partial = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            os.lseek(fd, pos, os.SEEK_SET)
+            lines = (os.read(fd, size) + partial).split(b"\n")
+            # The first piece may continue in the previous block
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                yield line.rstrip(b"\r").decode("utf-8")
+        yield partial.rstrip(b"\r").decode("utf-8")
+    finally:
+        os.close(fd)
+
+
 def _ref_path_under_root(name: str, base_dir: Path) -> bool:
     """Return True if name is a valid ref name and (base_dir / name) stays under base_dir (Git-style)."""
     if not name or name in (".", "..") or "\0" in name or "\\" in name:
@@ -47,6 +78,60 @@ def _valid_commit_hash(candidate: str) -> bool:
     return all(c in COMMIT_HASH_HEX_CHARS for c in candidate.lower())
 
 
+class RefCache:
+    """
+    Memoizes values parsed from ref files, revalidated by stat.
+
+    Each entry stores the (mtime_ns, size, inode) of the files or directories it
+    was read from; a lookup costs one stat per path instead of a directory walk
+    and file reads. Entries whose paths changed within RACY_WINDOW_NS of being
+    read are not stored, since a same-timestamp rewrite would go unnoticed.
+    """
+
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[str, ...], Tuple, Any]] = {}
+
+    @staticmethod
+    def _stat_key(paths: Sequence[str]) -> Tuple:
+        key = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                key.append(None)
+                continue
+            key.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        return tuple(key)
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return the cached value for name, or None if missing or stale."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        paths, key, value = entry
+        if self._stat_key(paths) != key:
+            del self._entries[name]
+            return None
+        return value
+
+    def put(self, name: str, paths: Sequence[str], value: Any) -> None:
+        """Cache value for name, validated against the current stat of paths."""
+        key = self._stat_key(paths)
+        now_ns = time.time_ns()
+        if any(k is None or now_ns - k[0] < self.RACY_WINDOW_NS for k in key):
+            return
+        self._entries[name] = (tuple(paths), key, value)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one entry, or all entries when name is None."""
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+
+
 class RefsManager:
     """Manages references (HEAD, branches, tags)."""
 
@@ -59,6 +144,7 @@ class RefsManager:
         self.head_file = self.mem_dir / "HEAD"
         self.stash_file = self.mem_dir / "stash"
         self.reflog_dir = self.mem_dir / "logs"
+        self._cache = RefCache()
         self._ensure_directories()
 
     def _ensure_directories(self):
@@ -76,6 +162,7 @@ class RefsManager:
         if not branch_file.exists():
             branch_file.parent.mkdir(parents=True, exist_ok=True)
             branch_file.write_text("")
+        self._cache.invalidate()
 
     def get_head(self) -> Dict[str, str]:
         """
@@ -84,11 +171,22 @@ class RefsManager:
         Returns:
             Dict with 'type' ('branch' or 'commit') and 'value'
         """
-        if not self.head_file.exists():
+        cached = self._cache.get("HEAD")
+        if cached is not None:
+            return dict(cached)
+
+        try:
+            content = self.head_file.read_text().strip()
+        except FileNotFoundError:
             return {"type": "branch", "value": "main"}
 
-        content = self.head_file.read_text().strip()
+        head = self._parse_head(content)
+        self._cache.put("HEAD", [str(self.head_file)], head)
+        return dict(head)
 
+    @staticmethod
+    def _parse_head(content: str) -> Dict[str, str]:
+        """Parse the contents of the HEAD file."""
         if content.startswith("ref: "):
             # Points to a branch (e.g. refs/heads/main or refs/heads/feature/test)
             ref_path = content[5:].strip()
@@ -109,10 +207,12 @@ class RefsManager:
         if not _ref_path_under_root(branch_name, self.heads_dir):
             raise ValueError(f"Invalid branch name: {branch_name!r}")
         self.head_file.write_text(f"ref: refs/heads/{branch_name}\n")
+        self._cache.invalidate("HEAD")
 
     def set_head_detached(self, commit_hash: str):
         """Set HEAD to point directly to a commit (detached)."""
         self.head_file.write_text(f"{commit_hash}\n")
+        self._cache.invalidate("HEAD")
 
     def get_branch_commit(self, branch_name: str) -> Optional[str]:
         """Get the commit hash for a branch."""
@@ -131,6 +231,7 @@ class RefsManager:
         branch_file = self.heads_dir / branch_name
         branch_file.parent.mkdir(parents=True, exist_ok=True)
         branch_file.write_text(f"{commit_hash}\n")
+        self._cache.invalidate("branches")
 
     def create_branch(self, branch_name: str, commit_hash: Optional[str] = None) -> bool:
         """
@@ -160,6 +261,7 @@ class RefsManager:
                 commit_hash = head["value"]
 
         branch_file.write_text(f"{commit_hash}\n" if commit_hash else "")
+        self._cache.invalidate("branches")
         return True
 
     def delete_branch(self, branch_name: str) -> bool:
@@ -174,24 +276,39 @@ class RefsManager:
         branch_file = self.heads_dir / branch_name
         if branch_file.exists():
             branch_file.unlink()
+            self._cache.invalidate("branches")
             return True
         return False
 
     def list_branches(self) -> List[str]:
         """List all branch names (supports nested names like feature/test)."""
-        if not self.heads_dir.exists():
-            return []
-        branches = []
-        for p in self.heads_dir.rglob("*"):
-            if p.is_file():
-                branches.append(str(p.relative_to(self.heads_dir)))
-        return sorted(branches)
+        return sorted(self._branch_names())
+
+    def _branch_names(self) -> frozenset:
+        """Set of branch names, cached until a directory under refs/heads changes."""
+        cached = self._cache.get("branches")
+        if cached is not None:
+            return cached
+        heads_root = str(self.heads_dir)
+        dirs = []
+        names = []
+        # Branch files are created and removed, never renamed into place, so a
+        # change to the set of names always bumps some directory's mtime.
+        for dirpath, _dirnames, filenames in os.walk(heads_root):
+            dirs.append(dirpath)
+            rel = os.path.relpath(dirpath, heads_root)
+            prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+            names.extend(prefix + f for f in filenames)
+        branches = frozenset(names)
+        if dirs:
+            self._cache.put("branches", dirs, branches)
+        return branches
 
     def branch_exists(self, branch_name: str) -> bool:
         """Check if a branch exists."""
         if not _ref_path_under_root(branch_name, self.heads_dir):
             return False
-        return (self.heads_dir / branch_name).exists()
+        return branch_name in self._branch_names()
 
     def get_current_branch(self) -> Optional[str]:
         """Get the name of the current branch, or None if detached."""
@@ -310,29 +427,41 @@ class RefsManager:
         Returns:
             Commit hash or None if not found
         """
+        return self.classify(ref, object_store)[1]
+
+    def classify(self, ref: str, object_store=None) -> Tuple[str, Optional[str]]:
+        """
+        Resolve a reference and report what kind of ref it named.
+
+        Checks the same sources in the same order as resolve_ref().
+
+        Returns:
+            (kind, commit_hash) where kind is 'branch', 'tag', 'commit' (HEAD,
+            HEAD~n, remote-tracking, stash or hash) or 'unknown' with hash None
+        """
         ref = ref.strip()
 
         # Handle HEAD
         if ref == "HEAD":
             head = self.get_head()
             if head["type"] == "commit":
-                return head["value"]
+                return "commit", head["value"]
             else:
-                return self.get_branch_commit(head["value"])
+                return "commit", self.get_branch_commit(head["value"])
 
         # Handle HEAD~n
         if ref.startswith("HEAD~"):
             try:
                 n = int(ref[5:])
                 if n < 0:
-                    return None
+                    return "unknown", None
                 head = self.get_head()
                 if head["type"] == "branch":
                     commit_hash = self.get_branch_commit(head["value"])
                 else:
                     commit_hash = head["value"]
                 if not commit_hash:
-                    return None
+                    return "unknown", None
                 # Walk back n parents when object_store is available
                 if object_store is not None and n > 0:
                     from .objects import Commit
@@ -340,15 +469,15 @@ class RefsManager:
                     for _ in range(n):
                         commit = Commit.load(object_store, commit_hash)
                         if not commit or not commit.parents:
-                            return None
+                            return "unknown", None
                         commit_hash = commit.parents[0]
-                return commit_hash
+                return "commit", commit_hash
             except ValueError:
-                return None
+                return "unknown", None
 
         # Check branches
         if self.branch_exists(ref):
-            return self.get_branch_commit(ref)
+            return "branch", self.get_branch_commit(ref)
 
         # Check remote-tracking refs (e.g. origin/main)
         if "/" in ref:
@@ -360,25 +489,25 @@ class RefsManager:
                 ):
                     remote_hash = self.get_remote_branch_commit(remote_name, branch_name)
                     if remote_hash:
-                        return remote_hash
+                        return "commit", remote_hash
 
         # Check tags
         if self.tag_exists(ref):
-            return self.get_tag_commit(ref)
+            return "tag", self.get_tag_commit(ref)
 
         # Check stash refs (stash@{n})
         if ref.startswith("stash@"):
             if ref == "stash":
-                return self.get_stash_commit(0)
+                return "commit", self.get_stash_commit(0)
             if ref.startswith("stash@{") and ref.endswith("}"):
                 try:
                     n = int(ref[7:-1])
-                    return self.get_stash_commit(n)
+                    return "commit", self.get_stash_commit(n)
                 except ValueError:
                     pass
 
         # Assume it's a commit hash (full or partial); validate to avoid path/injection
-        return ref if _valid_commit_hash(ref) else None
+        return ("commit", ref) if _valid_commit_hash(ref) else ("unknown", None)
 
     # Reflog - log of HEAD changes
     def append_reflog(self, ref_name: str, old_hash: str, new_hash: str, message: str):
@@ -400,21 +529,23 @@ class RefsManager:
         if not log_file.exists():
             return []
         entries = []
-        for line in reversed(log_file.read_text().strip().split("\n")):
-            if not line:
-                continue
-            parts = line.split(" ", 3)
-            if len(parts) >= 4:
-                entries.append(
-                    {
-                        "hash": parts[0],
-                        "old_hash": parts[1],
-                        "timestamp": parts[2],
-                        "message": parts[3],
-                    }
-                )
-            if len(entries) >= max_count:
-                break
+        # Close the file as soon as enough entries are read, not when the generator is collected
+        with closing(_iter_lines_reversed(log_file, REFLOG_TAIL_BLOCK)) as lines:
+            for line in lines:
+                if not line.strip():
+                    continue
+                parts = line.split(" ", 3)
+                if len(parts) >= 4:
+                    entries.append(
+                        {
+                            "hash": parts[0],
+                            "old_hash": parts[1],
+                            "timestamp": parts[2],
+                            "message": parts[3],
+                        }
+                    )
+                if len(entries) >= max_count:
+                    break
         return entries
 
     # Stash - stack of stashed changes
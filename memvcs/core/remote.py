@@ -6,12 +6,20 @@ Supports file://, s3://, gs://, and ipfs:// URLs with optional distributed locki
 
 import json
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Set, Any
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from .objects import ObjectStore, Commit, Tree, Blob, _valid_object_hash
 from .refs import RefsManager, _ref_path_under_root
+from .workers import io_workers
+
+FETCH_WORKERS = io_workers()
+
+# Commits whose parents were cut off by a --depth fetch, one hash per line (as git's shallow)
+SHALLOW_FILE = "shallow"
 
 
 def _is_cloud_remote(url: str) -> bool:
@@ -38,13 +46,21 @@ def parse_remote_url(url: str) -> Path:
     raise ValueError(f"Unsupported remote URL scheme: {parsed.scheme}. Use file://")
 
 
-def _collect_objects_from_commit(store: ObjectStore, commit_hash: str) -> Set[str]:
-    """Recursively collect all object hashes reachable from a commit."""
+def _collect_objects_from_commit(
+    store: ObjectStore, commit_hash: str, depth: Optional[int] = None
+) -> Set[str]:
+    """
+    Recursively collect all object hashes reachable from a commit.
+
+    With depth, only the commit and depth - 1 generations of its ancestors are
+    followed, as in git's shallow fetch; older commits and their trees are left out.
+    """
     seen = set()
-    todo = [commit_hash]
+    # Breadth-first, so each commit is first reached at its lowest generation
+    todo = deque([(commit_hash, 1)])
 
     while todo:
-        h = todo.pop()
+        h, generation = todo.popleft()
         if h in seen:
             continue
         seen.add(h)
@@ -53,9 +69,10 @@ def _collect_objects_from_commit(store: ObjectStore, commit_hash: str) -> Set[st
         content = store.retrieve(h, "commit")
         if content:
             data = json.loads(content)
-            todo.extend(data.get("parents", []))
+            if depth is None or generation < depth:
+                todo.extend((p, generation + 1) for p in data.get("parents", []))
             if "tree" in data:
-                todo.append(data["tree"])
+                todo.append((data["tree"], generation))
             continue
 
         # Try tree
@@ -64,7 +81,7 @@ def _collect_objects_from_commit(store: ObjectStore, commit_hash: str) -> Set[st
             data = json.loads(content)
             for e in data.get("entries", []):
                 if "hash" in e:
-                    todo.append(e["hash"])
+                    todo.append((e["hash"], generation))
             continue
 
         # Blob - no follow
@@ -91,12 +108,14 @@ def _read_object_from_adapter(adapter: Any, hash_id: str) -> Optional[tuple]:
     return None
 
 
-def _collect_objects_from_commit_remote(adapter: Any, commit_hash: str) -> Set[str]:
+def _collect_objects_from_commit_remote(
+    adapter: Any, commit_hash: str, depth: Optional[int] = None
+) -> Set[str]:
     """Collect object hashes reachable from a commit when reading from storage adapter."""
     seen = set()
-    todo = [commit_hash]
+    todo = deque([(commit_hash, 1)])
     while todo:
-        h = todo.pop()
+        h, generation = todo.popleft()
         if h in seen:
             continue
         seen.add(h)
@@ -106,14 +125,15 @@ def _collect_objects_from_commit_remote(adapter: Any, commit_hash: str) -> Set[s
         obj_type, content = pair
         if obj_type == "commit":
             data = json.loads(content)
-            todo.extend(data.get("parents", []))
+            if depth is None or generation < depth:
+                todo.extend((p, generation + 1) for p in data.get("parents", []))
             if "tree" in data:
-                todo.append(data["tree"])
+                todo.append((data["tree"], generation))
         elif obj_type == "tree":
             data = json.loads(content)
             for e in data.get("entries", []):
                 if "hash" in e:
-                    todo.append(e["hash"])
+                    todo.append((e["hash"], generation))
     return seen
 
 
@@ -132,6 +152,44 @@ def _list_local_objects(objects_dir: Path) -> Set[str]:
     return hashes
 
 
+def read_shallow(mem_dir: Path) -> List[str]:
+    """Return the shallow boundary commits recorded in .mem/shallow (empty when complete)."""
+    try:
+        return (Path(mem_dir) / SHALLOW_FILE).read_text().split()
+    except OSError:
+        return []
+
+
+def _local_ref_tips(
+    refs: RefsManager, branch: Optional[str] = None
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Read local branch tips (only branch, if given) and tag tips once: name -> commit."""
+    heads = {}
+    for b in refs.list_branches():
+        if branch and b != branch:
+            continue
+        ch = refs.get_branch_commit(b)
+        if ch:
+            heads[b] = ch
+    tags = {}
+    for t in refs.list_tags():
+        ch = refs.get_tag_commit(t)
+        if ch:
+            tags[t] = ch
+    return heads, tags
+
+
+def _read_refs_dir(refs_dir: Path) -> List[Tuple[str, str]]:
+    """Read (name, commit hash) for every ref file under a refs/heads or refs/tags dir."""
+    if not refs_dir.exists():
+        return []
+    return [
+        (str(f.relative_to(refs_dir)), f.read_text().strip())
+        for f in refs_dir.rglob("*")
+        if f.is_file()
+    ]
+
+
 def _get_object_path(objects_dir: Path, hash_id: str) -> Optional[Path]:
     """Get path for an object. Returns path if found, else None. Validates hash_id."""
     if not _valid_object_hash(hash_id):
@@ -198,17 +256,10 @@ class Remote:
         """Push objects and refs via storage adapter. Caller must hold lock if needed."""
         refs = RefsManager(self.mem_dir)
         store = ObjectStore(self.objects_dir)
+        heads, tags = _local_ref_tips(refs, branch)
         to_push = set()
-        for b in refs.list_branches():
-            if branch and b != branch:
-                continue
-            ch = refs.get_branch_commit(b)
-            if ch:
-                to_push.update(_collect_objects_from_commit(store, ch))
-        for t in refs.list_tags():
-            ch = refs.get_tag_commit(t)
-            if ch:
-                to_push.update(_collect_objects_from_commit(store, ch))
+        for ch in list(heads.values()) + list(tags.values()):
+            to_push.update(_collect_objects_from_commit(store, ch))
         copied = 0
         for h in to_push:
             obj_type = None
@@ -228,18 +279,14 @@ class Remote:
                     copied += 1
                 except Exception:
                     pass
-        for b in refs.list_branches():
-            if branch and b != branch:
-                continue
-            ch = refs.get_branch_commit(b)
-            if ch and _ref_path_under_root(b, refs.heads_dir):
+        for b, ch in heads.items():
+            if _ref_path_under_root(b, refs.heads_dir):
                 parent = str(Path(b).parent)
                 if parent != ".":
                     adapter.makedirs(f".mem/refs/heads/{parent}")
                 adapter.write_file(f".mem/refs/heads/{b}", (ch + "\n").encode())
-        for t in refs.list_tags():
-            ch = refs.get_tag_commit(t)
-            if ch and _ref_path_under_root(t, refs.tags_dir):
+        for t, ch in tags.items():
+            if _ref_path_under_root(t, refs.tags_dir):
                 parent = str(Path(t).parent)
                 if parent != ".":
                     adapter.makedirs(f".mem/refs/tags/{parent}")
@@ -254,7 +301,9 @@ class Remote:
             pass
         return f"Pushed {copied} object(s) to {self.name}"
 
-    def _fetch_via_storage(self, adapter: Any, branch: Optional[str] = None) -> str:
+    def _fetch_via_storage(
+        self, adapter: Any, branch: Optional[str] = None, depth: Optional[int] = None
+    ) -> str:
         """Fetch objects and refs via storage adapter. Caller must hold lock if needed."""
         to_fetch = set()
         try:
@@ -268,7 +317,7 @@ class Remote:
                 data = adapter.read_file(fi.path)
                 ch = data.decode().strip()
                 if ch and _valid_object_hash(ch):
-                    to_fetch.update(_collect_objects_from_commit_remote(adapter, ch))
+                    to_fetch.update(_collect_objects_from_commit_remote(adapter, ch, depth))
             tags = adapter.list_dir(".mem/refs/tags")
             for fi in tags:
                 if fi.is_dir:
@@ -276,7 +325,7 @@ class Remote:
                 data = adapter.read_file(fi.path)
                 ch = data.decode().strip()
                 if ch and _valid_object_hash(ch):
-                    to_fetch.update(_collect_objects_from_commit_remote(adapter, ch))
+                    to_fetch.update(_collect_objects_from_commit_remote(adapter, ch, depth))
         except Exception:
             pass
         if not to_fetch:
@@ -297,6 +346,7 @@ class Remote:
                     except Exception:
                         pass
                     break
+        self._update_shallow(to_fetch if depth is not None else ())
         try:
             from .audit import append_audit
 
@@ -420,24 +470,21 @@ class Remote:
 
         refs = RefsManager(self.mem_dir)
         store = ObjectStore(self.objects_dir)
+        heads, tags = _local_ref_tips(refs, branch)
 
         # Push conflict detection: remote tip must be ancestor of local tip (non-fast-forward reject)
         remote_heads = remote_refs / "heads"
-        for b in refs.list_branches():
-            if branch and b != branch:
-                continue
-            local_ch = refs.get_branch_commit(b)
-            if not local_ch:
-                continue
+        engine = None
+        for b, local_ch in heads.items():
             remote_branch_file = remote_heads / b
             if remote_branch_file.exists():
                 remote_ch = remote_branch_file.read_text().strip()
                 if remote_ch and _valid_object_hash(remote_ch):
-                    from .merge import MergeEngine
-                    from .repository import Repository
+                    if engine is None:
+                        from .merge import MergeEngine
+                        from .repository import Repository
 
-                    repo = Repository(self.repo_path)
-                    engine = MergeEngine(repo)
+                        engine = MergeEngine(Repository(self.repo_path))
                     if not engine.find_common_ancestor(remote_ch, local_ch) == remote_ch:
                         raise ValueError(
                             "Push rejected: remote has diverged. Pull and merge first."
@@ -445,16 +492,8 @@ class Remote:
 
         # Collect objects to push
         to_push = set()
-        for b in refs.list_branches():
-            if branch and b != branch:
-                continue
-            ch = refs.get_branch_commit(b)
-            if ch:
-                to_push.update(_collect_objects_from_commit(store, ch))
-        for t in refs.list_tags():
-            ch = refs.get_tag_commit(t)
-            if ch:
-                to_push.update(_collect_objects_from_commit(store, ch))
+        for ch in list(heads.values()) + list(tags.values()):
+            to_push.update(_collect_objects_from_commit(store, ch))
 
         remote_has = _list_local_objects(remote_objects)
         missing = to_push - remote_has
@@ -468,20 +507,12 @@ class Remote:
         # Copy refs (validate names so remote path stays under refs/heads and refs/tags)
         remote_heads = remote_refs / "heads"
         remote_tags_dir = remote_refs / "tags"
-        for b in refs.list_branches():
-            if branch and b != branch:
-                continue
-            if not _ref_path_under_root(b, remote_heads):
-                continue
-            ch = refs.get_branch_commit(b)
-            if ch:
+        for b, ch in heads.items():
+            if _ref_path_under_root(b, remote_heads):
                 (remote_heads / b).parent.mkdir(parents=True, exist_ok=True)
                 (remote_heads / b).write_text(ch + "\n")
-        for t in refs.list_tags():
-            if not _ref_path_under_root(t, remote_tags_dir):
-                continue
-            ch = refs.get_tag_commit(t)
-            if ch:
+        for t, ch in tags.items():
+            if _ref_path_under_root(t, remote_tags_dir):
                 (remote_tags_dir / t).parent.mkdir(parents=True, exist_ok=True)
                 (remote_tags_dir / t).write_text(ch + "\n")
 
@@ -495,11 +526,66 @@ class Remote:
             pass
         return f"Pushed {copied} object(s) to {self.name}"
 
-    def fetch(self, branch: Optional[str] = None) -> str:
+    def _update_shallow(self, fetched=()) -> None:
+        """
+        Rewrite .mem/shallow after a fetch.
+
+        fetched are object hashes from a depth-limited fetch; those that are commits
+        with a parent missing locally join the boundary. Recorded commits whose
+        parents have since arrived are dropped, and the file is removed once empty.
+        """
+        store = ObjectStore(self.objects_dir)
+        boundary = []
+        for h in set(fetched).union(read_shallow(self.mem_dir)):
+            content = store.retrieve(h, "commit")
+            if content and not all(
+                store.exists(p, "commit") for p in json.loads(content).get("parents", [])
+            ):
+                boundary.append(h)
+        shallow_file = self.mem_dir / SHALLOW_FILE
+        if boundary:
+            shallow_file.write_text("".join(f"{h}\n" for h in sorted(boundary)))
+        else:
+            shallow_file.unlink(missing_ok=True)
+
+    def ls_refs(self, branches: Optional[List[str]] = None) -> Optional[Dict[str, str]]:
+        """
+        List remote refs without fetching objects.
+
+        Returns {"heads/<branch>" or "tags/<tag>": commit hash}. branches limits
+        heads to those names and leaves out tags, matching fetch(branch=...).
+        Returns None for IPFS and cloud remotes, which have no cheap listing.
+        """
+        url = self.get_remote_url()
+        if not url:
+            raise ValueError(f"Remote '{self.name}' has no URL configured")
+        if _is_ipfs_remote(url) or _is_cloud_remote(url):
+            return None
+
+        remote_path = parse_remote_url(url)
+        if not (remote_path / ".mem" / "objects").exists():
+            raise ValueError(f"Remote is not an agmem repository: {remote_path}")
+        remote_refs = remote_path / ".mem" / "refs"
+        listed = {
+            f"heads/{name}": ch
+            for name, ch in _read_refs_dir(remote_refs / "heads")
+            if branches is None or name in branches
+        }
+        if branches is None:
+            listed.update((f"tags/{name}", ch) for name, ch in _read_refs_dir(remote_refs / "tags"))
+        return listed
+
+    def fetch(self, branch: Optional[str] = None, depth: Optional[int] = None) -> str:
         """
         Fetch objects and refs from remote into local.
+
+        depth limits each fetched ref to its tip and depth - 1 generations of
+        history (ignored for IPFS). Commits beyond that are not fetched, so merges
+        whose common ancestor lies further back cannot be computed from them.
         Returns status message.
         """
+        if depth is not None and depth < 1:
+            raise ValueError("depth must be at least 1")
         url = self.get_remote_url()
         if not url:
             raise ValueError(f"Remote '{self.name}' has no URL configured")
@@ -516,7 +602,7 @@ class Remote:
                 lock_name = "agmem-fetch"
                 adapter.acquire_lock(lock_name, 30)
                 try:
-                    return self._fetch_via_storage(adapter, branch)
+                    return self._fetch_via_storage(adapter, branch, depth)
                 finally:
                     adapter.release_lock(lock_name)
             except LockError as e:
@@ -534,53 +620,51 @@ class Remote:
         refs = RefsManager(self.mem_dir)
         remote_store = ObjectStore(remote_objects)
 
-        # Collect remote refs to fetch (traverse remote's objects)
-        to_fetch = set()
-        heads_dir = remote_refs / "heads"
-        if heads_dir.exists():
-            for f in heads_dir.rglob("*"):
-                if f.is_file():
-                    branch_name = str(f.relative_to(heads_dir))
-                    if branch is not None and branch_name != branch:
-                        continue
-                    ch = f.read_text().strip()
-                    if ch and _valid_object_hash(ch):
-                        to_fetch.update(_collect_objects_from_commit(remote_store, ch))
-        tags_dir = remote_refs / "tags"
-        if tags_dir.exists() and branch is None:
-            for f in tags_dir.rglob("*"):
-                if f.is_file():
-                    ch = f.read_text().strip()
-                    if ch and _valid_object_hash(ch):
-                        to_fetch.update(_collect_objects_from_commit(remote_store, ch))
+        # Read remote refs once; a single-branch fetch leaves tags alone
+        remote_heads = [
+            (name, ch)
+            for name, ch in _read_refs_dir(remote_refs / "heads")
+            if branch is None or name == branch
+        ]
+        remote_tags = _read_refs_dir(remote_refs / "tags") if branch is None else []
 
-        local_has = _list_local_objects(self.objects_dir)
-        missing = to_fetch - local_has
+        tips = [ch for _, ch in remote_heads] + [ch for _, ch in remote_tags]
+        tips = [ch for ch in dict.fromkeys(tips) if ch and _valid_object_hash(ch)]
 
+        # Ref walks and object copies are independent file I/O; overlap them
         copied = 0
-        for h in missing:
-            if _copy_object(remote_objects, self.objects_dir, h):
-                copied += 1
-
-        # Update remote-tracking refs (refs/remotes/<name>/<branch>), not local heads
-        if heads_dir.exists():
-            for f in heads_dir.rglob("*"):
-                if f.is_file():
-                    branch_name = str(f.relative_to(heads_dir))
-                    if not _ref_path_under_root(branch_name, refs.heads_dir):
-                        continue
-                    ch = f.read_text().strip()
-                    if ch:
-                        refs.set_remote_branch_commit(self.name, branch_name, ch)
-        if tags_dir.exists():
-            for f in tags_dir.rglob("*"):
-                if f.is_file():
-                    tag_name = str(f.relative_to(tags_dir))
-                    if not _ref_path_under_root(tag_name, refs.tags_dir):
-                        continue
-                    ch = f.read_text().strip()
-                    if ch:
-                        refs.create_tag(tag_name, ch)
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            to_fetch = set()
+            for reachable in pool.map(
+                lambda ch: _collect_objects_from_commit(remote_store, ch, depth), tips
+            ):
+                to_fetch.update(reachable)
+
+            missing = to_fetch - _list_local_objects(self.objects_dir)
+            for ok in pool.map(
+                lambda h: _copy_object(remote_objects, self.objects_dir, h), missing
+            ):
+                copied += ok
+
+        self._update_shallow(to_fetch if depth is not None else ())
+
+        # Update remote-tracking refs (refs/remotes/<name>/<branch>), not local heads,
+        # only for refs whose objects were fetched
+        local_store = ObjectStore(self.objects_dir)
+        for branch_name, ch in remote_heads:
+            if (
+                ch
+                and _ref_path_under_root(branch_name, refs.heads_dir)
+                and local_store.exists(ch, "commit")
+            ):
+                refs.set_remote_branch_commit(self.name, branch_name, ch)
+        for tag_name, ch in remote_tags:
+            if (
+                ch
+                and _ref_path_under_root(tag_name, refs.tags_dir)
+                and local_store.exists(ch, "commit")
+            ):
+                refs.create_tag(tag_name, ch)
 
         try:
             from .audit import append_audit
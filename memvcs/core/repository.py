@@ -4,18 +4,24 @@ Main repository class for agmem.
 Coordinates object storage, staging area, and references.
 """
 
-import json
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from datetime import datetime
 
+from . import fast_json
 from .constants import MEMORY_TYPES
 from .config_loader import load_agmem_config
-from .objects import ObjectStore, Blob, Tree, TreeEntry, Commit
-from .staging import StagingArea
+from .objects import ObjectStore, Blob, Tree, TreeEntry, Commit, hash_object
+from .staging import StagingArea, StatCache
 from .refs import RefsManager
+from .workers import cpu_workers
+
+# Worker threads used to read, hash and store blobs in Repository.stage_files
+STAGE_WORKERS = cpu_workers()
 
 
 class Repository:
@@ -26,6 +32,10 @@ class Repository:
         self.mem_dir = self.root / ".mem"
         self.current_dir = self.root / "current"
         self.config_file = self.mem_dir / "config.json"
+        # (stat key, raw bytes) of config.json; parsed per call so callers get a fresh dict
+        self._config_cache: Optional[Tuple[Tuple[int, int, int], bytes]] = None
+        # Signature trust levels per commit for this process (see trust.commit_trust_level)
+        self._trust_cache: Dict[tuple, Optional[str]] = {}
 
         self.object_store: Optional[ObjectStore] = None
         self.staging: Optional[StagingArea] = None
@@ -104,7 +114,7 @@ class Repository:
                 "consolidation_threshold": 100,  # Episodes before consolidation
             },
         }
-        repo.config_file.write_text(json.dumps(config, indent=2))
+        repo.config_file.write_bytes(fast_json.dumps(config, indent=True))
 
         # Initialize components
         repo._init_components()
@@ -132,13 +142,23 @@ class Repository:
 
     def get_config(self) -> Dict[str, Any]:
         """Get repository configuration."""
-        if self.config_file.exists():
-            return json.loads(self.config_file.read_text())
-        return {}
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            return {}
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if self._config_cache is not None and self._config_cache[0] == key:
+            return fast_json.loads(self._config_cache[1])
+        data = self.config_file.read_bytes()
+        # A rewrite within the racy window could keep the same stat key; re-read those
+        if time.time_ns() - st.st_mtime_ns >= StatCache.RACY_WINDOW_NS:
+            self._config_cache = (key, data)
+        return fast_json.loads(data)
 
     def set_config(self, config: Dict[str, Any]):
         """Set repository configuration."""
-        self.config_file.write_text(json.dumps(config, indent=2))
+        self.config_file.write_bytes(fast_json.dumps(config, indent=True))
+        self._config_cache = None
         try:
             from .audit import append_audit
 
@@ -182,21 +202,33 @@ class Repository:
 
     def resolve_ref(self, ref: str) -> Optional[str]:
         """Resolve a reference (branch, tag, HEAD, HEAD~n, commit hash, or ISO date) to a commit hash."""
+        return self.classify_ref(ref)[1]
+
+    def classify_ref(self, ref: str) -> Tuple[str, Optional[str]]:
+        """
+        Resolve a reference in one pass and report its kind.
+
+        Returns:
+            (kind, commit_hash) as from RefsManager.classify(); ISO dates
+            resolved through the temporal index are reported as 'commit'
+        """
         if not self.refs:
-            return None
-        resolved = self.refs.resolve_ref(ref, self.object_store)
+            return "unknown", None
+        kind, resolved = self.refs.classify(ref, self.object_store)
         if resolved:
-            return resolved
+            return kind, resolved
         # Try temporal resolution for ISO date strings
         if ref and (ref[0].isdigit() or ref.startswith("202")):
             try:
                 from .temporal_index import TemporalIndex
 
                 ti = TemporalIndex(self.mem_dir, self.object_store)
-                return ti.resolve_at(ref)
+                resolved = ti.resolve_at(ref)
+                if resolved:
+                    return "commit", resolved
             except Exception:
                 pass
-        return None
+        return "unknown", None
 
     def _path_under_current_dir(self, relative_path: str) -> Optional[Path]:
         """Resolve path under current/; return None if it escapes (path traversal)."""
@@ -223,12 +255,8 @@ class Repository:
             ValueError: If filepath escapes current/ (path traversal)
         """
         if content is None:
-            full_path = self._path_under_current_dir(filepath)
-            if full_path is None:
-                raise ValueError(f"Path escapes current directory: {filepath}")
-            if not full_path.exists():
-                raise FileNotFoundError(f"File not found: {filepath}")
-            content = full_path.read_bytes()
+            # Reading from current/ goes through the stat cache
+            return self.stage_files([filepath])[filepath]
 
         # Store as blob
         blob = Blob(content=content)
@@ -239,6 +267,92 @@ class Repository:
 
         return blob_hash
 
+    def _working_file_path(self, filepath: str) -> Path:
+        """Resolve a file under current/ for staging, rejecting paths that escape it."""
+        full_path = self._path_under_current_dir(filepath)
+        if full_path is None:
+            raise ValueError(f"Path escapes current directory: {filepath}")
+        if not full_path.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+        return full_path
+
+    def stage_files(
+        self, filepaths: Iterable[str], errors: Optional[Dict[str, Exception]] = None
+    ) -> Dict[str, str]:
+        """
+        Stage several files for commit, writing the staging index once.
+
+        Args:
+            filepaths: Paths relative to current/ directory
+            errors: If given, per-file failures are recorded here (path -> exception)
+                and the remaining files are still staged; otherwise the first failure raises
+
+        Returns:
+            Dict mapping staged file paths to blob hashes
+
+        Raises:
+            FileNotFoundError: If a file does not exist (when errors is None)
+            ValueError: If a filepath escapes current/ (when errors is None)
+        """
+
+        stat_cache = StatCache(self.mem_dir)
+
+        def read_and_store(filepath: str):
+            try:
+                full_path = self._working_file_path(filepath)
+                st = full_path.stat()
+                # Unchanged since last staged: reuse the blob hash, skip hashing
+                blob_hash = stat_cache.lookup(filepath, st)
+                if blob_hash and self.object_store.exists(blob_hash, "blob"):
+                    return filepath, blob_hash, None, st, None
+                content = full_path.read_bytes()
+            except (OSError, ValueError) as e:
+                return filepath, None, None, None, e
+            return filepath, Blob(content=content).store(self.object_store), content, st, None
+
+        filepaths = list(filepaths)
+        # Reading, hashing and compressing release the GIL, so blobs are stored in parallel
+        if len(filepaths) > 1:
+            with ThreadPoolExecutor(max_workers=STAGE_WORKERS) as pool:
+                results = list(pool.map(read_and_store, filepaths))
+        else:
+            results = [read_and_store(f) for f in filepaths]
+
+        staged = {}
+        batch = []
+        now_ns = time.time_ns()
+        # Bound methods hoisted out of the per-file loop (daemon auto-commits run this often)
+        record = stat_cache.record
+        staged_hash = self.staging.get_blob_hash
+        add_to_batch = batch.append
+        for filepath, blob_hash, content, st, error in results:
+            if error is not None:
+                if errors is None:
+                    raise error
+                errors[filepath] = error
+                continue
+            staged[filepath] = blob_hash
+            record(filepath, st, blob_hash, now_ns)
+            if staged_hash(filepath) != blob_hash:
+                if content is None:
+                    # Stat-cache hit: copy the stored blob, not the live file, which
+                    # may have changed since it was stat'ed
+                    content = self.object_store.retrieve(blob_hash, "blob")
+                add_to_batch((filepath, blob_hash, content))
+
+        self.staging.add_many(batch)
+        stat_cache.save()
+        return staged
+
+    def stage_file_maybe_cached(self, filepath: str) -> str:
+        """
+        Stage a file, skipping the hash when its stat data matches the last staging.
+
+        Returns:
+            Blob hash of staged content
+        """
+        return self.stage_files([filepath])[filepath]
+
     def _build_tree_from_staged(self) -> str:
         """Build and store tree from staged files. Returns tree hash."""
         staged_files = self.staging.get_staged_files()
@@ -279,6 +393,40 @@ class Repository:
                 filepath.parent.mkdir(parents=True, exist_ok=True)
                 filepath.write_bytes(blob.content)
 
+    @staticmethod
+    def _scan_working_files(root: Path, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Yield ("/"-separated path prefixed with prefix, DirEntry) for files under root.
+
+        Uses os.scandir and prunes hidden directories before descending, so
+        nothing under them is listed or stat'ed. Like os.walk, symlinked
+        directories are not followed and non-directory entries count as files.
+        """
+        stack = [(os.fspath(root), prefix)]
+        while stack:
+            dir_path, dir_prefix = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if not is_dir:
+                            yield dir_prefix + name, entry
+                        # Names are never empty; indexing beats a startswith call
+                        elif name[0] != "." and not entry.is_symlink():
+                            stack.append((entry.path, dir_prefix + name + "/"))
+            except OSError:
+                continue
+
+    @staticmethod
+    def _walk_working_files(root: Path, prefix: str = "") -> Iterator[str]:
+        """Yield "/"-separated paths of files under root (see _scan_working_files)."""
+        for rel_path, _ in Repository._scan_working_files(root, prefix):
+            yield rel_path
+
     def stage_directory(self, dirpath: str = "") -> Dict[str, str]:
         """
         Stage all files in a directory.
@@ -290,21 +438,10 @@ class Repository:
             Dict mapping file paths to blob hashes
         """
         target_dir = self.current_dir / dirpath if dirpath else self.current_dir
-        staged = {}
-
-        for root, dirs, files in os.walk(target_dir):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
+        prefix = os.fspath(target_dir.relative_to(self.current_dir)).replace(os.sep, "/")
+        paths = list(self._walk_working_files(target_dir, "" if prefix == "." else prefix + "/"))
 
-            for filename in files:
-                full_path = Path(root) / filename
-                rel_path = full_path.relative_to(self.current_dir)
-
-                content = full_path.read_bytes()
-                blob_hash = self.stage_file(str(rel_path), content)
-                staged[str(rel_path)] = blob_hash
-
-        return staged
+        return self.stage_files(paths)
 
     def commit(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -387,13 +524,17 @@ class Repository:
 
         return commit_hash
 
-    def checkout(self, ref: str, force: bool = False) -> str:
+    def checkout(
+        self, ref: str, force: bool = False, resolved: Optional[Tuple[str, str]] = None
+    ) -> str:
         """
         Checkout a commit or branch.
 
         Args:
             ref: Branch name, tag name, or commit hash
             force: Whether to discard uncommitted changes
+            resolved: (kind, commit_hash) from classify_ref(ref), if the caller
+                already has it
 
         Returns:
             Commit hash that was checked out
@@ -407,7 +548,7 @@ class Repository:
             old_hash = old_head.get("value")
 
         # Resolve reference
-        commit_hash = self.resolve_ref(ref)
+        kind, commit_hash = resolved or self.classify_ref(ref)
         if not commit_hash:
             raise ValueError(f"Reference not found: {ref}")
 
@@ -441,7 +582,7 @@ class Repository:
             self.refs.append_reflog("HEAD", old_hash, commit_hash, f"checkout: moving to {ref}")
 
         # Update HEAD
-        if self.refs.branch_exists(ref):
+        if kind == "branch":
             self.refs.set_head_branch(ref)
         else:
             self.refs.set_head_detached(commit_hash)
@@ -459,47 +600,34 @@ class Repository:
 
         return commit_hash
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(
+        self, include_modified: bool = True, include_untracked: bool = True
+    ) -> Dict[str, Any]:
         """
         Get repository status.
 
+        Args:
+            include_modified: Hash tracked files to find modifications
+            include_untracked: Walk current/ to list untracked files
+
         Returns:
             Status dictionary with staged, modified, untracked files
         """
         staged = self.staging.get_staged_files()
 
         # Compare current directory with HEAD
-        head_commit = self.get_head_commit()
-        head_files = {}
+        head_files = self._head_files()
 
-        if head_commit:
-            tree = Tree.load(self.object_store, head_commit.tree)
-            if tree:
-                for entry in tree.entries:
-                    path = entry.path + "/" + entry.name if entry.path else entry.name
-                    head_files[path] = entry.hash
-
-        # Check working directory
+        # Only tracked files need reading; untracked ones are found by name alone
         modified = []
-        untracked = []
-
-        for root, dirs, files in os.walk(self.current_dir):
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
+        if include_modified:
+            modified = list(self._iter_modified(head_files, staged))
 
-            for filename in files:
-                full_path = Path(root) / filename
-                rel_path = str(full_path.relative_to(self.current_dir))
-
-                if rel_path not in staged:
-                    content = full_path.read_bytes()
-                    blob = Blob(content=content)
-                    blob_hash = blob.store(self.object_store)
-
-                    if rel_path in head_files:
-                        if head_files[rel_path] != blob_hash:
-                            modified.append(rel_path)
-                    else:
-                        untracked.append(rel_path)
+        untracked = []
+        if include_untracked:
+            for rel_path in self._walk_working_files(self.current_dir):
+                if rel_path not in staged and rel_path not in head_files:
+                    untracked.append(rel_path)
 
         # Check for deleted files
         deleted = []
@@ -517,6 +645,62 @@ class Repository:
             "branch": self.refs.get_current_branch(),
         }
 
+    def _head_files(self) -> Dict[str, str]:
+        """Map of path -> blob hash for the HEAD commit's tree (empty if none)."""
+        head_commit = self.get_head_commit()
+        if head_commit:
+            tree = Tree.load(self.object_store, head_commit.tree)
+            if tree:
+                return tree.index()
+        return {}
+
+    def _iter_modified(self, head_files: Dict[str, str], staged: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield tracked, unstaged paths whose working copy differs from HEAD.
+
+        Files whose stat data matches the stat cache are not read; missing
+        files are skipped (they are deletions, not modifications).
+        """
+        stat_cache = StatCache(self.mem_dir)
+        for rel_path, head_hash in head_files.items():
+            if rel_path in staged or any(part.startswith(".") for part in rel_path.split("/")[:-1]):
+                continue
+            full_path = self.current_dir / rel_path
+            try:
+                st = full_path.stat()
+                blob_hash = stat_cache.lookup(rel_path, st)
+                if blob_hash is None:
+                    blob_hash = hash_object(full_path.read_bytes(), "blob")
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                continue
+            if blob_hash != head_hash:
+                yield rel_path
+
+    def is_dirty(self, include_untracked: bool = False) -> bool:
+        """
+        Return True if the working tree differs from HEAD plus the staging index.
+
+        Cheaper than get_status(): stops at the first modified, deleted or
+        (optionally) untracked file, and only hashes files whose stat data
+        is not in the stat cache.
+
+        Args:
+            include_untracked: Also count files under current/ that are not tracked
+        """
+        staged = self.staging.get_staged_files()
+        head_files = self._head_files()
+
+        for _ in self._iter_modified(head_files, staged):
+            return True
+        for path in head_files:
+            if path not in staged and not (self.current_dir / path).exists():
+                return True
+        if include_untracked:
+            for rel_path in self._walk_working_files(self.current_dir):
+                if rel_path not in staged and rel_path not in head_files:
+                    return True
+        return False
+
     def get_log(self, max_count: int = 10) -> List[Dict[str, Any]]:
         """
         Get commit history.
@@ -18,8 +18,12 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+from . import fast_json
 from .constants import MEMORY_TYPES
 
+# Leading bytes checked for NUL when deciding whether content is binary
+BINARY_SNIFF_BYTES = 8192
+
 
 class MemoryType(Enum):
     """Memory types with their validation requirements."""
@@ -139,6 +143,8 @@ class FrontmatterParser:
 
     # Regex to match YAML frontmatter block
     FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL | re.MULTILINE)
+    # Same block on raw bytes, to locate the frontmatter without decoding the body
+    FRONTMATTER_BYTES_PATTERN = re.compile(rb"^---\s*\n(.*?)\n---\s*\n", re.DOTALL | re.MULTILINE)
 
     @classmethod
     def parse(cls, content: str) -> Tuple[Optional[FrontmatterData], str]:
@@ -365,6 +371,34 @@ class SchemaValidator:
 
         return result
 
+    @classmethod
+    def validate_bytes(
+        cls, data: bytes, filepath: str, strict: bool = False
+    ) -> Optional[ValidationResult]:
+        """
+        Validate raw file content, decoding only the frontmatter.
+
+        Validation never looks at the body, so only the frontmatter block is
+        decoded; NUL bytes near the start mark the file as binary.
+
+        Args:
+            data: Raw file content
+            filepath: Path to the file (for type detection)
+            strict: If True, treat warnings as errors
+
+        Returns:
+            ValidationResult, or None if the content is binary or not UTF-8
+        """
+        if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+            return None
+        match = FrontmatterParser.FRONTMATTER_BYTES_PATTERN.match(data)
+        head = data[: match.end()] if match else data
+        try:
+            content = head.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        return cls.validate(content, filepath, strict=strict)
+
     @classmethod
     def validate_batch(
         cls, files: Dict[str, str], strict: bool = False
@@ -385,6 +419,56 @@ class SchemaValidator:
         return results
 
 
+class ValidationCache:
+    """
+    Remembers blobs that validated cleanly, so unchanged files skip re-validation.
+
+    Keys combine blob hash, detected memory type and strictness. Only results
+    with no errors or warnings are recorded, and the cache is dropped when the
+    agmem version changes, since validation rules may differ between releases.
+    """
+
+    MAX_ENTRIES = 4096
+
+    def __init__(self, mem_dir: Path):
+        from .. import __version__
+
+        self.cache_file = Path(mem_dir) / "validation_cache.json"
+        self._version = __version__
+        self._clean: Dict[str, None] = {}
+        self._dirty = False
+        if self.cache_file.exists():
+            try:
+                data = fast_json.loads(self.cache_file.read_bytes())
+                if data.get("version") == self._version:
+                    self._clean = dict.fromkeys(data.get("clean", []))
+            except (ValueError, OSError, AttributeError):
+                self._clean = {}
+
+    @staticmethod
+    def key(blob_hash: str, filepath: str, strict: bool) -> str:
+        memory_type = SchemaValidator.detect_memory_type(filepath)
+        return f"{blob_hash}:{memory_type.value}:{int(strict)}"
+
+    def is_clean(self, key: str) -> bool:
+        """Return True if this blob previously validated without errors or warnings."""
+        return key in self._clean
+
+    def record(self, key: str, result: ValidationResult) -> None:
+        """Remember key if result is clean."""
+        if result.valid and not result.warnings and key not in self._clean:
+            self._clean[key] = None
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed, keeping the newest MAX_ENTRIES keys."""
+        if not self._dirty:
+            return
+        keys = list(self._clean)[-self.MAX_ENTRIES :]
+        self.cache_file.write_bytes(fast_json.dumps({"version": self._version, "clean": keys}))
+        self._dirty = False
+
+
 def generate_frontmatter(
     memory_type: str = "semantic",
     source_agent_id: Optional[str] = None,
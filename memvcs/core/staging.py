@@ -7,10 +7,16 @@ Manages the index of files staged for commit.
 import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 
+from . import fast_json
+from .workers import io_workers
+
+STAGING_WRITE_WORKERS = io_workers()
+
 
 @dataclass
 class StagedFile:
@@ -34,6 +40,57 @@ def _path_under_root(relative_path: str, root: Path) -> Optional[Path]:
         return None
 
 
+class StatCache:
+    """
+    Persistent (mtime, size, inode) -> blob hash cache for working files.
+
+    Lets staging skip re-hashing files whose stat data is unchanged, like Git's
+    index stat info. Survives commits (unlike the staging index).
+    """
+
+    # Entries modified this recently are not cached: a write within the same
+    # timestamp granularity would otherwise go unnoticed ("racily clean").
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, mem_dir: Path):
+        self.cache_file = Path(mem_dir) / "stat_cache.json"
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+        if self.cache_file.exists():
+            try:
+                self._entries = fast_json.loads(self.cache_file.read_bytes())
+            except (ValueError, OSError):
+                self._entries = {}
+
+    @staticmethod
+    def _key(st: os.stat_result) -> list:
+        return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+    def lookup(self, filepath: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached blob hash if the file's stat data is unchanged."""
+        entry = self._entries.get(filepath)
+        if entry and entry[:3] == self._key(st):
+            return entry[3]
+        return None
+
+    def record(self, filepath: str, st: os.stat_result, blob_hash: str, now_ns: int):
+        """Remember the blob hash for this stat data unless the file is racily recent."""
+        if now_ns - st.st_mtime_ns < self.RACY_WINDOW_NS:
+            if self._entries.pop(filepath, None) is not None:
+                self._dirty = True
+            return
+        entry = self._key(st) + [blob_hash]
+        if self._entries.get(filepath) != entry:
+            self._entries[filepath] = entry
+            self._dirty = True
+
+    def save(self):
+        """Persist the cache if it changed."""
+        if self._dirty:
+            self.cache_file.write_bytes(fast_json.dumps(self._entries))
+            self._dirty = False
+
+
 class StagingArea:
     """Manages the staging area for memory commits."""
 
@@ -48,14 +105,14 @@ class StagingArea:
         """Load the staging index from disk."""
         if self.index_file.exists():
             try:
-                data = json.loads(self.index_file.read_text())
+                data = fast_json.loads(self.index_file.read_bytes())
                 for path, info in data.items():
                     if _path_under_root(path, self.staging_dir) is None:
                         continue
                     self._index[path] = StagedFile(
                         path=path, blob_hash=info["blob_hash"], mode=info.get("mode", 0o100644)
                     )
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 self._index = {}
 
     def _save_index(self):
@@ -63,7 +120,7 @@ class StagingArea:
         data = {
             path: {"blob_hash": sf.blob_hash, "mode": sf.mode} for path, sf in self._index.items()
         }
-        self.index_file.write_text(json.dumps(data, indent=2))
+        self.index_file.write_bytes(fast_json.dumps(data, indent=True))
 
     def add(self, filepath: str, blob_hash: str, content: bytes, mode: int = 0o100644):
         """
@@ -89,6 +146,43 @@ class StagingArea:
 
         self._save_index()
 
+    def add_many(self, files: Iterable[Tuple[str, str, bytes]], mode: int = 0o100644):
+        """
+        Add several files to the staging area, writing the index once.
+
+        Args:
+            files: Iterable of (filepath, blob_hash, content) tuples
+
+        Raises:
+            ValueError: If any filepath escapes staging directory (path traversal)
+        """
+        resolved = []
+        for filepath, blob_hash, content in files:
+            staging_path = _path_under_root(filepath, self.staging_dir)
+            if staging_path is None:
+                raise ValueError(f"Path escapes staging area: {filepath}")
+            resolved.append((filepath, blob_hash, content, staging_path))
+
+        if not resolved:
+            return
+
+        for parent in {staging_path.parent for _, _, _, staging_path in resolved}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        def write(item):
+            _, _, content, staging_path = item
+            staging_path.write_bytes(content)
+
+        if len(resolved) > 1:
+            with ThreadPoolExecutor(max_workers=STAGING_WRITE_WORKERS) as pool:
+                list(pool.map(write, resolved))
+        else:
+            write(resolved[0])
+
+        for filepath, blob_hash, _, _ in resolved:
+            self._index[filepath] = StagedFile(path=filepath, blob_hash=blob_hash, mode=mode)
+        self._save_index()
+
     def remove(self, filepath: str) -> bool:
         """
         Remove a file from the staging area.
@@ -135,6 +229,24 @@ class StagingArea:
             return self._index[filepath].blob_hash
         return None
 
+    def read_staged(self, filepath: str, limit: Optional[int] = None) -> Optional[bytes]:
+        """
+        Read the uncompressed copy of a staged file, or its first limit bytes.
+
+        Returns None if the file is not staged or its copy is missing; callers
+        can then fall back to the blob in the object store.
+        """
+        if filepath not in self._index:
+            return None
+        staging_path = _path_under_root(filepath, self.staging_dir)
+        if staging_path is None:
+            return None
+        try:
+            with open(staging_path, "rb") as f:
+                return f.read() if limit is None else f.read(limit)
+        except OSError:
+            return None
+
     def clear(self):
         """Clear the entire staging area."""
         self._index = {}
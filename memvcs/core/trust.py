@@ -101,3 +101,41 @@ def find_verifying_key(mem_dir: Path, commit_metadata: Dict[str, Any]) -> Option
         if verify_signature(root, sig, pem_b):
             return pem_b
     return None
+
+
+def commit_trust_level(repo: Any, commit_hash: str) -> Optional[str]:
+    """
+    Trust level of the trust-store key that verifies commit_hash's signature.
+
+    Returns None if the commit is unsigned or no key verifies it. Same result as
+    find_verifying_key + get_trust_level, but the trust store is read once and
+    the answer is memoized on repo for the process, keyed on the commit, its
+    signature and the trust store's stat data (so set_trust invalidates it).
+    """
+    from .objects import Commit
+
+    commit = Commit.load(repo.object_store, commit_hash)
+    metadata = (commit.metadata if commit else None) or {}
+    root = metadata.get("merkle_root")
+    sig = metadata.get("signature")
+    if not root or not sig:
+        return None
+
+    try:
+        st = _trust_file(repo.mem_dir).stat()
+        store_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        store_key = None
+    cache_key = (commit_hash, root, sig, store_key)
+    cache = repo._trust_cache
+    if cache_key not in cache:
+        from .crypto_verify import verify_signature
+
+        level = None
+        for e in load_trust_store(repo.mem_dir):
+            pem = e.get("public_key_pem")
+            if pem and verify_signature(root, sig, _ensure_bytes(pem)):
+                level = e.get("level")
+                break
+        cache[cache_key] = level
+    return cache[cache_key]
@@ -5,17 +5,24 @@ Uses sqlite-vec for local vector storage and sentence-transformers for embedding
 Requires: pip install agmem[vector]
 """
 
+import contextlib
 import logging
 import struct
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+from . import fast_json
 from .constants import MEMORY_TYPES
 
 logger = logging.getLogger("agmem.vector_store")
 
 # Embedding dimension for all-MiniLM-L6-v2
 EMBEDDING_DIM = 384
+# Rowids per DELETE ... IN (...) statement; stays under SQLite's bound-parameter limit
+DELETE_BATCH_SIZE = 500
+# How long the cached sqlite-vec availability probe in .mem/features.json is trusted
+FEATURE_CACHE_TTL_SECONDS = 24 * 3600
 
 
 def _serialize_f32(vector: List[float]) -> bytes:
@@ -23,6 +30,55 @@ def _serialize_f32(vector: List[float]) -> bytes:
     return struct.pack(f"{len(vector)}f", *vector)
 
 
+def _probe_sqlite_vec() -> bool:
+    """Return True if sqlite-vec imports and loads into an in-memory SQLite database."""
+    try:
+        import sqlite3
+        import sqlite_vec
+
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.enable_load_extension(True)
+            sqlite_vec.load(conn)
+        finally:
+            conn.close()
+        return True
+    except Exception:
+        return False
+
+
+def vector_store_available(mem_dir: Path) -> bool:
+    """
+    Whether VectorStore can open its database, without opening it.
+
+    The probe result is cached in .mem/features.json for FEATURE_CACHE_TTL_SECONDS,
+    so CLI runs skip the import and extension load (installing agmem[vector]
+    takes effect once the entry expires or the file is removed).
+    """
+    cache_file = Path(mem_dir) / "features.json"
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        cached = fast_json.loads(cache_file.read_bytes())
+        if 0 <= time.time() - cached["ts"] < FEATURE_CACHE_TTL_SECONDS:
+            return bool(cached["vector_store"])
+    available = _probe_sqlite_vec()
+    with contextlib.suppress(OSError):
+        cache_file.write_bytes(fast_json.dumps({"vector_store": available, "ts": time.time()}))
+    return available
+
+
+def forget_vector_store_available(mem_dir: Path) -> None:
+    """Drop the cached probe result so the next vector_store_available() probes again."""
+    cache_file = Path(mem_dir) / "features.json"
+    with contextlib.suppress(OSError, ValueError, TypeError):
+        cached = fast_json.loads(cache_file.read_bytes())
+        cached.pop("vector_store", None)
+        cached.pop("ts", None)
+        if cached:
+            cache_file.write_bytes(fast_json.dumps(cached))
+        else:
+            cache_file.unlink()
+
+
 class VectorStore:
     """Semantic search over memory using vector embeddings."""
 
@@ -126,6 +182,17 @@ class VectorStore:
         emb = model.encode(text, convert_to_numpy=True)
         return emb.astype("float32").tolist()
 
+    def embed_many(self, texts: List[str]):
+        """
+        Embed several texts in one batched model call.
+
+        Returns a float32 array of shape (len(texts), EMBEDDING_DIM) whose rows
+        are L2-normalized, so row dot products are cosine similarities.
+        """
+        model = self._get_model()
+        emb = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+        return emb.astype("float32")
+
     def index_content(
         self,
         path: str,
@@ -296,6 +363,16 @@ class VectorStore:
             for rowid, path, blob_hash, commit_hash, author, indexed_at in rows
         ]
 
+    def iter_entries(self) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (rowid, path) for every indexed entry, streamed from the cursor.
+
+        Used by fsck, which only needs paths and should not hold the whole table.
+        """
+        self._ensure_tables()
+        conn = self._get_connection()
+        yield from conn.execute("SELECT rowid, path FROM memory_meta")
+
     def delete_entry(self, rowid: int) -> bool:
         """
         Delete an entry by rowid.
@@ -313,6 +390,35 @@ class VectorStore:
             logger.warning("Failed to delete entry %s: %s", rowid, e)
             return False
 
+    def delete_entries(self, rowids: Iterable[int]) -> int:
+        """
+        Delete several entries by rowid in one transaction.
+
+        Used by fsck to remove dangling vectors. Returns the number of entries
+        deleted (0 if the transaction failed and was rolled back).
+        """
+        rowids = list(rowids)
+        if not rowids:
+            return 0
+        conn = self._get_connection()
+        deleted = 0
+        try:
+            with conn:
+                for start in range(0, len(rowids), DELETE_BATCH_SIZE):
+                    chunk = rowids[start : start + DELETE_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    deleted += conn.execute(
+                        f"DELETE FROM memory_meta WHERE rowid IN ({placeholders})", chunk
+                    ).rowcount
+                # vec0 virtual tables are only guaranteed to support rowid equality
+                conn.executemany(
+                    "DELETE FROM vec_memory WHERE rowid = ?", [(rowid,) for rowid in rowids]
+                )
+            return deleted
+        except Exception as e:
+            logger.warning("Failed to delete %d entries: %s", len(rowids), e)
+            return 0
+
     def rebuild_index(self, current_dir: Path) -> int:
         """Clear and rebuild the vector index from current/."""
         conn = self._get_connection()
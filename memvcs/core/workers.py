@@ -0,0 +1,23 @@
+"""
+agmem worker pools - shared sizing for thread and process pools.
+"""
+
+import os
+
+# Upper bound on I/O pool threads, whatever the core count
+MAX_IO_WORKERS = 32
+
+
+def io_workers() -> int:
+    """
+    Worker count for pools of syscall-bound jobs (file reads, writes, copies, unlinks).
+
+    Threads mostly wait on the kernel, so run several per core, capped so large
+    hosts do not start hundreds of threads.
+    """
+    return min(MAX_IO_WORKERS, (os.cpu_count() or 1) * 4)
+
+
+def cpu_workers() -> int:
+    """Worker count for pools of CPU-bound jobs (hashing, compression, validation)."""
+    return os.cpu_count() or 1
@@ -4,6 +4,7 @@ Pack engine - context window budget manager for agmem.
 Fills token budget with most relevant memories, optionally with summarization cascade.
 """
 
+from functools import lru_cache
 from typing import List, Optional, Any
 from dataclasses import dataclass
 
@@ -11,6 +12,17 @@ from .base import RecallResult
 from .recaller import RecallEngine
 
 
+@lru_cache(maxsize=8)
+def _encoding_for_model(model: str):
+    """Return the tiktoken encoding for model, built once per process; None if unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model(model)
+    except Exception:  # not installed, or unknown model
+        return None
+
+
 @dataclass
 class PackResult:
     """Result of packing memories into budget."""
@@ -37,14 +49,12 @@ class PackEngine:
 
     def _count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken."""
-        try:
-            import tiktoken
-
-            enc = tiktoken.encoding_for_model(self.model)
-            return len(enc.encode(text))
-        except ImportError:
+        enc = _encoding_for_model(self.model)
+        if enc is None:
             # Fallback: ~4 chars per token
             return len(text) // 4
+        try:
+            return len(enc.encode(text))
         except Exception:
             return len(text) // 4
 
@@ -63,25 +63,34 @@ class RecallEngine:
         """
         exclude_list = [e.strip() for e in (exclude or []) if e.strip()]
 
-        cached = self._get_cached_results(context, strategy, limit, exclude_list)
-        if cached is not None:
-            return cached
-
         effective_strategy = (
             "recency" if (strategy == "hybrid" and not self.vector_store) else strategy
         )
+        # Results are cached under the strategy that produced them and the HEAD
+        # commit, so a repeat at the same commit skips the strategy entirely
+        head_hash = self.repo.resolve_ref("HEAD") or ""
+        cached = self._get_cached_results(
+            context, effective_strategy, limit, exclude_list, head_hash
+        )
+        if cached is not None:
+            return cached
+
         strat = self._get_strategy(effective_strategy)
         results = strat.recall(context=context, limit=limit, exclude=exclude_list)
 
-        self._record_access_and_cache(context, effective_strategy, limit, exclude_list, results)
+        self._record_access_and_cache(
+            context, effective_strategy, limit, exclude_list, results, head_hash
+        )
         return results
 
     def _get_cached_results(
-        self, context: str, strategy: str, limit: int, exclude: List[str]
+        self, context: str, strategy: str, limit: int, exclude: List[str], head_hash: str
     ) -> Optional[List[RecallResult]]:
         if not (self.use_cache and self.access_index and context):
             return None
-        cached = self.access_index.get_cached_recall(context, strategy, limit, exclude)
+        cached = self.access_index.get_cached_recall(
+            context, strategy, limit, exclude, head=head_hash
+        )
         if not cached or not cached.get("results"):
             return None
         return [RecallResult(**r) if isinstance(r, dict) else r for r in cached["results"]]
@@ -93,13 +102,12 @@ class RecallEngine:
         limit: int,
         exclude: List[str],
         results: List[RecallResult],
+        head_hash: str,
     ) -> None:
         if self.access_index:
-            head = self.repo.get_head_commit()
-            commit_hash = head.store(self.repo.object_store) if head else ""
             for r in results:
-                self.access_index.record_access(r.path, commit_hash)
+                self.access_index.record_access(r.path, head_hash)
         if self.use_cache and self.access_index and context and results:
             self.access_index.set_cached_recall(
-                context, strategy, limit, exclude, [r.to_dict() for r in results]
+                context, strategy, limit, exclude, [r.to_dict() for r in results], head=head_hash
             )
@@ -0,0 +1,30 @@
+"""Shared fixtures for command tests."""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from memvcs.core.repository import Repository
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    """Empty repository in a temporary directory, which is also the working directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Repository.init(path=Path(tmpdir))
+        monkeypatch.chdir(tmpdir)
+        yield repo
+
+
+@pytest.fixture
+def run_command():
+    """Return a helper that parses argv with a command's own arguments and executes it."""
+
+    def run(command, *argv):
+        parser = argparse.ArgumentParser(prog=f"agmem {command.name}")
+        command.add_arguments(parser)
+        return command.execute(parser.parse_args(list(argv)))
+
+    return run
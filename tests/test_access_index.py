@@ -56,6 +56,13 @@ class TestAccessIndex(unittest.TestCase):
             k2 = idx.get_cache_key("ctx", "hybrid", 10, ["b", "a"])
             assert k1 == k2
 
+    def test_cached_recall_is_per_head(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            idx = AccessIndex(Path(tmpdir))
+            idx.set_cached_recall("ctx", "recency", 5, [], [{"path": "p.md"}], head="a" * 64)
+            assert idx.get_cached_recall("ctx", "recency", 5, [], head="a" * 64) is not None
+            assert idx.get_cached_recall("ctx", "recency", 5, [], head="b" * 64) is None
+
     def test_set_and_get_cached_recall(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             idx = AccessIndex(Path(tmpdir))
@@ -65,3 +72,16 @@ class TestAccessIndex(unittest.TestCase):
             assert cached is not None
             assert cached["results"] == results
             assert "cached_at" in cached
+
+    def test_cached_recall_expires(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            idx = AccessIndex(Path(tmpdir))
+            idx.set_cached_recall("ctx", "recency", 5, [], [{"path": "p.md"}])
+            assert idx.get_cached_recall("ctx", "recency", 5, [], max_age=0) is None
+
+            # Survives across instances (i.e. CLI invocations) while fresh
+            assert AccessIndex(Path(tmpdir)).get_cached_recall("ctx", "recency", 5, []) is not None
+
+            # Entries written before expiry was tracked are treated as stale
+            del idx._load()["recall_cache"][idx.get_cache_key("ctx", "recency", 5, [])]["cached_ts"]
+            assert idx.get_cached_recall("ctx", "recency", 5, []) is None
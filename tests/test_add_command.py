@@ -0,0 +1,160 @@
+"""Tests for agmem add: binary detection, extension validation and directory staging."""
+
+import os
+from pathlib import Path
+
+from memvcs.commands import add as add_module
+from memvcs.commands.add import AddCommand
+from memvcs.core.repository import Repository
+
+
+def _staged(repo):
+    """Reload staging from disk; execute() works on its own Repository instance."""
+    return Repository(repo.root).staging.get_staged_files()
+
+
+class TestBinaryDetection:
+    """Test magic-byte and NUL-byte binary detection."""
+
+    def test_known_signatures_are_binary(self):
+        assert AddCommand._is_binary_header(b"\x89PNG\r\n\x1a\n")
+        assert AddCommand._is_binary_header(b"%PDF-1.7")
+        assert AddCommand._is_binary_header(b"PK\x03\x04rest")
+
+    def test_nul_byte_is_binary(self):
+        assert AddCommand._is_binary_header(b"abc\x00def")
+
+    def test_nul_byte_past_magic_prefix_is_binary(self, tmp_path):
+        target = tmp_path / "notes.md"
+        target.write_bytes(b"a" * 1000 + b"\x00" + b"b" * 100)
+        assert AddCommand._is_binary_file(target)
+
+    def test_text_is_not_binary(self):
+        assert not AddCommand._is_binary_header(b"# Notes\nuser prefers")
+        assert not AddCommand._is_binary_header(b"")
+        assert not AddCommand._is_binary_header(None)
+
+    def test_is_binary_file_reads_header(self, tmp_path):
+        png = tmp_path / "image.md"
+        png.write_bytes(b"\x89PNG\r\n\x1a\n" + b"x" * 64)
+        text = tmp_path / "notes.md"
+        text.write_text("plain text")
+        assert AddCommand._is_binary_file(png)
+        assert not AddCommand._is_binary_file(text)
+        assert not AddCommand._is_binary_file(tmp_path / "missing.md")
+
+
+class TestExtensionValidation:
+    """Test allowed-extension handling."""
+
+    def test_allowed_extensions_defaults_and_config(self):
+        assert ".md" in AddCommand._allowed_extensions({})
+        allowed = AddCommand._allowed_extensions({"allowed_extensions": [".CSV", ".md"]})
+        assert allowed == frozenset({".csv", ".md"})
+
+    def test_is_allowed_extension(self):
+        allowed = AddCommand._allowed_extensions({})
+        assert AddCommand._is_allowed_extension(Path("a/NOTES.MD"), allowed)
+        assert AddCommand._is_allowed_extension(Path("README"), allowed)
+        assert not AddCommand._is_allowed_extension(Path("run.py"), allowed)
+
+    def test_rejection_lists_recommended_extensions(self, tmp_path):
+        target = tmp_path / "run.py"
+        target.write_text("x = 1")
+        allowed = AddCommand._allowed_extensions({"allowed_extensions": [".txt", ".md"]})
+        is_valid, message = AddCommand._validate_file(target, allowed, False, False)
+        assert not is_valid
+        assert "Recommended: .md, .txt" in message
+
+    def test_extension_rejection_does_not_open_file(self, tmp_path, monkeypatch):
+        def fail(_):
+            raise AssertionError("file should not be opened")
+
+        monkeypatch.setattr(AddCommand, "_read_header", staticmethod(fail))
+        allowed = AddCommand._allowed_extensions({})
+        is_valid, message = AddCommand._validate_file(tmp_path / "a.png", allowed, False, False)
+        assert not is_valid
+        assert "extension '.png'" in message
+
+    def test_force_still_rejects_binary(self, tmp_path):
+        target = tmp_path / "image.png"
+        target.write_bytes(b"\x89PNG\r\n\x1a\n")
+        allowed = AddCommand._allowed_extensions({})
+        is_valid, message = AddCommand._validate_file(target, allowed, True, False)
+        assert not is_valid
+        assert "binary" in message
+
+
+class TestAddExecute:
+    """Test staging through AddCommand.execute."""
+
+    def test_add_dot_stages_text_and_rejects_binary(self, repo, run_command):
+        (repo.current_dir / "semantic" / "prefs.md").write_text("dark mode")
+        (repo.current_dir / "episodic" / "log.txt").write_text("session")
+        (repo.current_dir / "episodic" / "blob.md").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        assert run_command(AddCommand, ".") == 0
+
+        staged = _staged(repo)
+        assert "semantic/prefs.md" in staged
+        assert "episodic/log.txt" in staged
+        assert "episodic/blob.md" not in staged
+
+    def test_add_skips_hidden_files(self, repo, run_command):
+        (repo.current_dir / "semantic" / ".hidden.md").write_text("secret")
+        hidden_dir = repo.current_dir / ".cache"
+        hidden_dir.mkdir()
+        (hidden_dir / "note.md").write_text("cached")
+        (repo.current_dir / "semantic" / "visible.md").write_text("visible")
+
+        run_command(AddCommand, ".")
+
+        staged = _staged(repo)
+        assert list(staged) == ["semantic/visible.md"]
+
+    def test_add_rejects_extension_without_force(self, repo, run_command):
+        (repo.current_dir / "semantic" / "script.py").write_text("print(1)")
+
+        run_command(AddCommand, "semantic/script.py")
+        assert not _staged(repo)
+
+        run_command(AddCommand, "semantic/script.py", "--force")
+        assert "semantic/script.py" in _staged(repo)
+
+    def test_add_allow_binary(self, repo, run_command):
+        (repo.current_dir / "semantic" / "data.md").write_bytes(b"ab\x00cd")
+
+        run_command(AddCommand, "semantic", "--allow-binary")
+        assert "semantic/data.md" in _staged(repo)
+
+    def test_add_keeps_a_bounded_window_of_headers(self, repo, run_command, monkeypatch):
+        monkeypatch.setattr(add_module, "HEADER_READ_WORKERS", 2)
+        for i in range(20):
+            (repo.current_dir / "semantic" / f"f{i:02d}.md").write_text(str(i))
+        in_flight = []
+        real_read = AddCommand._read_header
+        real_validate = AddCommand._validate_file
+
+        def read(filepath):
+            in_flight.append(filepath)
+            return real_read(filepath)
+
+        def validate(filepath, *args):
+            in_flight.remove(filepath)
+            assert len(in_flight) < 4
+            return real_validate(filepath, *args)
+
+        monkeypatch.setattr(AddCommand, "_read_header", staticmethod(read))
+        monkeypatch.setattr(AddCommand, "_validate_file", staticmethod(validate))
+        assert run_command(AddCommand, "semantic") == 0
+        assert len(_staged(repo)) == 20
+
+    def test_add_copies_file_from_outside_current(self, repo, run_command, tmp_path):
+        outside = tmp_path / "external.md"
+        outside.write_text("imported memory")
+        rel = os.path.relpath(outside, repo.root)
+
+        run_command(AddCommand, rel)
+
+        assert (repo.current_dir / "external.md").read_text() == "imported memory"
+        assert "external.md" in _staged(repo)
@@ -1,9 +1,11 @@
 """Tests for advanced CLI commands: show --at, diff --from/--to, when, timeline, recall, pack, decay, verify."""
 
+import io
 import subprocess
 import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
 
 from memvcs.core.repository import Repository
@@ -54,6 +56,155 @@ class TestDiffFromTo:
             r = _run_agmem(tmpdir, "diff", "--from-ref", "HEAD~1", "--to-ref", "HEAD")
             assert r.returncode == 0
 
+    def test_diff_working_tree_against_head(self):
+        from memvcs.commands.diff import _iter_working_files
+        from memvcs.core.objects import hash_object
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("v1")
+            repo.stage_file("semantic/a.md")
+            repo.commit("C1")
+            (repo.current_dir / "semantic" / "a.md").write_text("v2")
+            (repo.current_dir / ".hidden").mkdir()
+            (repo.current_dir / ".hidden" / "x.md").write_text("skip")
+            working = {path: load() for path, load in _iter_working_files(repo)}
+            assert list(working) == ["semantic/a.md"]
+            assert working["semantic/a.md"].content == b"v2"
+            r = _run_agmem(tmpdir, "diff", "--stat")
+            assert r.returncode == 0
+            assert "1 file(s) modified" in r.stdout
+
+    def test_diff_skips_reading_files_matching_stat_cache(self):
+        import os
+
+        from memvcs.commands.diff import _iter_working_files
+        from memvcs.core.diff import DiffEngine
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            for name, text in (("a.md", "A"), ("b.md", "B")):
+                path = repo.current_dir / "semantic" / name
+                path.write_text(text)
+                os.utime(path, (1_000_000_000, 1_000_000_000))
+            repo.stage_files(["semantic/a.md", "semantic/b.md"])
+            head = repo.commit("C1")
+            # Staged again after the commit, so the cached blob differs from HEAD
+            path = repo.current_dir / "semantic" / "b.md"
+            path.write_text("B2")
+            os.utime(path, (1_000_000_100, 1_000_000_100))
+            repo.stage_files(["semantic/b.md"])
+
+            working = {path: load() for path, load in _iter_working_files(repo)}
+            assert working["semantic/a.md"].content is None
+            assert working["semantic/b.md"].content is None
+            tree_diff = DiffEngine(repo.object_store).diff_working_dir(head, working)
+            assert [f.path for f in tree_diff.files] == ["semantic/b.md"]
+            assert tree_diff.files[0].new_content == "B2"
+
+    def test_diff_cached_loads_only_changed_blobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("one")
+            repo.stage_file("a.md")
+            repo.commit("C1")
+            (repo.current_dir / "a.md").write_text("two")
+            repo.stage_file("a.md")
+            r = _run_agmem(tmpdir, "diff", "--cached")
+            assert r.returncode == 0
+            assert "+ two" in r.stdout
+            assert "1 file(s) modified" in r.stdout
+
+    def test_diff_cached_reports_missing_staged_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("one")
+            repo.stage_file("a.md")
+            repo.commit("C1")
+            (repo.current_dir / "a.md").write_text("two")
+            staged = repo.stage_file("a.md")
+            (repo.mem_dir / "objects" / "blob" / staged[:2] / staged[2:]).unlink()
+            r = _run_agmem(tmpdir, "diff", "--cached")
+            assert r.returncode == 0
+            assert "Staged object for a.md is missing" in r.stdout
+            assert "- one" not in r.stdout
+
+    def test_iter_working_files_copies_only_changed_small_files(self):
+        from memvcs.commands.diff import _iter_working_files
+        from memvcs.core.objects import hash_object
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "same.md").write_text("same")
+            (repo.current_dir / "new.md").write_text("new")
+            base = {"same.md": hash_object(b"same", "blob")}
+            working = {path: load() for path, load in _iter_working_files(repo, base)}
+            assert working["same.md"].blob_hash == base["same.md"]
+            assert working["same.md"].content is None
+            assert working["new.md"].blob_hash == hash_object(b"new", "blob")
+            assert working["new.md"].content == b"new"
+
+    def test_diff_commits_without_content_only_counts(self):
+        from memvcs.core.diff import DiffEngine
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("v1")
+            repo.stage_file("a.md")
+            c1 = repo.commit("C1")
+            (repo.current_dir / "a.md").write_text("v2")
+            (repo.current_dir / "b.md").write_text("b")
+            repo.stage_files(["a.md", "b.md"])
+            c2 = repo.commit("C2")
+
+            engine = DiffEngine(repo.object_store)
+            stats = engine.diff_commits(c1, c2, with_content=False)
+            full = engine.diff_commits(c1, c2)
+            assert (stats.added_count, stats.modified_count) == (1, 1)
+            assert [f.path for f in stats.files] == [f.path for f in full.files]
+            assert all(f.diff_lines == [] and f.new_content is None for f in stats.files)
+            assert full.files[0].new_content == "v2"
+
+    def test_read_sized_reads_past_a_stale_size(self, tmp_path):
+        from memvcs.commands.diff import _read_sized
+
+        path = tmp_path / "grown.md"
+        path.write_bytes(b"x" * 100_000)
+        assert _read_sized(str(path), 100_000) == b"x" * 100_000
+        assert _read_sized(str(path), 10) == b"x" * 100_000
+
+    def test_diff_working_dir_streaming_merges_sorted_paths(self):
+        from memvcs.core.diff import DiffEngine, DiffType
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            for name in ("b.md", "d.md", "f.md"):
+                (repo.current_dir / name).write_text(name)
+            repo.stage_files(["b.md", "d.md", "f.md"])
+            head = repo.commit("C1")
+            loaded = []
+
+            def loader(path, content):
+                return lambda: loaded.append(path) or content
+
+            stream = [
+                ("a.md", loader("a.md", b"new")),
+                ("d.md", loader("d.md", b"d.md")),
+                ("e.md", loader("e.md", b"e")),
+                ("f.md", loader("f.md", b"changed")),
+            ]
+            tree_diff = DiffEngine(repo.object_store).diff_working_dir_streaming(head, stream)
+            assert [(f.path, f.diff_type) for f in tree_diff.files] == [
+                ("a.md", DiffType.ADDED),
+                ("b.md", DiffType.DELETED),
+                ("e.md", DiffType.ADDED),
+                ("f.md", DiffType.MODIFIED),
+            ]
+            assert tree_diff.added_count == 2
+            assert tree_diff.deleted_count == 1
+            assert tree_diff.modified_count == 1
+            assert loaded == ["a.md", "d.md", "e.md", "f.md"]
+
 
 class TestWhen(unittest.TestCase):
     """Test agmem when fact."""
@@ -101,6 +252,18 @@ class TestRecallCli(unittest.TestCase):
             assert r.returncode == 0
             assert "[" in r.stdout or "path" in r.stdout
 
+    def test_json_array_is_streamed_like_indented_dump(self):
+        import json
+
+        from memvcs.commands.recall import _write_json_array
+
+        items = [{"path": "a.md", "content": "x\ny", "tags": ["t"]}, {"path": "b.md"}]
+        with redirect_stdout(io.TextIOWrapper(io.BytesIO(), encoding="utf-8")) as out:
+            _write_json_array(iter(items))
+            _write_json_array(iter([]))
+            out.seek(0)
+            assert out.read() == json.dumps(items, indent=2) + "\n[]\n"
+
 
 class TestPackCli:
     """Test agmem pack."""
@@ -113,6 +276,32 @@ class TestPackCli:
             assert r.returncode == 0
             assert len(r.stdout) >= 0
 
+    def test_pack_falls_back_when_cached_probe_is_wrong(self):
+        import time
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "prefs.md").write_text("prefs")
+            features = repo.mem_dir / "features.json"
+            features.write_text(f'{{"vector_store": true, "ts": {time.time()}}}')
+            r = _run_agmem(tmpdir, "pack", "--context", "hello")
+            assert r.returncode == 0, r.stderr
+            assert "prefs" in r.stdout
+            assert not features.exists()
+
+    def test_pack_json_is_one_compact_document(self):
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "prefs.md").write_text("prefs")
+            r = _run_agmem(tmpdir, "pack", "--context", "task", "--format", "json")
+            assert r.returncode == 0
+            assert r.stdout.count("\n") == 1
+            data = json.loads(r.stdout)
+            assert data["items_used"] == data["items_total"] == 1
+            assert "prefs" in data["content"]
+
 
 class TestDecayCli(unittest.TestCase):
     """Test agmem decay --dry-run."""
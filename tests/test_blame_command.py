@@ -0,0 +1,46 @@
+"""Tests for agmem blame (file mode)."""
+
+import pytest
+
+from memvcs.commands.blame import BlameCommand
+
+
+@pytest.fixture
+def repo(repo):
+    (repo.current_dir / "semantic" / "prefs.md").write_text("dark mode\nvim keys\n")
+    repo.stage_file("semantic/prefs.md")
+    repo.commit("Add prefs")
+    return repo
+
+
+class TestFileBlame:
+    """Test line-by-line blame output."""
+
+    def test_blame_prints_each_line(self, repo, run_command, capsys):
+        assert run_command(BlameCommand, "semantic/prefs.md") == 0
+
+        head = repo.resolve_ref("HEAD")[:8]
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            f"{head} (Agent                   1) dark mode",
+            f"{head} (Agent                   2) vim keys",
+        ]
+
+    def test_blame_missing_file(self, repo, run_command, capsys):
+        assert run_command(BlameCommand, "semantic/missing.md") == 1
+        assert "File not found" in capsys.readouterr().out
+
+    def test_blame_unknown_ref(self, repo, run_command, capsys):
+        assert run_command(BlameCommand, "semantic/prefs.md", "nope") == 1
+        assert "Unknown revision" in capsys.readouterr().out
+
+    def test_blame_handles_crlf_and_invalid_utf8(self, repo, run_command, capsys):
+        (repo.current_dir / "semantic" / "raw.md").write_bytes(b"one\r\ntw\xffo\n")
+        repo.stage_file("semantic/raw.md")
+        repo.commit("Add raw")
+
+        assert run_command(BlameCommand, "semantic/raw.md") == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].endswith("   1) one")
+        assert lines[1].endswith("   2) tw�o")
@@ -0,0 +1,45 @@
+"""Tests for agmem checkout."""
+
+import pytest
+
+from memvcs.commands.checkout import CheckoutCommand
+from memvcs.core.repository import Repository
+
+
+@pytest.fixture
+def repo(repo):
+    (repo.current_dir / "semantic" / "a.md").write_text("v1")
+    repo.stage_file("semantic/a.md")
+    first = repo.commit("C1")
+    repo.refs.create_tag("v1", first)
+    repo.refs.create_branch("other", first)
+    (repo.current_dir / "semantic" / "a.md").write_text("v2")
+    repo.stage_file("semantic/a.md")
+    repo.commit("C2")
+    return repo
+
+
+class TestCheckout:
+    """Test checkout of branches, tags and commits."""
+
+    def test_checkout_branch(self, repo, run_command, capsys):
+        assert run_command(CheckoutCommand, "other") == 0
+        assert "Switched to branch 'other'" in capsys.readouterr().out
+        reloaded = Repository(repo.root)
+        assert reloaded.refs.get_current_branch() == "other"
+        assert (repo.current_dir / "semantic" / "a.md").read_text() == "v1"
+
+    def test_checkout_tag_detaches_head(self, repo, run_command, capsys):
+        assert run_command(CheckoutCommand, "v1") == 0
+        out = capsys.readouterr().out
+        assert "Note: checking out 'v1'." in out
+        assert Repository(repo.root).refs.is_detached()
+
+    def test_checkout_commit_hash(self, repo, run_command, capsys):
+        target = repo.resolve_ref("v1")
+        assert run_command(CheckoutCommand, target) == 0
+        assert f"Note: checking out '{target[:8]}'." in capsys.readouterr().out
+
+    def test_checkout_unknown_ref(self, repo, run_command, capsys):
+        assert run_command(CheckoutCommand, "nope") == 1
+        assert "Reference not found: nope" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+"""Tests for agmem clean."""
+
+import pytest
+
+from memvcs.commands import clean as clean_module
+from memvcs.commands.clean import CleanCommand
+
+
+@pytest.fixture
+def repo(repo):
+    (repo.current_dir / "semantic" / "kept.md").write_text("kept")
+    repo.stage_file("semantic/kept.md")
+    repo.commit("C1")
+    for i in range(5):
+        (repo.current_dir / "episodic" / f"scratch{i}.md").write_text(str(i))
+    return repo
+
+
+class TestClean:
+    """Test removal of untracked files."""
+
+    def test_dry_run_removes_nothing(self, repo, run_command, capsys):
+        assert run_command(CleanCommand, "--dry-run") == 0
+        assert "episodic/scratch0.md" in capsys.readouterr().out
+        assert len(list((repo.current_dir / "episodic").iterdir())) == 5
+
+    def test_requires_force(self, repo, run_command):
+        assert run_command(CleanCommand) == 1
+        assert len(list((repo.current_dir / "episodic").iterdir())) == 5
+
+    def test_force_removes_untracked_only(self, repo, run_command, capsys):
+        assert run_command(CleanCommand, "--force") == 0
+
+        out = capsys.readouterr().out
+        assert "Removed 5 file(s)" in out
+        assert list((repo.current_dir / "episodic").iterdir()) == []
+        assert (repo.current_dir / "semantic" / "kept.md").exists()
+
+    def test_failed_removal_is_reported(self, repo, run_command, capsys, monkeypatch):
+        real_unlink = clean_module.os.unlink
+
+        def unlink(path):
+            if path.endswith("scratch2.md"):
+                raise PermissionError(13, "Permission denied")
+            real_unlink(path)
+
+        monkeypatch.setattr(clean_module.os, "unlink", unlink)
+        assert run_command(CleanCommand, "--force") == 1
+        monkeypatch.undo()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "Failed to remove episodic/scratch2.md: Permission denied" in lines
+        assert "Removed episodic/scratch0.md" in lines
+        assert lines[-2:] == ["Removed 4 file(s)", "Failed to remove 1 file(s)"]
+        assert [p.name for p in (repo.current_dir / "episodic").iterdir()] == ["scratch2.md"]
+
+    def test_dry_run_lists_all_paths(self, repo, run_command, capsys):
+        run_command(CleanCommand, "--dry-run")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Would remove:"
+        assert sorted(lines[1:]) == [f"  episodic/scratch{i}.md" for i in range(5)]
@@ -0,0 +1,98 @@
+"""Tests for the agmem CLI dispatcher and lazy command registry."""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from memvcs import cli, commands
+from memvcs.core.repository import Repository
+
+
+class TestCommandRegistry:
+    """Test that the lazy registry matches the command classes."""
+
+    @pytest.mark.parametrize("name", sorted(commands.COMMANDS))
+    def test_registry_matches_command_class(self, name):
+        cmd_class = commands.load_command(name)
+        assert cmd_class.name == name
+        assert cmd_class.help == commands.COMMANDS[name][1]
+
+    def test_find_command_skips_global_options(self):
+        assert cli._find_command(["--verbose", "log", "-n", "3"]) == "log"
+        assert cli._find_command(["status"]) == "status"
+        assert cli._find_command([]) is None
+        assert cli._find_command(["bogus", "log"]) is None
+
+    def test_find_command_top_level_help_builds_full_parser(self):
+        assert cli._find_command(["--help", "log"]) is None
+        assert cli._find_command(["-h"]) is None
+        assert cli._find_command(["log", "--help"]) == "log"
+
+    def test_package_attribute_loads_command_lazily(self):
+        from memvcs.commands import AddCommand, GcCommand
+
+        assert AddCommand.name == "add"
+        assert GcCommand.name == "gc"
+        with pytest.raises(AttributeError):
+            getattr(commands, "NoSuchCommand")
+
+
+class TestCreateParser:
+    """Test parser construction."""
+
+    def test_known_command_builds_only_its_subparser(self):
+        parser = cli.create_parser("log")
+        subparsers = parser._subparsers._group_actions[0]
+        assert list(subparsers.choices) == ["log"]
+        parsed = parser.parse_args(["log", "-n", "3"])
+        assert parsed.command == "log"
+
+    def test_no_command_registers_all_names(self):
+        parser = cli.create_parser()
+        subparsers = parser._subparsers._group_actions[0]
+        assert list(subparsers.choices) == list(commands.COMMANDS)
+
+
+class TestMain:
+    """Test main() dispatch."""
+
+    def test_no_command_prints_help(self, capsys):
+        assert cli.main([]) == 0
+        assert "Available commands" in capsys.readouterr().out
+
+    def test_dispatches_to_command(self, monkeypatch, capsys):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Repository.init(path=Path(tmpdir))
+            monkeypatch.chdir(tmpdir)
+            assert cli.main(["status"]) == 0
+            assert "main" in capsys.readouterr().out
+
+    def test_only_invoked_command_is_imported(self):
+        project_root = str(Path(__file__).resolve().parent.parent)
+        env = os.environ.copy()
+        env["PYTHONPATH"] = project_root + (os.pathsep + env.get("PYTHONPATH", ""))
+        script = (
+            "import sys, atexit\n"
+            "atexit.register(lambda: print(sorted(m for m in sys.modules "
+            "if m.startswith('memvcs.commands.'))))\n"
+            "from memvcs import cli\n"
+            "cli.main(['log', '--help'])\n"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            r = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=tmpdir,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=15,
+            )
+        loaded = r.stdout.strip().splitlines()[-1]
+        assert "memvcs.commands.log" in loaded
+        assert "memvcs.commands.add" not in loaded
+        assert "memvcs.commands.mcp" not in loaded
+        assert "memvcs.commands.daemon" not in loaded
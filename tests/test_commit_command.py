@@ -0,0 +1,134 @@
+"""Tests for agmem commit schema validation."""
+
+import pytest
+
+from memvcs.commands import commit as commit_module
+from memvcs.commands.commit import CommitCommand
+from memvcs.core.schema import SchemaValidator, ValidationCache
+
+VALID = (
+    "---\n"
+    'schema_version: "1.0"\n'
+    'last_updated: "2026-01-01T00:00:00Z"\n'
+    "source_agent_id: agent\n"
+    "confidence_score: 0.9\n"
+    "tags: [prefs]\n"
+    "---\n"
+    "User prefers dark mode.\n"
+)
+
+
+@pytest.fixture
+def repo(repo):
+    for i in range(6):
+        content = VALID if i % 2 == 0 else "no frontmatter\n"
+        (repo.current_dir / "semantic" / f"m{i}.md").write_text(content)
+    (repo.current_dir / "semantic" / "bin.md").write_bytes(b"\xff\xfe")
+    repo.stage_directory()
+    return repo
+
+
+class TestValidateStagedFiles:
+    """Test serial and pooled validation agree."""
+
+    def _summary(self, results):
+        return {path: (r.valid, [e.field for e in r.errors]) for path, r in results.items()}
+
+    def test_serial_validation(self, repo):
+        valid, results = CommitCommand._validate_staged_files(
+            repo, repo.staging.get_staged_files(), strict=False
+        )
+        assert not valid
+        assert "semantic/bin.md" not in results
+        assert results["semantic/m0.md"].valid
+        assert not results["semantic/m1.md"].valid
+
+    def test_process_pool_matches_serial(self, repo, monkeypatch):
+        staged = repo.staging.get_staged_files()
+        _, serial = CommitCommand._validate_staged_files(repo, staged, strict=True)
+
+        monkeypatch.setattr(commit_module, "VALIDATION_POOL_MIN_FILES", 1)
+        monkeypatch.setattr(commit_module, "VALIDATION_WORKERS", 2)
+        valid, pooled = CommitCommand._validate_staged_files(repo, staged, strict=True)
+
+        assert not valid
+        assert list(pooled) == list(serial)
+        assert self._summary(pooled) == self._summary(serial)
+
+
+class TestValidateBytes:
+    """Test byte-level validation that decodes only the frontmatter."""
+
+    def test_matches_text_validation(self):
+        for content in (VALID, "no frontmatter\n", "---\nschema_version: x\n---\n"):
+            text_result = SchemaValidator.validate(content, "semantic/a.md")
+            byte_result = SchemaValidator.validate_bytes(content.encode(), "semantic/a.md")
+            assert byte_result.valid == text_result.valid
+            assert byte_result.errors == text_result.errors
+
+    def test_body_is_not_decoded(self):
+        result = SchemaValidator.validate_bytes(VALID.encode() + b"\xff\xfe", "semantic/a.md")
+        assert result.valid
+
+    def test_binary_content_is_skipped(self):
+        assert SchemaValidator.validate_bytes(b"ab\x00cd", "semantic/a.md") is None
+        assert SchemaValidator.validate_bytes(b"\xff\xfe", "semantic/a.md") is None
+
+
+class TestValidationCache:
+    """Test that cleanly validated blobs are not validated again."""
+
+    def test_clean_blobs_skip_revalidation(self, repo, monkeypatch):
+        staged = repo.staging.get_staged_files()
+        _, first = CommitCommand._validate_staged_files(repo, staged, strict=False)
+
+        validated = []
+        original = commit_module._validate_content
+
+        def counting(job):
+            validated.append(job[0])
+            return original(job)
+
+        monkeypatch.setattr(commit_module, "_validate_content", counting)
+        _, second = CommitCommand._validate_staged_files(repo, staged, strict=False)
+
+        assert list(second) == list(first)
+        assert "semantic/m0.md" not in validated
+        assert "semantic/m1.md" in validated
+        assert second["semantic/m0.md"].valid
+
+    def test_cache_is_keyed_on_strictness_and_version(self, repo):
+        cache = ValidationCache(repo.mem_dir)
+        key = ValidationCache.key("ab" * 32, "semantic/a.md", strict=False)
+        assert key != ValidationCache.key("ab" * 32, "semantic/a.md", strict=True)
+        cache.record(key, SchemaValidator.validate(VALID, "semantic/a.md"))
+        cache.save()
+        assert ValidationCache(repo.mem_dir).is_clean(key)
+
+        cache.cache_file.write_text('{"version": "0.0.0", "clean": ["%s"]}' % key)
+        assert not ValidationCache(repo.mem_dir).is_clean(key)
+
+
+class TestContentForValidation:
+    """Test where validation reads staged content from."""
+
+    def test_reads_staging_copy_head(self, repo):
+        body = b"x" * (2 * commit_module.VALIDATION_READ_BYTES)
+        (repo.current_dir / "semantic" / "big.md").write_bytes(VALID.encode() + body)
+        blob_hash = repo.stage_file("semantic/big.md")
+
+        content = commit_module._content_for_validation(repo, "semantic/big.md", blob_hash)
+        assert len(content) == commit_module.VALIDATION_READ_BYTES
+        assert SchemaValidator.validate_bytes(content, "semantic/big.md").valid
+
+    def test_reads_whole_file_without_frontmatter(self, repo):
+        data = b"y" * (commit_module.VALIDATION_READ_BYTES + 10)
+        (repo.current_dir / "semantic" / "plain.md").write_bytes(data)
+        blob_hash = repo.stage_file("semantic/plain.md")
+        assert commit_module._content_for_validation(repo, "semantic/plain.md", blob_hash) == data
+
+    def test_falls_back_to_blob(self, repo):
+        blob_hash = repo.staging.get_blob_hash("semantic/m0.md")
+        (repo.mem_dir / "staging" / "semantic" / "m0.md").unlink()
+        content = commit_module._content_for_validation(repo, "semantic/m0.md", blob_hash)
+        assert content == VALID.encode()
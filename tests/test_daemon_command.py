@@ -0,0 +1,98 @@
+"""Tests for the agmem daemon command (auto-commit, event filtering, PID file)."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from memvcs.commands.daemon import DaemonCommand, _is_ignored_event_path, _pid_alive, _read_pid
+from memvcs.core.repository import Repository
+
+
+class TestEventFilter:
+    """Test which watched paths trigger an auto-commit."""
+
+    def test_hidden_components_are_ignored(self):
+        prefix = "/repo/current/"
+        assert _is_ignored_event_path("/repo/current/.mem/index.json", prefix)
+        assert _is_ignored_event_path("/repo/current/semantic/.prefs.md.swp", prefix)
+        assert _is_ignored_event_path("/repo/current/.cache/x.md", prefix)
+        assert not _is_ignored_event_path("/repo/current/semantic/prefs.md", prefix)
+
+    def test_hidden_parent_of_watched_dir_is_not_ignored(self):
+        prefix = "/home/u/.agents/current/"
+        assert not _is_ignored_event_path("/home/u/.agents/current/semantic/a.md", prefix)
+
+
+class TestAutoCommit:
+    """Test DaemonCommand._auto_commit."""
+
+    def test_commits_modified_and_untracked_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("a")
+            repo.stage_file("semantic/a.md")
+            repo.commit("C1")
+
+            (repo.current_dir / "semantic" / "a.md").write_text("a2")
+            (repo.current_dir / "episodic" / "b.md").write_text("b")
+            DaemonCommand._auto_commit(repo)
+
+            reloaded = Repository(Path(tmpdir))
+            assert reloaded.get_log(1)[0]["message"].startswith("auto: ")
+            status = reloaded.get_status()
+            assert status["modified"] == [] and status["untracked"] == []
+
+    def test_no_changes_makes_no_commit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("a")
+            repo.stage_file("semantic/a.md")
+            repo.commit("C1")
+
+            DaemonCommand._auto_commit(repo)
+            assert len(repo.get_log(10)) == 1
+
+    def test_walks_the_tree_once(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("a")
+            walks = []
+            real_walk = Repository._walk_working_files
+
+            def counting_walk(*args, **kwargs):
+                walks.append(1)
+                return real_walk(*args, **kwargs)
+
+            monkeypatch.setattr(Repository, "_walk_working_files", staticmethod(counting_walk))
+            DaemonCommand._auto_commit(repo)
+            assert len(walks) == 1
+            assert len(repo.get_log(10)) == 1
+
+
+class TestPidFile:
+    """Test PID file handling for status/stop."""
+
+    def test_read_pid(self, tmp_path):
+        pid_file = tmp_path / "daemon.pid"
+        assert _read_pid(pid_file) is None
+        pid_file.write_text("1234\n")
+        assert _read_pid(pid_file) == 1234
+        pid_file.write_text("garbage")
+        assert _read_pid(pid_file) is None
+
+    def test_pid_alive(self):
+        assert _pid_alive(os.getpid())
+        assert not _pid_alive(2**22 + 12345)
+
+    def test_status_removes_stale_pid_file(self, tmp_path, capsys):
+        pid_file = tmp_path / "daemon.pid"
+        pid_file.write_text(str(2**22 + 12345))
+        assert DaemonCommand._status(pid_file) == 0
+        assert "stale PID file" in capsys.readouterr().out
+        assert not pid_file.exists()
+
+    def test_status_reports_running(self, tmp_path, capsys):
+        pid_file = tmp_path / "daemon.pid"
+        pid_file.write_text(str(os.getpid()))
+        assert DaemonCommand._status(pid_file) == 0
+        assert f"running (PID: {os.getpid()})" in capsys.readouterr().out
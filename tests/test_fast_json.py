@@ -0,0 +1,32 @@
+"""Tests for the metadata JSON helpers."""
+
+import json
+
+import pytest
+
+from memvcs.core import fast_json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not fast_json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestFastJson:
+    """Both backends round-trip and agree with the stdlib."""
+
+    def test_round_trip(self, backend):
+        data = {"author": {"name": "Zoë"}, "remotes": {}, "n": [1, 2.5, None, True]}
+        assert fast_json.loads(fast_json.dumps(data)) == data
+        assert fast_json.loads(fast_json.dumps(data, indent=True).decode()) == data
+
+    def test_indent_matches_stdlib_layout(self, backend):
+        data = {"a": {"b": [1, 2]}}
+        assert fast_json.dumps(data, indent=True).decode() == json.dumps(data, indent=2)
+
+    def test_invalid_input_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            fast_json.loads(b"{not json")
@@ -0,0 +1,95 @@
+"""Tests for agmem fsck."""
+
+import pytest
+
+from memvcs.commands import fsck
+from memvcs.commands.fsck import FsckCommand
+
+
+@pytest.fixture
+def repo(repo):
+    for i in range(4):
+        (repo.current_dir / "semantic" / f"f{i}.md").write_text(f"fact {i}")
+    repo.stage_directory()
+    repo.commit("C1")
+    return repo
+
+
+class TestCheckObjects:
+    """Test loose object integrity checks."""
+
+    def test_intact_store(self, repo, capsys):
+        assert FsckCommand._check_objects(repo, False, True, False) == (0, 0)
+        assert "Object store is consistent" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("pool_min", [10_000, 1])
+    def test_reports_corrupted_objects(self, repo, capsys, monkeypatch, pool_min):
+        monkeypatch.setattr(fsck, "OBJECT_CHECK_POOL_MIN_OBJECTS", pool_min)
+        blob_hash = repo.object_store.list_objects("blob")[0]
+        repo.object_store._get_object_path(blob_hash, "blob").write_bytes(b"not zlib")
+
+        assert FsckCommand._check_objects(repo, False, True, False) == (1, 0)
+        out = capsys.readouterr().out
+        assert f"Corrupted blob: {blob_hash[:8]}..." in out
+        assert "Found 1 corrupted objects" in out
+
+    def test_object_is_intact_streams_large_and_rejects_truncated(self, tmp_path):
+        import os
+        import zlib
+
+        data = zlib.compress(os.urandom(100_000) + b"x" * 300_000)
+        good = tmp_path / "good"
+        good.write_bytes(data)
+        truncated = tmp_path / "truncated"
+        truncated.write_bytes(data[: len(data) // 2])
+
+        assert fsck._object_is_intact(str(good))
+        assert not fsck._object_is_intact(str(truncated))
+        assert not fsck._object_is_intact(str(tmp_path / "missing"))
+
+
+class TestCheckRefsAndCrypto:
+    """Test ref and signature checks over shared branch tips."""
+
+    def test_missing_branch_tip(self, repo, capsys):
+        missing = "ab" * 32
+        repo.refs.create_branch("ghost", missing)
+        branch_tips, existing = FsckCommand._branch_tips(repo)
+        assert branch_tips["ghost"] == missing
+        assert missing not in existing
+        assert branch_tips["main"] in existing
+
+        issues, _ = FsckCommand._check_refs(repo, False, True, False, branch_tips, existing)
+        assert issues == 1
+        assert "Branch 'ghost' points to missing commit" in capsys.readouterr().out
+        assert FsckCommand._check_crypto(repo, True, branch_tips, existing) >= 1
+        assert "ghost (abababab): commit not found" in capsys.readouterr().out
+
+
+class TestVerifiedObjectCache:
+    """Test skipping objects that verified cleanly and have not changed since."""
+
+    def test_unchanged_objects_are_not_decompressed_again(self, repo, monkeypatch):
+        assert FsckCommand._check_objects(repo, False, False, False) == (0, 0)
+        checked = []
+        real = fsck._object_is_intact
+        monkeypatch.setattr(fsck, "_object_is_intact", lambda p: checked.append(p) or real(p))
+
+        assert FsckCommand._check_objects(repo, False, False, False) == (0, 0)
+        assert checked == []
+
+        # A rewritten object changes stat data and is checked again
+        blob_hash = repo.object_store.list_objects("blob")[0]
+        repo.object_store._get_object_path(blob_hash, "blob").write_bytes(b"not zlib")
+        assert FsckCommand._check_objects(repo, False, False, False) == (1, 0)
+        assert len(checked) == 1
+
+        checked.clear()
+        assert FsckCommand._check_objects(repo, False, False, False, full=True) == (1, 0)
+        assert len(checked) > 1
+
+    def test_connectivity_only_skips_object_scan(self, repo, run_command, capsys):
+        blob_hash = repo.object_store.list_objects("blob")[0]
+        repo.object_store._get_object_path(blob_hash, "blob").write_bytes(b"not zlib")
+        run_command(FsckCommand, "--connectivity-only")
+        assert "Checking object store" not in capsys.readouterr().out
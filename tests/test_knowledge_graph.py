@@ -0,0 +1,153 @@
+"""Tests for the knowledge graph builder."""
+
+import json
+import math
+
+import pytest
+
+from memvcs.commands.graph import GraphCommand
+from memvcs.core import knowledge_graph
+from memvcs.core.knowledge_graph import KnowledgeGraphBuilder
+
+
+class FakeVectorStore:
+    """Embeds text as a normalized vector of a few letter counts."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_many(self, texts):
+        self.calls += 1
+        rows = []
+        for text in texts:
+            vec = [text.count(c) for c in "abc"]
+            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+            rows.append([x / norm for x in vec])
+        return rows
+
+
+@pytest.fixture
+def repo(repo):
+    (repo.current_dir / "semantic" / "a.md").write_text("aaaa")
+    (repo.current_dir / "semantic" / "a2.md").write_text("aaab")
+    (repo.current_dir / "semantic" / "c.md").write_text("cccc")
+    return repo
+
+
+class TestSimilarityEdges:
+    """Test similarity edges from batched embeddings."""
+
+    def test_one_batched_embedding_call(self, repo):
+        store = FakeVectorStore()
+        graph = KnowledgeGraphBuilder(repo, store).build_graph(similarity_threshold=0.9)
+        assert store.calls == 1
+
+        sim_edges = [e for e in graph.edges if e.edge_type == "similarity"]
+        assert [{e.source, e.target} for e in sim_edges] == [{"semantic/a.md", "semantic/a2.md"}]
+        assert sim_edges[0].weight == pytest.approx(3 / math.sqrt(10))
+
+    @pytest.mark.parametrize("block_rows", [2, 512])
+    def test_batched_pairs_match_pairwise(self, block_rows, monkeypatch):
+        monkeypatch.setattr(knowledge_graph, "SIMILARITY_BLOCK_ROWS", block_rows)
+        rows = [[1.0, 0.0], [0.6, 0.8], [0.0, 1.0], [1.0, 0.0]]
+        pairs = KnowledgeGraphBuilder._similarity_edges_batched(rows, 0.5)
+        expected = [
+            (i, j, sum(x * y for x, y in zip(rows[i], rows[j])))
+            for i in range(4)
+            for j in range(i + 1, 4)
+            if sum(x * y for x, y in zip(rows[i], rows[j])) >= 0.5
+        ]
+        assert [(i, j) for i, j, _ in pairs] == [(i, j) for i, j, _ in expected]
+        assert [s for _, _, s in pairs] == pytest.approx([s for _, _, s in expected])
+
+    def test_contradictions_are_dissimilar_same_topic_pairs(self, repo):
+        tagged = "---\ntags: [prefs]\n---\n"
+        (repo.current_dir / "semantic" / "t1.md").write_text(tagged + "aaaa")
+        (repo.current_dir / "semantic" / "t2.md").write_text(tagged + "cccc")
+        (repo.current_dir / "semantic" / "t3.md").write_text(tagged + "aaaa")
+        builder = KnowledgeGraphBuilder(repo, FakeVectorStore())
+        builder.build_graph()
+
+        found = builder.find_potential_contradictions()
+        assert {frozenset(pair[:2]) for pair in found} == {
+            frozenset({"semantic/t1.md", "semantic/t2.md"}),
+            frozenset({"semantic/t2.md", "semantic/t3.md"}),
+        }
+        assert all(sim == pytest.approx(1 / math.sqrt(17)) for _, _, sim in found)
+
+    def test_no_contradictions_without_similarity(self, repo):
+        builder = KnowledgeGraphBuilder(repo, FakeVectorStore())
+        builder.build_graph(include_similarity=False)
+        assert builder.find_potential_contradictions() == []
+
+
+class TestBuildSummary:
+    """Test the metadata-only summary build."""
+
+    def test_summary_matches_full_build(self, repo):
+        (repo.current_dir / "semantic" / "link.md").write_text("see [[a]]")
+        builder = KnowledgeGraphBuilder(repo)
+        summary = builder.build_summary()
+        full = builder.build_graph(include_similarity=False).metadata
+
+        assert sorted(summary.pop("isolated")) == ["semantic/a2.md", "semantic/c.md"]
+        assert summary == full
+        assert full["edge_types"]["reference"] == 1
+
+    def test_isolated_nodes_match_summary(self, repo, monkeypatch):
+        monkeypatch.setattr(knowledge_graph, "NETWORKX_AVAILABLE", False)
+        (repo.current_dir / "semantic" / "link.md").write_text("see [[a]]")
+        builder = KnowledgeGraphBuilder(repo)
+        builder.build_graph(include_similarity=False)
+
+        assert sorted(builder.find_isolated_nodes()) == ["semantic/a2.md", "semantic/c.md"]
+        assert sorted(builder.find_isolated_nodes()) == sorted(builder.build_summary()["isolated"])
+
+
+class TestGraphCommand:
+    """Test graph export."""
+
+    def test_d3_output_reuses_built_graph(self, repo, run_command, monkeypatch):
+        builds = []
+        real_build = KnowledgeGraphBuilder.build_graph
+
+        def counting_build(self, *args, **kwargs):
+            builds.append(1)
+            return real_build(self, *args, **kwargs)
+
+        monkeypatch.setattr(KnowledgeGraphBuilder, "build_graph", counting_build)
+        out = repo.root / "graph.json"
+        assert run_command(GraphCommand, "-o", str(out), "--format", "d3", "--no-similarity") == 0
+        assert len(builds) == 1
+        data = json.loads(out.read_bytes())
+        assert {n["id"] for n in data["nodes"]} == {
+            "semantic/a.md",
+            "semantic/a2.md",
+            "semantic/c.md",
+        }
+
+    def test_json_to_stdout_is_compact(self, repo, run_command, capsys):
+        assert run_command(GraphCommand, "--format", "json", "--no-similarity") == 0
+        out = capsys.readouterr().out
+        doc = out.split("\n", 1)[1]
+        assert doc.count("\n") == 1
+        assert json.loads(doc)["metadata"]["total_nodes"] == 3
+
+    def test_summary_without_similarity_skips_full_build(
+        self, repo, run_command, monkeypatch, capsys
+    ):
+        def fail(self, *args, **kwargs):
+            raise AssertionError("full graph built for a summary")
+
+        monkeypatch.setattr(KnowledgeGraphBuilder, "build_graph", fail)
+        assert run_command(GraphCommand, "--no-similarity") == 0
+        out = capsys.readouterr().out
+        assert "Total files: 3" in out
+        assert "Isolated files (no connections): 3" in out
+
+    def test_summary_isolated_count_ignores_similarity_flag(self, repo, run_command, capsys):
+        outputs = []
+        for argv in (["--no-similarity"], []):
+            assert run_command(GraphCommand, *argv) == 0
+            outputs.append(capsys.readouterr().out)
+        assert all("Isolated files (no connections): 3" in out for out in outputs)
@@ -0,0 +1,58 @@
+"""Tests for agmem log."""
+
+import pytest
+
+from memvcs.commands import log as log_module
+from memvcs.commands.log import LogCommand
+
+
+@pytest.fixture
+def repo(repo):
+    for i in range(3):
+        (repo.current_dir / "semantic" / f"f{i}.md").write_text(str(i))
+        repo.stage_file(f"semantic/f{i}.md")
+        repo.commit(f"C{i}")
+    return repo
+
+
+class TestLog:
+    """Test commit history output."""
+
+    def test_default_format(self, repo, run_command, capsys):
+        assert run_command(LogCommand) == 0
+        out = capsys.readouterr().out
+        assert out.count("commit ") == 3
+        assert out.count("HEAD -> main") == 1
+        assert out.index("HEAD -> main") < out.index("C1")
+        assert "    C2" in out
+
+    def test_oneline_does_not_format_dates(self, repo, run_command, capsys, monkeypatch):
+        def fail(ts):
+            raise AssertionError("date formatted in --oneline mode")
+
+        monkeypatch.setattr(log_module, "_format_timestamp", fail)
+        assert run_command(LogCommand, "--oneline") == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split(" ", 1)[1] for line in lines] == ["C2", "C1", "C0"]
+
+    def test_format_timestamp(self):
+        assert log_module._format_timestamp("2024-01-02T03:04:05Z") == "Tue Jan 02 03:04:05 2024"
+        assert log_module._format_timestamp("not a date") == "not a date"
+
+    def test_default_format_is_one_write(self, repo, run_command, capsys, monkeypatch):
+        writes = []
+        real_write = log_module.sys.stdout.write
+        monkeypatch.setattr(
+            log_module.sys.stdout, "write", lambda s: writes.append(s) or real_write(s)
+        )
+        assert run_command(LogCommand) == 0
+        assert len(writes) == 1
+        blocks = writes[0].split("\n\n\x1b[33mcommit ")
+        assert len(blocks) == 3
+        assert blocks[-1].endswith("    C0\n")
+
+    def test_graph_format(self, repo, run_command, capsys):
+        assert run_command(LogCommand, "--graph") == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [line[:2] for line in lines] == ["* ", "|", "| ", "|", "| "]
+        assert lines[-1].endswith(" C0")
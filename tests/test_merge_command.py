@@ -0,0 +1,56 @@
+"""Tests for agmem merge."""
+
+import argparse
+import json
+
+import pytest
+
+from memvcs.commands.merge import MergeCommand
+
+
+@pytest.fixture
+def repo(repo):
+    target = repo.current_dir / "procedural" / "steps.md"
+    target.write_text("base\n")
+    repo.stage_file("procedural/steps.md")
+    repo.commit("base")
+    repo.refs.create_branch("other")
+
+    target.write_text("ours\n")
+    repo.stage_file("procedural/steps.md")
+    repo.commit("ours")
+
+    repo.checkout("other")
+    target.write_text("theirs\n")
+    repo.stage_file("procedural/steps.md")
+    repo.commit("theirs")
+    repo.checkout("main")
+    return repo
+
+
+class TestMergeArguments:
+    """Test the merge command's argument surface."""
+
+    def test_parser_exposes_merge_options(self):
+        parser = argparse.ArgumentParser()
+        MergeCommand.add_arguments(parser)
+        args = parser.parse_args(["feature", "-m", "msg", "--no-commit", "--abort", "--yes"])
+        assert (args.branch, args.message, args.no_commit, args.abort, args.yes) == (
+            "feature",
+            "msg",
+            True,
+            True,
+            True,
+        )
+
+
+class TestMergeConflicts:
+    """Test conflict persistence for agmem resolve."""
+
+    def test_conflicts_are_persisted_as_json(self, repo, run_command, capsys):
+        assert run_command(MergeCommand, "other") == 1
+        assert "procedural/steps.md" in capsys.readouterr().out
+
+        conflicts = json.loads((repo.mem_dir / "merge" / "conflicts.json").read_bytes())
+        assert [c["path"] for c in conflicts] == ["procedural/steps.md"]
+        assert conflicts[0]["base_content"] == "base\n"
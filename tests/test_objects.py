@@ -4,7 +4,7 @@ import pytest
 import tempfile
 from pathlib import Path
 
-from memvcs.core.objects import ObjectStore, Blob, Tree, TreeEntry, Commit
+from memvcs.core.objects import ObjectStore, Blob, Tree, TreeEntry, Commit, hash_object
 
 
 class TestObjectStore:
@@ -21,6 +21,13 @@ class TestObjectStore:
             retrieved = store.retrieve(hash_id, "blob")
             assert retrieved == content
 
+    def test_hash_object_matches_stored_id(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir))
+            content = b"Hello, agmem!"
+            assert hash_object(content, "blob") == store.store(content, "blob")
+            assert hash_object(memoryview(content), "blob") == hash_object(content, "blob")
+
     def test_deduplication(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             store = ObjectStore(Path(tmpdir))
@@ -46,6 +53,46 @@ class TestObjectStore:
             assert store.exists(hash_id, "blob")
             assert not store.exists("invalid", "blob")
 
+    def test_exists_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir))
+            a = store.store(b"a", "commit")
+            b = store.store(b"b", "commit")
+            blob = store.store(b"c", "blob")
+            missing = "ab" * 32
+
+            present = store.exists_many([a, b, a, blob, missing, "invalid"], "commit")
+            assert present == {a, b}
+
+    def test_retrieve_is_cached_until_delete(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir))
+            hash_id = store.store(b"cached", "tree")
+            assert store.retrieve(hash_id, "tree") == b"cached"
+
+            # A cached object is served without touching disk
+            store._get_object_path(hash_id, "tree").write_bytes(b"corrupt")
+            assert store.retrieve(hash_id, "tree") == b"cached"
+
+            assert store.delete(hash_id, "tree")
+            assert store.retrieve(hash_id, "tree") is None
+
+    def test_blobs_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir))
+            hash_id = store.store(b"blob content", "blob")
+            store.retrieve(hash_id, "blob")
+            assert not store._cache
+
+    def test_cache_is_bounded(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir), cache_size=2)
+            hashes = [store.store(f"obj {i}".encode(), "commit") for i in range(3)]
+            for hash_id in hashes:
+                store.retrieve(hash_id, "commit")
+            assert len(store._cache) == 2
+            assert ("commit", hashes[0]) not in store._cache
+
 
 class TestBlob:
     """Test blob objects."""
@@ -82,6 +129,19 @@ class TestTree:
             assert len(loaded.entries) == 2
             assert loaded.entries[0].name == "file1.md"
 
+    def test_tree_index_maps_full_paths(self):
+        entries = [
+            TreeEntry(mode="100644", obj_type="blob", hash="abc123", name="top.md", path=""),
+            TreeEntry(
+                mode="100644", obj_type="blob", hash="def456", name="prefs.md", path="semantic"
+            ),
+        ]
+        tree = Tree(entries=entries)
+        index = tree.index()
+        assert index == {"top.md": "abc123", "semantic/prefs.md": "def456"}
+        assert tree.index() is index
+        assert tree == Tree(entries=list(entries))
+
 
 class TestCommit:
     """Test commit objects."""
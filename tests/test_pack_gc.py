@@ -8,13 +8,16 @@ from pathlib import Path
 from memvcs.core.objects import ObjectStore, Blob, Tree, TreeEntry, Commit
 from memvcs.core.refs import RefsManager
 from memvcs.core.pack import (
+    _scan_loose_objects,
     list_loose_objects,
     run_gc,
     reachable_from_refs,
     write_pack,
     retrieve_from_pack,
     run_repack,
+    sweep_unmarked,
 )
+from memvcs.core.repository import Repository
 
 
 class TestListLooseObjects:
@@ -37,6 +40,15 @@ class TestListLooseObjects:
             assert h1 in hashes
             assert h2 in hashes
 
+    def test_scan_records_type_and_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = ObjectStore(Path(tmpdir))
+            blob = store.store(b"a", "blob")
+            tree = store.store(b"t", "tree")
+            found = _scan_loose_objects(Path(tmpdir))
+            assert found[blob] == ("blob", str(Path(tmpdir) / "blob" / blob[:2] / blob[2:]))
+            assert found[tree][0] == "tree"
+
 
 class TestRunGc:
     """Test garbage collection."""
@@ -64,6 +76,48 @@ class TestRunGc:
             assert freed >= 0
 
 
+class TestLazySweep:
+    """Test deferring GC deletion to the next repack."""
+
+    def _repo_with_garbage(self, tmpdir):
+        repo = Repository.init(path=Path(tmpdir))
+        (repo.current_dir / "a.md").write_text("kept")
+        repo.stage_file("a.md")
+        repo.commit("C1")
+        dead = repo.object_store.store(b"unreachable", "blob")
+        return repo, dead
+
+    def test_lazy_gc_records_instead_of_deleting(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo, dead = self._repo_with_garbage(tmpdir)
+            deleted, freed = run_gc(repo.mem_dir, repo.object_store, lazy_sweep=True)
+            assert deleted == 1 and freed > 0
+            assert repo.object_store.exists(dead, "blob")
+            assert len(list((repo.mem_dir / "gc").iterdir())) == 1
+
+            packed, repack_freed = run_repack(repo.mem_dir, repo.object_store)
+            assert packed > 0
+            assert repack_freed >= freed
+            assert not repo.object_store.exists(dead, "blob")
+            assert list((repo.mem_dir / "gc").iterdir()) == []
+
+    def test_sweep_keeps_objects_reachable_again(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo, dead = self._repo_with_garbage(tmpdir)
+            run_gc(repo.mem_dir, repo.object_store, lazy_sweep=True)
+            assert sweep_unmarked(repo.mem_dir, repo.object_store, {dead}) == (0, 0)
+            assert repo.object_store.exists(dead, "blob")
+
+    def test_eager_gc_drops_pending_manifests(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo, dead = self._repo_with_garbage(tmpdir)
+            run_gc(repo.mem_dir, repo.object_store, lazy_sweep=True)
+            deleted, _ = run_gc(repo.mem_dir, repo.object_store)
+            assert deleted == 1
+            assert not repo.object_store.exists(dead, "blob")
+            assert list((repo.mem_dir / "gc").iterdir()) == []
+
+
 class TestWritePackAndRetrieve:
     """Test pack file creation and read-back."""
 
@@ -124,6 +124,34 @@ class TestCloneAndRemote:
                 assert (clone_path / ".mem").exists()
                 assert (clone_path / "current" / "episodic" / "x.md").exists()
 
+    def test_clone_tree_links_objects_and_copies_working_files(self):
+        from memvcs.commands.clone import _clone_tree
+
+        with tempfile.TemporaryDirectory() as src_dir:
+            repo = Repository.init(path=Path(src_dir))
+            (repo.current_dir / "episodic" / "x.md").write_text("x")
+            repo.stage_file("episodic/x.md")
+            repo.commit("Initial")
+            with tempfile.TemporaryDirectory() as dst_dir:
+                _clone_tree(repo.mem_dir, Path(dst_dir) / ".mem")
+                _clone_tree(repo.current_dir, Path(dst_dir) / "current", link_dir=None)
+
+                src_objects = sorted(
+                    p for p in (repo.mem_dir / "objects").rglob("*") if p.is_file()
+                )
+                assert src_objects
+                for src in src_objects:
+                    dst = Path(dst_dir) / ".mem" / src.relative_to(repo.mem_dir)
+                    assert dst.read_bytes() == src.read_bytes()
+                    assert dst.stat().st_ino == src.stat().st_ino
+                head = Path(dst_dir) / ".mem" / "HEAD"
+                assert head.stat().st_ino != (repo.mem_dir / "HEAD").stat().st_ino
+                copied = Path(dst_dir) / "current" / "episodic" / "x.md"
+                assert copied.read_text() == "x"
+                assert (
+                    copied.stat().st_ino != (repo.current_dir / "episodic" / "x.md").stat().st_ino
+                )
+
     def test_remote_add_show(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             repo = Repository.init(path=Path(tmpdir))
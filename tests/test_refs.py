@@ -0,0 +1,159 @@
+"""Tests for ref lookups and the stat-validated ref cache."""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from memvcs.commands.branch import BranchCommand
+from memvcs.core import refs as refs_module
+from memvcs.core.refs import RefCache, RefsManager
+from memvcs.core.repository import Repository
+
+
+def _backdate(*paths):
+    """Move mtimes out of the racy window so lookups may be cached."""
+    old = time.time() - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+def _refs(tmpdir):
+    refs = RefsManager(Path(tmpdir) / ".mem")
+    refs.init_head("main")
+    refs.create_branch("feature/x", "a" * 64)
+    _backdate(refs.head_file, refs.heads_dir, refs.heads_dir / "feature", refs.heads_dir / "main")
+    return refs
+
+
+class TestRefCache:
+    """Test stat-validated caching of HEAD and branch names."""
+
+    def test_branch_lookups_are_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = _refs(tmpdir)
+            assert refs.list_branches() == ["feature/x", "main"]
+            assert refs._cache.get("branches") == {"feature/x", "main"}
+            assert refs.get_current_branch() == "main"
+            assert refs._cache.get("HEAD") == {"type": "branch", "value": "main"}
+
+    def test_external_changes_invalidate_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = _refs(tmpdir)
+            refs.list_branches()
+            refs.get_head()
+
+            # Another process adds a branch and detaches HEAD
+            (refs.heads_dir / "feature" / "y").write_text("b" * 64 + "\n")
+            refs.head_file.write_text("c" * 64 + "\n")
+
+            assert refs.branch_exists("feature/y")
+            assert refs.get_head() == {"type": "commit", "value": "c" * 64}
+
+    def test_own_writes_invalidate_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = _refs(tmpdir)
+            refs.list_branches()
+            assert refs.delete_branch("feature/x")
+            assert refs.list_branches() == ["main"]
+            refs.set_head_branch("other")
+            assert refs.get_current_branch() == "other"
+
+    def test_recent_changes_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ref"
+            path.write_text("x")
+            cache = RefCache()
+            cache.put("ref", [str(path)], "x")
+            assert cache.get("ref") is None
+
+    def test_directory_is_not_a_branch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = _refs(tmpdir)
+            assert refs.branch_exists("feature/x")
+            assert not refs.branch_exists("feature")
+
+
+class TestClassify:
+    """Test single-pass ref classification."""
+
+    def test_kinds(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = _refs(tmpdir)
+            refs.set_branch_commit("main", "b" * 64)
+            refs.create_tag("v1", "c" * 64)
+
+            assert refs.classify("main") == ("branch", "b" * 64)
+            assert refs.classify("feature/x") == ("branch", "a" * 64)
+            assert refs.classify("v1") == ("tag", "c" * 64)
+            assert refs.classify("HEAD") == ("commit", "b" * 64)
+            assert refs.classify("abcd1234") == ("commit", "abcd1234")
+            assert refs.classify("no-such-ref") == ("unknown", None)
+            assert refs.resolve_ref("v1") == "c" * 64
+
+
+class TestBranchList:
+    """Test agmem branch listing output."""
+
+    def test_lists_branches_with_current_marked(self, capsys, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("a")
+            repo.stage_file("a.md")
+            repo.commit("C1")
+            repo.refs.create_branch("feature/x")
+            monkeypatch.chdir(tmpdir)
+
+            args = argparse.Namespace(list=True, name=None, delete=False, force=False)
+            assert BranchCommand.execute(args) == 0
+            assert capsys.readouterr().out == "  feature/x\n* main\n"
+
+
+class TestReflog:
+    """Test reading the newest reflog entries from the end of the file."""
+
+    def test_newest_entries_first_across_blocks(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = RefsManager(Path(tmpdir) / ".mem")
+            for i in range(50):
+                refs.append_reflog("HEAD", "0" * 64, f"{i:064x}", f"commit: message {i}")
+            monkeypatch.setattr(refs_module, "REFLOG_TAIL_BLOCK", 64)
+
+            entries = refs.get_reflog("HEAD", max_count=3)
+            assert [e["message"] for e in entries] == [
+                "commit: message 49",
+                "commit: message 48",
+                "commit: message 47",
+            ]
+            assert len(refs.get_reflog("HEAD", max_count=100)) == 50
+            assert refs.get_reflog("HEAD", max_count=100)[-1]["hash"] == f"{0:064x}"
+
+    def test_early_stop_closes_the_file(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            refs = RefsManager(Path(tmpdir) / ".mem")
+            for i in range(5):
+                refs.append_reflog("HEAD", "0" * 64, f"{i:064x}", f"commit: message {i}")
+            readers = []
+            real_iter = refs_module._iter_lines_reversed
+
+            def tracking_iter(*args):
+                readers.append(real_iter(*args))
+                return readers[-1]
+
+            monkeypatch.setattr(refs_module, "_iter_lines_reversed", tracking_iter)
+            assert len(refs.get_reflog("HEAD", max_count=1)) == 1
+            # A closed generator has no frame; its finally block has closed the fd
+            assert readers[0].gi_frame is None
+
+    def test_lines_reversed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "log"
+            path.write_bytes("a\nbé\r\n\nc\n".encode("utf-8"))
+            assert list(refs_module._iter_lines_reversed(path, block_size=2)) == [
+                "",
+                "c",
+                "",
+                "bé",
+                "a",
+            ]
@@ -0,0 +1,239 @@
+"""Tests for file:// remotes and agmem push/pull."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from memvcs.commands.pull import PullCommand
+from memvcs.commands.push import PushCommand
+from memvcs.core import remote as remote_module
+from memvcs.core.merge import MergeEngine
+from memvcs.core.objects import ObjectStore
+from memvcs.core.refs import RefsManager
+from memvcs.core.remote import Remote
+from memvcs.core.repository import Repository
+
+
+def _commit(repo, name, content):
+    (repo.current_dir / "semantic" / name).write_text(content)
+    repo.stage_file(f"semantic/{name}")
+    return repo.commit(f"add {name}")
+
+
+@pytest.fixture
+def origin_and_local():
+    """Origin with one commit on main, and an empty local repo whose remote "origin" is it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        origin = Repository.init(path=Path(tmpdir) / "origin")
+        main_tip = _commit(origin, "a.md", "a")
+
+        local = Repository.init(path=Path(tmpdir) / "local")
+        remote = Remote(local.root, "origin")
+        remote.set_remote_url(f"file://{origin.root}")
+        yield origin, local, remote, main_tip
+
+
+@pytest.fixture
+def repos(origin_and_local):
+    origin, local, remote, main_tip = origin_and_local
+    origin.refs.create_branch("feature")
+    origin.refs.create_tag("v1", main_tip)
+    origin.checkout("feature")
+    feature_tip = _commit(origin, "b.md", "b")
+    return origin, local, remote, main_tip, feature_tip
+
+
+@pytest.fixture
+def push_repos(origin_and_local, monkeypatch):
+    origin, local, remote, base = origin_and_local
+    remote.fetch()
+    local.refs.set_branch_commit("main", base)
+    monkeypatch.chdir(local.root)
+    return origin, local, base
+
+
+@pytest.fixture
+def pull_repos(origin_and_local, monkeypatch):
+    origin, local, _, _ = origin_and_local
+    origin.refs.create_branch("feature")
+    monkeypatch.chdir(local.root)
+    return origin, local
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = []
+    real_fetch = Remote.fetch
+
+    def counting_fetch(self, branch=None, depth=None):
+        calls.append(branch)
+        return real_fetch(self, branch=branch, depth=depth)
+
+    monkeypatch.setattr(Remote, "fetch", counting_fetch)
+    return calls
+
+
+class TestFetch:
+    """Test fetching objects and refs from a file remote."""
+
+    def test_fetch_all_refs(self, repos):
+        origin, local, remote, main_tip, feature_tip = repos
+        msg = remote.fetch()
+
+        store = ObjectStore(local.mem_dir / "objects")
+        assert store.exists(main_tip, "commit")
+        assert store.exists(feature_tip, "commit")
+        assert local.refs.get_remote_branch_commit("origin", "main") == main_tip
+        assert local.refs.get_remote_branch_commit("origin", "feature") == feature_tip
+        assert local.refs.get_tag_commit("v1") == main_tip
+        assert msg.startswith("Fetched ") and not msg.startswith("Fetched 0 ")
+
+        assert remote.fetch() == "Fetched 0 object(s) from origin"
+
+    def test_fetch_one_branch(self, repos):
+        origin, local, remote, main_tip, feature_tip = repos
+        remote.fetch(branch="main")
+
+        store = ObjectStore(local.mem_dir / "objects")
+        assert store.exists(main_tip, "commit")
+        assert not store.exists(feature_tip, "commit")
+
+    def test_fetch_with_depth(self, repos):
+        origin, local, remote, main_tip, feature_tip = repos
+        origin.checkout("main")
+        second = _commit(origin, "c.md", "c")
+        third = _commit(origin, "d.md", "d")
+        remote.fetch(branch="main", depth=2)
+
+        store = ObjectStore(local.mem_dir / "objects")
+        assert store.exists(third, "commit")
+        assert store.exists(second, "commit")
+        assert not store.exists(main_tip, "commit")
+        assert local.refs.get_remote_branch_commit("origin", "main") == third
+
+        with pytest.raises(ValueError):
+            remote.fetch(depth=0)
+
+    def test_failed_copy_leaves_refs_alone(self, repos, monkeypatch):
+        origin, local, remote, main_tip, feature_tip = repos
+        monkeypatch.setattr(remote_module, "_copy_object", lambda src, dst, h: False)
+        remote.fetch()
+
+        assert local.refs.get_remote_branch_commit("origin", "main") is None
+        assert local.refs.get_tag_commit("v1") is None
+
+
+class TestPush:
+    """Test pushing to a file remote."""
+
+    def test_push_reads_each_ref_once(self, repos, monkeypatch):
+        origin, local, remote, main_tip, feature_tip = repos
+        remote.fetch()
+        local.refs.set_branch_commit("main", main_tip)
+        tip = _commit(local, "e.md", "e")
+        local.refs.create_tag("v2", tip)
+
+        reads = []
+        real_read = RefsManager.get_branch_commit
+
+        def counting_read(self, name):
+            reads.append(name)
+            return real_read(self, name)
+
+        monkeypatch.setattr(RefsManager, "get_branch_commit", counting_read)
+        assert remote.push(branch="main").startswith("Pushed ")
+        assert reads == ["main"]
+        assert origin.refs.get_branch_commit("main") == tip
+        assert origin.refs.get_tag_commit("v2") == tip
+
+
+class TestPushAutoRebase:
+    """Test the fetch-then-check path of push."""
+
+    def test_ahead_of_remote_skips_ancestor_search(
+        self, push_repos, run_command, monkeypatch, capsys
+    ):
+        origin, local, base = push_repos
+        tip = _commit(local, "b.md", "b")
+
+        searches = []
+        real_search = MergeEngine.find_common_ancestor
+
+        def counting_search(self, commit1, commit2, ancestors1=None):
+            searches.append((commit1, commit2))
+            return real_search(self, commit1, commit2, ancestors1)
+
+        monkeypatch.setattr(MergeEngine, "find_common_ancestor", counting_search)
+        assert run_command(PushCommand) == 0
+        # Only Remote.push's own fast-forward check (remote tip, local tip) remains
+        assert searches == [(base, tip)]
+        assert origin.refs.get_branch_commit("main") == tip
+
+    def test_behind_remote_is_refused(self, push_repos, run_command, capsys):
+        origin, local, base = push_repos
+        _commit(origin, "c.md", "c")
+        assert run_command(PushCommand) == 1
+        assert "Local is behind remote" in capsys.readouterr().out
+
+
+class TestFirstParentAncestors:
+    """Test reusing a precomputed ancestor set."""
+
+    def test_precomputed_ancestors(self, push_repos):
+        origin, local, base = push_repos
+        tip = _commit(local, "b.md", "b")
+        engine = MergeEngine(local)
+        ancestors = engine.first_parent_ancestors(tip)
+        assert ancestors == {tip, base}
+        assert engine.find_common_ancestor(tip, base, ancestors) == base
+
+
+class TestPullRefListing:
+    """Test skipping fetch when remote refs are unchanged."""
+
+    def test_unchanged_remote_skips_fetch(self, pull_repos, fetches, run_command, capsys):
+        origin, local = pull_repos
+        assert run_command(PullCommand) == 0
+        assert fetches == [None]
+        assert local.refs.get_branch_commit("main") == origin.refs.get_branch_commit("main")
+
+        capsys.readouterr()
+        assert run_command(PullCommand) == 0
+        assert fetches == [None]
+        assert capsys.readouterr().out.strip() == "Already up to date."
+
+    def test_fetches_only_the_changed_branch(self, pull_repos, fetches, run_command):
+        origin, local = pull_repos
+        assert run_command(PullCommand) == 0
+        origin.checkout("feature")
+        tip = _commit(origin, "b.md", "b")
+
+        assert run_command(PullCommand) == 0
+        assert fetches == [None, "feature"]
+        assert local.refs.get_remote_branch_commit("origin", "feature") == tip
+
+    def test_plain_pull_deepens_a_shallow_pull(self, pull_repos, fetches, run_command):
+        origin, local = pull_repos
+        first = origin.refs.get_branch_commit("main")
+        _commit(origin, "b.md", "b")
+        _commit(origin, "c.md", "c")
+
+        assert run_command(PullCommand, "origin", "main", "--depth", "1") == 0
+        assert not local.object_store.exists(first, "commit")
+        assert (local.mem_dir / "shallow").exists()
+
+        assert run_command(PullCommand, "origin", "main") == 0
+        assert fetches == ["main", "main"]
+        assert local.object_store.exists(first, "commit")
+        assert not (local.mem_dir / "shallow").exists()
+
+    def test_missing_tip_object_refetches(self, pull_repos, fetches, run_command):
+        origin, local = pull_repos
+        tip = origin.refs.get_branch_commit("main")
+        assert run_command(PullCommand) == 0
+        (local.mem_dir / "objects" / "commit" / tip[:2] / tip[2:]).unlink()
+
+        assert run_command(PullCommand) == 0
+        assert fetches == [None, None]
+        assert local.object_store.exists(tip, "commit")
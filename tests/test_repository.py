@@ -1,5 +1,7 @@
 """Tests for repository operations."""
 
+import json
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -86,3 +88,139 @@ class TestRepository:
             assert log[0]["message"] == "Commit 2"
             assert log[1]["message"] == "Commit 1"
             assert log[2]["message"] == "Commit 0"
+
+    def test_stage_files_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("A")
+            (repo.current_dir / "semantic" / "b.md").write_text("B")
+
+            staged = repo.stage_files(["a.md", "semantic/b.md"])
+            assert set(staged) == {"a.md", "semantic/b.md"}
+            assert staged["a.md"] == repo.stage_file("a.md")
+
+            # Index is persisted once for the whole batch
+            reloaded = Repository(Path(tmpdir)).staging.get_staged_files()
+            assert set(reloaded) == {"a.md", "semantic/b.md"}
+
+    def test_stage_files_collects_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("A")
+
+            errors = {}
+            staged = repo.stage_files(["a.md", "missing.md", "../escape.md"], errors=errors)
+            assert list(staged) == ["a.md"]
+            assert isinstance(errors["missing.md"], FileNotFoundError)
+            assert isinstance(errors["../escape.md"], ValueError)
+
+            with pytest.raises(FileNotFoundError):
+                repo.stage_files(["missing.md"])
+
+    def test_stage_files_reuses_hash_for_unchanged_stat(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            target = repo.current_dir / "a.md"
+            target.write_text("original")
+            os.utime(target, (1_000_000_000, 1_000_000_000))
+            first = repo.stage_files(["a.md"])["a.md"]
+            repo.commit("C1")
+
+            # Same stat data: the cached hash is reused without re-reading the content
+            st = target.stat()
+            target.write_text("modified")
+            os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+            if target.stat().st_ino == st.st_ino:
+                assert repo.stage_file_maybe_cached("a.md") == first
+                # The staging copy comes from the stored blob, so it matches the hash
+                staged_copy = repo.mem_dir / "staging" / "a.md"
+                assert staged_copy.read_text() == "original"
+
+            # Changed stat data: the file is re-hashed
+            os.utime(target, (1_000_000_100, 1_000_000_100))
+            assert repo.stage_file_maybe_cached("a.md") != first
+
+    def test_stage_files_does_not_cache_recent_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            target = repo.current_dir / "a.md"
+            target.write_text("v1")
+            first = repo.stage_file_maybe_cached("a.md")
+            target.write_text("v2")
+            assert repo.stage_file_maybe_cached("a.md") != first
+
+    def test_get_status_modified_untracked_deleted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("A")
+            (repo.current_dir / "semantic" / "b.md").write_text("B")
+            repo.stage_files(["a.md", "semantic/b.md"])
+            repo.commit("C1")
+
+            (repo.current_dir / "a.md").write_text("A2")
+            (repo.current_dir / "semantic" / "b.md").unlink()
+            (repo.current_dir / "episodic" / "new.md").write_text("new")
+            objects_before = set(repo.object_store.list_objects("blob"))
+
+            status = repo.get_status()
+            assert status["modified"] == ["a.md"]
+            assert status["untracked"] == ["episodic/new.md"]
+            assert status["deleted"] == ["semantic/b.md"]
+            # Status only hashes; it does not write blobs
+            assert set(repo.object_store.list_objects("blob")) == objects_before
+
+            assert repo.get_status(include_untracked=False)["untracked"] == []
+            assert repo.get_status(include_modified=False)["modified"] == []
+
+    def test_is_dirty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("A")
+            repo.stage_files(["a.md"])
+            repo.commit("C1")
+            assert not repo.is_dirty(include_untracked=True)
+
+            (repo.current_dir / "episodic" / "new.md").write_text("new")
+            assert not repo.is_dirty()
+            assert repo.is_dirty(include_untracked=True)
+            (repo.current_dir / "episodic" / "new.md").unlink()
+
+            (repo.current_dir / "a.md").write_text("A2")
+            assert repo.is_dirty()
+            (repo.current_dir / "a.md").unlink()
+            assert repo.is_dirty()
+
+    def test_get_config_cache_tracks_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            config = repo.get_config()
+            os.utime(repo.config_file, (1_000_000_000, 1_000_000_000))
+            assert repo.get_config() == config
+            assert repo._config_cache is not None
+
+            # Callers get their own dict
+            repo.get_config()["author"]["name"] = "Mutated"
+            assert repo.get_config()["author"]["name"] != "Mutated"
+
+            # External writers are picked up through the stat key
+            config["decay"] = {"episodic_half_life_days": 7}
+            repo.config_file.write_text(json.dumps(config))
+            assert repo.get_config()["decay"] == {"episodic_half_life_days": 7}
+
+            config["author"]["name"] = "Bob"
+            repo.set_config(config)
+            assert repo.get_config()["author"]["name"] == "Bob"
+
+    def test_walk_working_files_prunes_hidden_dirs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("a")
+            (repo.current_dir / "semantic" / ".hidden.md").write_text("h")
+            (repo.current_dir / ".cache").mkdir()
+            (repo.current_dir / ".cache" / "x.md").write_text("x")
+
+            files = set(repo._walk_working_files(repo.current_dir))
+            assert files == {"semantic/a.md", "semantic/.hidden.md"}
+
+            staged = repo.stage_directory("semantic")
+            assert set(staged) == {"semantic/a.md", "semantic/.hidden.md"}
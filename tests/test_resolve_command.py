@@ -0,0 +1,61 @@
+"""Tests for agmem resolve."""
+
+import json
+
+import pytest
+
+from memvcs.commands.resolve import ResolveCommand
+
+
+@pytest.fixture
+def repo(repo):
+    merge_dir = repo.mem_dir / "merge"
+    merge_dir.mkdir(exist_ok=True)
+    conflicts = [
+        {
+            "path": f"semantic/f{i}.md",
+            "ours_content": f"ours {i}",
+            "theirs_content": f"theirs {i}",
+        }
+        for i in range(3)
+    ]
+    (merge_dir / "conflicts.json").write_text(json.dumps(conflicts, indent=2))
+    return repo
+
+
+def _conflicts(repo):
+    return json.loads((repo.mem_dir / "merge" / "conflicts.json").read_bytes())
+
+
+class TestResolve:
+    """Test resolving recorded merge conflicts."""
+
+    def test_resolve_one_path(self, repo, run_command, capsys):
+        assert run_command(ResolveCommand, "semantic/f1.md", "--theirs") == 0
+        assert (repo.current_dir / "semantic" / "f1.md").read_text() == "theirs 1"
+        assert [c["path"] for c in _conflicts(repo)] == ["semantic/f0.md", "semantic/f2.md"]
+
+    def test_resolve_all(self, repo, run_command, capsys):
+        assert run_command(ResolveCommand, "--ours") == 0
+        for i in range(3):
+            assert (repo.current_dir / "semantic" / f"f{i}.md").read_text() == f"ours {i}"
+        assert not (repo.mem_dir / "merge" / "conflicts.json").exists()
+
+    def test_listing_leaves_file_untouched(self, repo, run_command, capsys):
+        conflicts_file = repo.mem_dir / "merge" / "conflicts.json"
+        before = conflicts_file.read_bytes()
+        assert run_command(ResolveCommand) == 0
+        assert conflicts_file.read_bytes() == before
+        assert capsys.readouterr().out.count("Conflict: ") == 3
+
+    def test_unknown_path_resolves_nothing(self, repo, run_command, capsys):
+        assert run_command(ResolveCommand, "semantic/missing.md", "--ours") == 0
+        assert len(_conflicts(repo)) == 3
+        assert not (repo.current_dir / "semantic" / "missing.md").exists()
+
+    def test_resolve_keeps_order_of_remaining(self, repo, run_command, capsys):
+        assert run_command(ResolveCommand, "semantic/f0.md", "--both") == 0
+        assert (repo.current_dir / "semantic" / "f0.md").read_text() == (
+            "ours 0\n\n--- merged ---\n\ntheirs 0"
+        )
+        assert [c["path"] for c in _conflicts(repo)] == ["semantic/f1.md", "semantic/f2.md"]
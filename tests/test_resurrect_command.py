@@ -0,0 +1,74 @@
+"""Tests for agmem resurrect."""
+
+import os
+
+import pytest
+
+from memvcs.commands import resurrect as resurrect_module
+from memvcs.commands.resurrect import ResurrectCommand
+
+
+@pytest.fixture
+def repo(repo):
+    forgetting = repo.mem_dir / "forgetting"
+    (forgetting / "20240102").mkdir(parents=True)
+    (forgetting / "20240101").mkdir(parents=True)
+    (forgetting / "20240101" / "semantic_prefs.md").write_text("prefs")
+    (forgetting / "20240101" / "episodic_day.md").write_text("day")
+    (forgetting / "20240102" / "semantic_notes.md").write_text("notes")
+    (forgetting / "20240102" / "nested").mkdir()
+    return repo
+
+
+class TestResurrect:
+    """Test listing and restoring archived memories."""
+
+    def test_list_is_sorted_and_skips_dirs(self, repo, run_command, capsys):
+        assert run_command(ResurrectCommand, "--list") == 0
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert lines == [
+            "20240101:",
+            "  - episodic_day.md",
+            "  - semantic_prefs.md",
+            "20240102:",
+            "  - semantic_notes.md",
+        ]
+
+    def test_restore_path(self, repo, run_command, capsys):
+        assert run_command(ResurrectCommand, "semantic/prefs.md") == 0
+        assert (repo.current_dir / "semantic" / "prefs.md").read_text() == "prefs"
+        assert not (repo.current_dir / "semantic" / "notes.md").exists()
+
+    def test_restore_missing(self, repo, run_command, capsys):
+        assert run_command(ResurrectCommand, "semantic/nope.md") == 1
+
+    def test_restore_glob(self, repo, run_command, capsys):
+        assert run_command(ResurrectCommand, "semantic/*") == 0
+        assert (repo.current_dir / "semantic" / "prefs.md").exists()
+        assert (repo.current_dir / "semantic" / "notes.md").exists()
+        assert not (repo.current_dir / "episodic" / "day.md").exists()
+
+    def test_glob_matches_whole_name(self, repo, run_command, capsys):
+        assert run_command(ResurrectCommand, "prefs*") == 1
+
+
+class TestFastCopy:
+    """Test the kernel copy and its fallback."""
+
+    @pytest.mark.parametrize("kernel_copy", [True, False])
+    def test_copies_data_and_metadata(self, tmp_path, monkeypatch, kernel_copy):
+        if not kernel_copy:
+
+            def unsupported(*args):
+                raise OSError("copy_file_range unsupported")
+
+            monkeypatch.setattr(resurrect_module.os, "copy_file_range", unsupported, raising=False)
+        src = tmp_path / "src.md"
+        src.write_bytes(b"x" * 100_000)
+        os.utime(src, (1_000_000, 1_000_000))
+        dst = tmp_path / "dst.md"
+        dst.write_bytes(b"old content that is longer" * 10_000)
+
+        resurrect_module._fast_copy(str(src), str(dst))
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_000_000
@@ -7,6 +7,7 @@ from pathlib import Path
 from memvcs.core.repository import Repository
 from memvcs.core.access_index import AccessIndex
 from memvcs.retrieval import RecallEngine, RecallResult
+from memvcs.retrieval.pack import PackEngine
 from memvcs.retrieval.strategies import RecencyStrategy, ImportanceStrategy, _matches_exclude
 
 
@@ -132,3 +133,47 @@ class TestRecallEngine(unittest.TestCase):
             )
             engine.recall(context="", limit=10, strategy="recency", exclude=[])
             assert access.get_access_count(path="semantic/x.md") == 1
+
+    def test_hybrid_without_vectors_hits_cache_across_engines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("content")
+            first = RecallEngine(repo=repo, access_index=AccessIndex(repo.mem_dir))
+            expected = first.recall(context="task", strategy="hybrid")
+
+            (repo.current_dir / "semantic" / "b.md").write_text("new")
+            second = RecallEngine(repo=repo, access_index=AccessIndex(repo.mem_dir))
+            assert [r.path for r in second.recall(context="task", strategy="hybrid")] == [
+                r.path for r in expected
+            ]
+
+    def test_new_commit_invalidates_cached_recall(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "semantic" / "a.md").write_text("content")
+            repo.stage_file("semantic/a.md")
+            repo.commit("C1")
+            engine = RecallEngine(repo=repo, access_index=AccessIndex(repo.mem_dir))
+            assert [r.path for r in engine.recall(context="task", strategy="recency")] == [
+                "semantic/a.md"
+            ]
+
+            (repo.current_dir / "semantic" / "b.md").write_text("new")
+            repo.stage_file("semantic/b.md")
+            repo.commit("C2")
+            paths = {r.path for r in engine.recall(context="task", strategy="recency")}
+            assert paths == {"semantic/a.md", "semantic/b.md"}
+
+
+class TestPackEngine:
+    """Test token counting in PackEngine."""
+
+    def test_encoding_is_built_once_per_model(self):
+        from memvcs.retrieval import pack as pack_module
+
+        pack_module._encoding_for_model.cache_clear()
+        engine = PackEngine(recall_engine=None, model="no-such-model-xyz")
+        assert engine._count_tokens("a" * 40) == 10
+        engine._count_tokens("b" * 8)
+        info = pack_module._encoding_for_model.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
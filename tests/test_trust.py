@@ -4,7 +4,9 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from memvcs.core.repository import Repository
 from memvcs.core.trust import (
+    commit_trust_level,
     load_trust_store,
     get_trust_level,
     set_trust,
@@ -74,3 +76,39 @@ class TestTrustStore:
             set_trust(mem_dir, SAMPLE_PEM.decode("utf-8"), "conditional")
             level = get_trust_level(mem_dir, SAMPLE_PEM)
             assert level == "conditional"
+
+
+class TestCommitTrustLevel:
+    """Test the memoized signature trust lookup used by merge and pull."""
+
+    def _signed_commit(self, repo):
+        (repo.current_dir / "a.md").write_text("A")
+        repo.stage_file("a.md")
+        return repo.commit("C1", {"merkle_root": "ab" * 32, "signature": "cd" * 32})
+
+    def test_level_is_memoized_until_trust_store_changes(self, monkeypatch):
+        import memvcs.core.crypto_verify as crypto_verify
+
+        calls = []
+        monkeypatch.setattr(
+            crypto_verify, "verify_signature", lambda root, sig, pem: calls.append(pem) or True
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            commit_hash = self._signed_commit(repo)
+            assert commit_trust_level(repo, commit_hash) is None
+
+            set_trust(repo.mem_dir, SAMPLE_PEM, "untrusted")
+            assert commit_trust_level(repo, commit_hash) == "untrusted"
+            assert commit_trust_level(repo, commit_hash) == "untrusted"
+            assert len(calls) == 1
+
+            set_trust(repo.mem_dir, SAMPLE_PEM, "full")
+            assert commit_trust_level(repo, commit_hash) == "full"
+
+    def test_unsigned_commit_has_no_level(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Repository.init(path=Path(tmpdir))
+            (repo.current_dir / "a.md").write_text("A")
+            repo.stage_file("a.md")
+            assert commit_trust_level(repo, repo.commit("C1")) is None
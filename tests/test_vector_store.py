@@ -0,0 +1,104 @@
+"""Tests for VectorStore bookkeeping that does not need sqlite-vec or embeddings."""
+
+import sqlite3
+
+import pytest
+
+from memvcs.core import vector_store
+from memvcs.core.vector_store import VectorStore
+
+
+def _store_with_rows(tmp_path, n):
+    vs = VectorStore(tmp_path)
+    # Plain tables stand in for memory_meta and the vec0 table
+    vs._conn = sqlite3.connect(":memory:")
+    vs._conn.execute("CREATE TABLE memory_meta (path TEXT)")
+    vs._conn.execute("CREATE TABLE vec_memory (embedding BLOB)")
+    for i in range(n):
+        vs._conn.execute("INSERT INTO memory_meta (rowid, path) VALUES (?, ?)", (i + 1, f"{i}.md"))
+        vs._conn.execute("INSERT INTO vec_memory (rowid, embedding) VALUES (?, x'00')", (i + 1,))
+    vs._conn.commit()
+    return vs
+
+
+def _count(vs, table):
+    return vs._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestDeleteEntries:
+    def test_deletes_in_batches(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(vector_store, "DELETE_BATCH_SIZE", 3)
+        vs = _store_with_rows(tmp_path, 10)
+        assert vs.delete_entries(range(1, 8)) == 7
+        assert _count(vs, "memory_meta") == 3
+        assert _count(vs, "vec_memory") == 3
+
+    def test_empty_and_missing_rowids(self, tmp_path):
+        vs = _store_with_rows(tmp_path, 2)
+        assert vs.delete_entries([]) == 0
+        assert vs.delete_entries([2, 99]) == 1
+        assert _count(vs, "memory_meta") == 1
+
+
+class TestIterEntries:
+    def test_streams_rowid_and_path(self, tmp_path):
+        vs = _store_with_rows(tmp_path, 3)
+        assert list(vs.iter_entries()) == [(1, "0.md"), (2, "1.md"), (3, "2.md")]
+
+    def test_fsck_removes_dangling_entries(self, tmp_path):
+        from pathlib import Path
+
+        from memvcs.commands.fsck import FsckCommand
+        from memvcs.core.repository import Repository
+
+        repo = Repository.init(path=tmp_path / "repo")
+        (repo.current_dir / "0.md").write_text("kept")
+        vs = _store_with_rows(Path(repo.mem_dir), 3)
+        assert FsckCommand._check_vectors(repo, vs, False, False, True) == (2, 2)
+        assert list(vs.iter_entries()) == [(1, "0.md")]
+
+    def test_fsck_skips_tree_walk_when_store_fails(self, tmp_path, monkeypatch):
+        from memvcs.commands.fsck import FsckCommand
+        from memvcs.core.repository import Repository
+
+        def no_sqlite_vec():
+            raise ImportError("sqlite-vec not installed")
+            yield
+
+        def fail(*args):
+            raise AssertionError("working tree walked before the first row")
+
+        repo = Repository.init(path=tmp_path / "repo")
+        vs = VectorStore(repo.mem_dir)
+        monkeypatch.setattr(vs, "iter_entries", no_sqlite_vec)
+        monkeypatch.setattr(repo, "_walk_working_files", fail)
+        with pytest.raises(ImportError):
+            FsckCommand._check_vectors(repo, vs, False, False, True)
+
+
+class TestVectorStoreAvailable:
+    def test_probe_result_is_cached(self, tmp_path, monkeypatch):
+        probes = []
+        monkeypatch.setattr(vector_store, "_probe_sqlite_vec", lambda: probes.append(1) or False)
+        assert vector_store.vector_store_available(tmp_path) is False
+        assert vector_store.vector_store_available(tmp_path) is False
+        assert len(probes) == 1
+        assert (tmp_path / "features.json").exists()
+
+    def test_expired_or_corrupt_cache_probes_again(self, tmp_path, monkeypatch):
+        probes = []
+        monkeypatch.setattr(vector_store, "_probe_sqlite_vec", lambda: probes.append(1) or True)
+        (tmp_path / "features.json").write_text('{"vector_store": false, "ts": 0}')
+        assert vector_store.vector_store_available(tmp_path) is True
+        (tmp_path / "features.json").write_text("not json")
+        assert vector_store.vector_store_available(tmp_path) is True
+        assert len(probes) == 2
+
+    def test_forget_drops_cached_probe(self, tmp_path, monkeypatch):
+        probes = []
+        monkeypatch.setattr(vector_store, "_probe_sqlite_vec", lambda: probes.append(1) or True)
+        assert vector_store.vector_store_available(tmp_path) is True
+        vector_store.forget_vector_store_available(tmp_path)
+        assert not (tmp_path / "features.json").exists()
+        assert vector_store.vector_store_available(tmp_path) is True
+        assert len(probes) == 2
@@ -0,0 +1,20 @@
+"""Tests for shared worker pool sizing."""
+
+from memvcs.core import workers
+
+
+class TestWorkerCounts:
+    """Test I/O and CPU pool sizes."""
+
+    def test_io_workers_is_capped(self, monkeypatch):
+        monkeypatch.setattr(workers.os, "cpu_count", lambda: 128)
+        assert workers.io_workers() == workers.MAX_IO_WORKERS
+
+    def test_io_workers_scales_on_small_hosts(self, monkeypatch):
+        monkeypatch.setattr(workers.os, "cpu_count", lambda: 2)
+        assert workers.io_workers() == 8
+
+    def test_unknown_cpu_count(self, monkeypatch):
+        monkeypatch.setattr(workers.os, "cpu_count", lambda: None)
+        assert workers.io_workers() == 4
+        assert workers.cpu_workers() == 1